@@ -7,10 +7,12 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+from app.core.config import settings
 from app.core.database import Base
 from app.models import *
 
 config = context.config
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
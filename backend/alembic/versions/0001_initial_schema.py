@@ -0,0 +1,172 @@
+"""initial schema
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+Schéma tel que créé jusqu'ici par Base.metadata.create_all. Une base
+existante se rattache aux migrations avec `alembic stamp 0001_initial_schema`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_initial_schema'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+category_type = sa.Enum('REVENUE', 'BILL', 'EXPENSE', 'SAVINGS', name='categorytype')
+transaction_type = sa.Enum('REVENUE', 'BILL', 'EXPENSE', 'SAVINGS', 'TRANSFER', name='transactiontype')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('github_id', sa.String(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('budget_start_date', sa.Date(), nullable=True),
+        sa.Column('starts_before_month', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_github_id', 'users', ['github_id'], unique=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    op.create_table(
+        'categories',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('type', category_type, nullable=False),
+        sa.Column('is_credit', sa.Boolean(), nullable=True),
+        sa.Column('sort_order', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_categories_id', 'categories', ['id'])
+
+    op.create_table(
+        'accounts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('initial_balance', sa.Float(), nullable=True),
+        sa.Column('current_balance', sa.Float(), nullable=True),
+        sa.Column('is_savings_account', sa.Boolean(), nullable=True),
+        sa.Column('is_main_account', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_accounts_id', 'accounts', ['id'])
+
+    op.create_table(
+        'transactions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('is_processed', sa.Boolean(), nullable=True),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('type', transaction_type, nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=True),
+        sa.Column('account_from_id', sa.Integer(), nullable=False),
+        sa.Column('account_to_id', sa.Integer(), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+        sa.ForeignKeyConstraint(['account_from_id'], ['accounts.id']),
+        sa.ForeignKeyConstraint(['account_to_id'], ['accounts.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_transactions_id', 'transactions', ['id'])
+
+    op.create_table(
+        'budget_forecasts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('month_number', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('forecasted_amount', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_budget_forecasts_id', 'budget_forecasts', ['id'])
+
+    op.create_table(
+        'memo_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('month_number', sa.Integer(), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('is_paid', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_memo_items_id', 'memo_items', ['id'])
+
+    op.create_table(
+        'savings_allocations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_savings_allocations_id', 'savings_allocations', ['id'])
+
+    op.create_table(
+        'savings_goals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('target_amount', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_savings_goals_id', 'savings_goals', ['id'])
+
+    op.create_table(
+        'credit_details',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('borrowed_amount', sa.Float(), nullable=False),
+        sa.Column('interest_amount', sa.Float(), nullable=False),
+        sa.Column('duration_months', sa.Integer(), nullable=False),
+        sa.Column('interest_rate', sa.Float(), nullable=False),
+        sa.Column('monthly_payment', sa.Float(), nullable=False),
+        sa.Column('already_repaid', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_credit_details_id', 'credit_details', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_table('credit_details')
+    op.drop_table('savings_goals')
+    op.drop_table('savings_allocations')
+    op.drop_table('memo_items')
+    op.drop_table('budget_forecasts')
+    op.drop_table('transactions')
+    op.drop_table('accounts')
+    op.drop_table('categories')
+    op.drop_table('users')
+    transaction_type.drop(op.get_bind(), checkfirst=True)
+    category_type.drop(op.get_bind(), checkfirst=True)
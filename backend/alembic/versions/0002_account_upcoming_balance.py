@@ -0,0 +1,45 @@
+"""account upcoming balance ledger
+
+Revision ID: 0002_account_upcoming_balance
+Revises: 0001_initial_schema
+Create Date: 2026-10-18 09:10:00.000000
+
+Ajoute Account.upcoming_balance et initialise le registre des soldes
+(current_balance n'était jamais mis à jour après la création du compte).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_account_upcoming_balance'
+down_revision: Union[str, None] = '0001_initial_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('accounts', sa.Column('upcoming_balance', sa.Float(), nullable=True))
+    op.execute(
+        """
+        UPDATE accounts SET
+            current_balance = COALESCE(initial_balance, 0)
+                - COALESCE((SELECT SUM(t.amount) FROM transactions t
+                            WHERE t.user_id = accounts.user_id AND t.account_from_id = accounts.id
+                            AND t.is_processed = true), 0)
+                + COALESCE((SELECT SUM(t.amount) FROM transactions t
+                            WHERE t.user_id = accounts.user_id AND t.account_to_id = accounts.id
+                            AND t.is_processed = true), 0),
+            upcoming_balance = COALESCE(initial_balance, 0)
+                - COALESCE((SELECT SUM(t.amount) FROM transactions t
+                            WHERE t.user_id = accounts.user_id AND t.account_from_id = accounts.id), 0)
+                + COALESCE((SELECT SUM(t.amount) FROM transactions t
+                            WHERE t.user_id = accounts.user_id AND t.account_to_id = accounts.id), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('accounts', 'upcoming_balance')
@@ -0,0 +1,50 @@
+"""hot path indexes
+
+Revision ID: 0003_hot_path_indexes
+Revises: 0002_account_upcoming_balance
+Create Date: 2026-10-18 09:20:00.000000
+
+Index composites des requêtes de transactions (liste, budget par période,
+soldes par compte) et index sur toutes les clés user_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_hot_path_indexes'
+down_revision: Union[str, None] = '0002_account_upcoming_balance'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_ID_TABLES = [
+    'categories',
+    'accounts',
+    'budget_forecasts',
+    'memo_items',
+    'savings_allocations',
+    'savings_goals',
+    'credit_details',
+]
+
+
+def upgrade() -> None:
+    op.create_index('ix_transactions_user_id_date', 'transactions', ['user_id', sa.text('date DESC')])
+    op.create_index('ix_transactions_user_id_account_from_id', 'transactions', ['user_id', 'account_from_id'])
+    op.create_index('ix_transactions_user_id_account_to_id', 'transactions', ['user_id', 'account_to_id'])
+    op.create_index('ix_transactions_user_id_category_id_date', 'transactions', ['user_id', 'category_id', 'date'])
+
+    for table in USER_ID_TABLES:
+        op.create_index(f'ix_{table}_user_id', table, ['user_id'])
+
+
+def downgrade() -> None:
+    for table in USER_ID_TABLES:
+        op.drop_index(f'ix_{table}_user_id', table_name=table)
+
+    op.drop_index('ix_transactions_user_id_category_id_date', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_account_to_id', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_account_from_id', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_date', table_name='transactions')
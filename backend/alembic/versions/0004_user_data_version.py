@@ -0,0 +1,28 @@
+"""user data version
+
+Revision ID: 0004_user_data_version
+Revises: 0003_hot_path_indexes
+Create Date: 2026-10-18 09:30:00.000000
+
+Compteur de version des données par utilisateur, incrémenté à chaque
+écriture et utilisé comme ETag des routes de lecture.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_user_data_version'
+down_revision: Union[str, None] = '0003_hot_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'data_version')
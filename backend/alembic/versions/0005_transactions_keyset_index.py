@@ -0,0 +1,30 @@
+"""transactions keyset index
+
+Revision ID: 0005_transactions_keyset_index
+Revises: 0004_user_data_version
+Create Date: 2026-10-18 09:40:00.000000
+
+L'index (user_id, date DESC) devient (user_id, date DESC, id DESC) pour
+servir l'ordre stable et la pagination par curseur de GET /transactions/.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_transactions_keyset_index'
+down_revision: Union[str, None] = '0004_user_data_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_transactions_user_id_date_id', 'transactions', ['user_id', sa.text('date DESC'), sa.text('id DESC')])
+    op.drop_index('ix_transactions_user_id_date', table_name='transactions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_transactions_user_id_date', 'transactions', ['user_id', sa.text('date DESC')])
+    op.drop_index('ix_transactions_user_id_date_id', table_name='transactions')
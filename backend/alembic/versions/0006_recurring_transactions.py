@@ -0,0 +1,71 @@
+"""recurring transactions
+
+Revision ID: 0006_recurring_transactions
+Revises: 0005_transactions_keyset_index
+Create Date: 2026-10-18 09:50:00.000000
+
+Règles de transactions récurrentes et rattachement des occurrences générées
+(transactions.recurring_id, unique par date pour une génération idempotente).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_recurring_transactions'
+down_revision: Union[str, None] = '0005_transactions_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+recurrence_frequency = sa.Enum('MONTHLY', 'WEEKLY', 'PERIOD', name='recurrencefrequency')
+transaction_type = postgresql.ENUM('REVENUE', 'BILL', 'EXPENSE', 'SAVINGS', 'TRANSFER', name='transactiontype', create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'recurring_transactions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('type', transaction_type, nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=True),
+        sa.Column('account_from_id', sa.Integer(), nullable=False),
+        sa.Column('account_to_id', sa.Integer(), nullable=False),
+        sa.Column('frequency', recurrence_frequency, nullable=False),
+        sa.Column('repeat_every', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Integer(), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('generated_until', sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+        sa.ForeignKeyConstraint(['account_from_id'], ['accounts.id']),
+        sa.ForeignKeyConstraint(['account_to_id'], ['accounts.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_recurring_transactions_id', 'recurring_transactions', ['id'])
+    op.create_index('ix_recurring_transactions_user_id', 'recurring_transactions', ['user_id'])
+
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('recurring_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_transactions_recurring_id', 'recurring_transactions', ['recurring_id'], ['id'], ondelete='SET NULL'
+        )
+        batch_op.create_unique_constraint('uq_transactions_recurring_id_date', ['recurring_id', 'date'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_constraint('uq_transactions_recurring_id_date', type_='unique')
+        batch_op.drop_constraint('fk_transactions_recurring_id', type_='foreignkey')
+        batch_op.drop_column('recurring_id')
+
+    op.drop_index('ix_recurring_transactions_user_id', table_name='recurring_transactions')
+    op.drop_index('ix_recurring_transactions_id', table_name='recurring_transactions')
+    op.drop_table('recurring_transactions')
+    recurrence_frequency.drop(op.get_bind(), checkfirst=True)
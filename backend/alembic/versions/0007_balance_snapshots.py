@@ -0,0 +1,41 @@
+"""balance snapshots
+
+Revision ID: 0007_balance_snapshots
+Revises: 0006_recurring_transactions
+Create Date: 2026-10-18 10:00:00.000000
+
+Soldes de fin de mois par compte, pour l'historique des soldes. La table
+est remplie par `python -m app.services.balance_history backfill`, puis
+complétée au fil de l'eau.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_balance_snapshots'
+down_revision: Union[str, None] = '0006_recurring_transactions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'balance_snapshots',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('period_end', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('real_balance', sa.Float(), nullable=False),
+        sa.Column('upcoming_balance', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('account_id', 'period_end'),
+    )
+    op.create_index('ix_balance_snapshots_user_id_period_end', 'balance_snapshots', ['user_id', 'period_end'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_balance_snapshots_user_id_period_end', table_name='balance_snapshots')
+    op.drop_table('balance_snapshots')
@@ -0,0 +1,82 @@
+"""year-aware budget forecasts
+
+Revision ID: 0008_forecast_year
+Revises: 0007_balance_snapshots
+Create Date: 2026-10-18 10:10:00.000000
+
+Les prévisions sont désormais propres à une année (user, year, month_number,
+category_id unique). Une prévision existante valait pour ce mois de toutes les
+années : elle est recopiée pour chaque année où l'utilisateur a des
+transactions, ainsi que pour l'année en cours et la suivante. Les doublons
+(même mois et catégorie) sont réduits à la première ligne saisie.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_forecast_year'
+down_revision: Union[str, None] = '0007_balance_snapshots'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+budget_forecasts = sa.table(
+    'budget_forecasts',
+    sa.column('id', sa.Integer()),
+    sa.column('user_id', sa.Integer()),
+    sa.column('year', sa.Integer()),
+    sa.column('month_number', sa.Integer()),
+    sa.column('category_id', sa.Integer()),
+    sa.column('forecasted_amount', sa.Float()),
+)
+transactions = sa.table('transactions', sa.column('user_id', sa.Integer()), sa.column('date', sa.Date()))
+users = sa.table('users', sa.column('id', sa.Integer()))
+
+
+def keep_first_per_cell() -> None:
+    first_ids = sa.select(sa.func.min(budget_forecasts.c.id)).group_by(
+        budget_forecasts.c.user_id, budget_forecasts.c.month_number, budget_forecasts.c.category_id
+    )
+    op.execute(budget_forecasts.delete().where(budget_forecasts.c.id.notin_(first_ids)))
+
+
+def upgrade() -> None:
+    op.add_column('budget_forecasts', sa.Column('year', sa.Integer(), nullable=True))
+    keep_first_per_cell()
+    
+    current_year = date.today().year
+    years = sa.union(
+        sa.select(transactions.c.user_id, sa.extract('year', transactions.c.date).label('year')),
+        sa.select(users.c.id, sa.literal(current_year).label('year')),
+        sa.select(users.c.id, sa.literal(current_year + 1).label('year')),
+    ).subquery('years')
+    legacy = budget_forecasts.alias('legacy')
+    op.execute(
+        budget_forecasts.insert().from_select(
+            ['user_id', 'year', 'month_number', 'category_id', 'forecasted_amount'],
+            sa.select(
+                legacy.c.user_id,
+                sa.cast(years.c.year, sa.Integer()),
+                legacy.c.month_number,
+                legacy.c.category_id,
+                legacy.c.forecasted_amount,
+            ).select_from(legacy.join(years, years.c.user_id == legacy.c.user_id)).where(legacy.c.year.is_(None))
+        )
+    )
+    op.execute(budget_forecasts.delete().where(budget_forecasts.c.year.is_(None)))
+    
+    with op.batch_alter_table('budget_forecasts') as batch_op:
+        batch_op.alter_column('year', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_unique_constraint(
+            'uq_budget_forecasts_user_id_year_month_category', ['user_id', 'year', 'month_number', 'category_id']
+        )
+
+
+def downgrade() -> None:
+    keep_first_per_cell()
+    with op.batch_alter_table('budget_forecasts') as batch_op:
+        batch_op.drop_constraint('uq_budget_forecasts_user_id_year_month_category', type_='unique')
+        batch_op.drop_column('year')
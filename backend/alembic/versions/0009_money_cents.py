@@ -0,0 +1,56 @@
+"""money columns stored as integer cents
+
+Revision ID: 0009_money_cents
+Revises: 0008_forecast_year
+Create Date: 2026-10-18 10:20:00.000000
+
+Les montants passent de FLOAT à BIGINT en centimes (type Money côté modèles) :
+les sommes calculées en base deviennent exactes et les soldes tenus à jour
+par UPDATE relatif ne dérivent plus. Les valeurs existantes sont arrondies au
+centime. Le taux d'intérêt des crédits reste un FLOAT.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_money_cents'
+down_revision: Union[str, None] = '0008_forecast_year'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Colonnes de montant par table : (nom, nullable)
+MONEY_COLUMNS = {
+    'accounts': [('initial_balance', True), ('current_balance', True), ('upcoming_balance', True)],
+    'balance_snapshots': [('real_balance', False), ('upcoming_balance', False)],
+    'budget_forecasts': [('forecasted_amount', True)],
+    'credit_details': [
+        ('borrowed_amount', False), ('interest_amount', False), ('monthly_payment', False), ('already_repaid', True)
+    ],
+    'memo_items': [('amount', False)],
+    'recurring_transactions': [('amount', False)],
+    'savings_allocations': [('amount', False)],
+    'savings_goals': [('target_amount', False)],
+    'transactions': [('amount', False)],
+}
+
+
+def upgrade() -> None:
+    for table_name, columns in MONEY_COLUMNS.items():
+        # Conversion en centimes avant le changement de type (CAST simple, y compris en mode batch SQLite)
+        table = sa.table(table_name, *(sa.column(name, sa.Float()) for name, _ in columns))
+        op.execute(table.update().values({name: sa.func.round(table.c[name] * 100) for name, _ in columns}))
+        with op.batch_alter_table(table_name) as batch_op:
+            for name, nullable in columns:
+                batch_op.alter_column(name, existing_type=sa.Float(), type_=sa.BigInteger(), existing_nullable=nullable)
+
+
+def downgrade() -> None:
+    for table_name, columns in MONEY_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for name, nullable in columns:
+                batch_op.alter_column(name, existing_type=sa.BigInteger(), type_=sa.Float(), existing_nullable=nullable)
+        table = sa.table(table_name, *(sa.column(name, sa.Float()) for name, _ in columns))
+        op.execute(table.update().values({name: table.c[name] / 100 for name, _ in columns}))
@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from importlib import import_module
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional
+from .config import settings
+
+class CacheBackend:
+    """
+    Interface des caches de résultats. Les valeurs None ne sont pas mises en
+    cache (get retourne None en cas d'absence). Une implémentation partagée
+    (Redis ou équivalent) se branche via CACHE_BACKEND="module:Classe".
+    """
+    
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+    
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+    
+    def delete_prefix(self, prefix: str) -> int:
+        raise NotImplementedError
+    
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+class NullCache(CacheBackend):
+    """
+    Cache désactivé (CACHE_BACKEND="none")
+    """
+    
+    def get(self, key: str) -> Optional[Any]:
+        return None
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+    
+    def delete(self, key: str) -> None:
+        pass
+    
+    def delete_prefix(self, prefix: str) -> int:
+        return 0
+
+class InMemoryCache(CacheBackend):
+    """
+    Cache LRU en mémoire du processus, avec durée de vie par entrée.
+    Propre à chaque worker : l'invalidation n'atteint que le worker qui a
+    traité l'écriture, la durée de vie borne l'obsolescence sur les autres.
+    """
+    
+    def __init__(self, max_entries: int = 1024, default_ttl: Optional[float] = 300.0):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if value is None:
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = monotonic() + ttl if ttl else None
+        
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+    
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            return len(keys)
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+
+def _create_backend() -> CacheBackend:
+    backend = settings.CACHE_BACKEND
+    if backend == "none":
+        return NullCache()
+    if backend == "memory":
+        return InMemoryCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+    
+    # Backend externe : "package.module:Classe", construit sans argument
+    module_name, _, class_name = backend.partition(":")
+    return getattr(import_module(module_name), class_name)()
+
+_cache: Optional[CacheBackend] = None
+
+def get_cache() -> CacheBackend:
+    """Backend de cache configuré (créé au premier appel)"""
+    global _cache
+    if _cache is None:
+        _cache = _create_backend()
+    return _cache
+
+def configure_cache(backend: CacheBackend) -> None:
+    """Remplacement du backend de cache (tests, backend partagé)"""
+    global _cache
+    _cache = backend
\ No newline at end of file
@@ -1,16 +1,134 @@
-from sqlalchemy import create_engine
+from sqlalchemy import and_, create_engine, event, insert, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from time import perf_counter
 from .config import settings
+from .metrics import current_query_counter, pool_metrics
 
-engine = create_engine(settings.DATABASE_URL)
+def _engine_options(url: str) -> dict:
+    """
+    Options du pool : taille, débordement et attente ne valent que pour QueuePool
+    (SQLite en mémoire utilise un pool à connexion unique)
+    """
+    options = {"pool_recycle": settings.DB_POOL_RECYCLE, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    parsed = make_url(url)
+    if issubclass(parsed.get_dialect().get_pool_class(parsed), QueuePool):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT
+        )
+    return options
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+@event.listens_for(engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_metrics.record_connect()
+
+@event.listens_for(engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    if isinstance(engine.pool, QueuePool):
+        pool_metrics.record_checkout(engine.pool.checkedout(), engine.pool.size())
+
+@event.listens_for(engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    pool_metrics.record_checkin()
+
+@event.listens_for(engine, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    pool_metrics.record_invalidation()
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = current_query_counter.get()
+    if counter is not None:
+        counter.increment()
+
+def get_pool_status() -> dict:
+    """État courant du pool de connexions et compteurs cumulés"""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__, **pool_metrics.snapshot()}
+    return {
+        "size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool_metrics.snapshot()
+    }
+
+def _dialect_insert(db):
+    """
+    Fonction insert propre au dialecte (ON CONFLICT), None si non prise en charge
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert
+
+def insert_ignoring_conflicts(db, table, index_elements):
+    """
+    INSERT qui écarte les lignes en conflit sur index_elements (contrainte
+    unique ou clé primaire) ; INSERT simple pour les autres dialectes
+    """
+    dialect_insert = _dialect_insert(db)
+    if dialect_insert is None:
+        return insert(table)
+    return dialect_insert(table).on_conflict_do_nothing(index_elements=index_elements)
+
+def upsert(db, table, index_elements, update_columns, rows) -> None:
+    """
+    Écriture de rows : mise à jour de update_columns des lignes existantes
+    (même valeurs de index_elements), insertion des autres.
+    Un INSERT ... ON CONFLICT sur Postgres et SQLite ; ailleurs, UPDATE puis
+    INSERT des lignes absentes, ligne par ligne
+    """
+    if not rows:
+        return
+    dialect_insert = _dialect_insert(db)
+    if dialect_insert is not None:
+        statement = dialect_insert(table)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: statement.excluded[column] for column in update_columns}
+        ), rows)
+        return
+    
+    for row in rows:
+        matched = db.execute(
+            update(table).where(and_(*(table.c[column] == row[column] for column in index_elements))).values(
+                {column: row[column] for column in update_columns}
+            )
+        ).rowcount
+        if not matched:
+            db.execute(insert(table), [row])
+
+# Session synchrone : les routes qui en dépendent sont déclarées avec `def`
+# (et non `async def`) pour que FastAPI les exécute dans son pool de threads
+# sans bloquer la boucle d'événements
 def get_db():
     db = SessionLocal()
     try:
+        # Acquisition immédiate de la connexion pour mesurer l'attente sur le pool
+        started = perf_counter()
+        try:
+            db.connection()
+        except PoolTimeoutError:
+            pool_metrics.record_wait(perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record_wait(perf_counter() - started)
         yield db
     finally:
         db.close()
\ No newline at end of file
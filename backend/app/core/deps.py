@@ -1,22 +1,85 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.exc import ObjectDeletedError
+from hashlib import sha256
+from time import time
 from .database import get_db
-from .auth import verify_token
+from .auth import decode_token
+from .cache import InMemoryCache
+from .config import settings
 from ..models.user import User
 
 security = HTTPBearer()
 
+# Jetons vérifiés et profils utilisateurs, propres au worker : une session
+# active ne refait ni décodage JWT ni requête sur users à chaque appel
+auth_cache = InMemoryCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.AUTH_CACHE_TTL_SECONDS)
+
+# Colonnes d'identité (jamais modifiées) conservées dans le profil en cache ;
+# les autres colonnes (data_version, budget_start_date...) sont relues à
+# chaque requête par clé primaire, donc toujours à jour
+SNAPSHOT_COLUMNS = ("id", "github_id", "username", "email")
+
+def token_key(token: str) -> str:
+    return f"token:{sha256(token.encode()).hexdigest()}"
+
+def user_key(username: str) -> str:
+    return f"user:{username}"
+
+def verify_token_cached(token: str) -> str:
+    """
+    Nom d'utilisateur d'un jeton, vérifié au premier appel puis mis en cache
+    au plus jusqu'à l'expiration du jeton
+    """
+    key = token_key(token)
+    username = auth_cache.get(key)
+    if username is None:
+        payload = decode_token(token)
+        username = payload["sub"]
+        if settings.AUTH_CACHE_TTL_SECONDS > 0 and payload.get("exp") is not None:
+            ttl = min(settings.AUTH_CACHE_TTL_SECONDS, payload["exp"] - time())
+            if ttl > 0:
+                auth_cache.set(key, username, ttl)
+    return username
+
+def invalidate_user_snapshot(user: User) -> None:
+    """À appeler après une modification de l'utilisateur"""
+    auth_cache.delete(user_key(user.username))
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """Get current authenticated user"""
-    username = verify_token(credentials.credentials)
+    username = verify_token_cached(credentials.credentials)
+    
+    snapshot = auth_cache.get(user_key(username))
+    if snapshot is not None:
+        # Rattachement à la session sans requête ; les colonnes absentes du profil sont chargées au premier accès
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        user = db.merge(user, load=False)
+        try:
+            # Chargement immédiat des colonnes hors profil : un utilisateur
+            # supprimé depuis la mise en cache est refusé ici (401) plutôt
+            # qu'au premier accès dans la route (ObjectDeletedError, 500)
+            user.data_version
+        except ObjectDeletedError:
+            auth_cache.delete(user_key(username))
+            db.expunge(user)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        return user
+    
     user = db.query(User).filter(User.username == username).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
+    if settings.AUTH_CACHE_TTL_SECONDS > 0:
+        auth_cache.set(user_key(username), {column: getattr(user, column) for column in SNAPSHOT_COLUMNS})
     return user
\ No newline at end of file
@@ -0,0 +1,46 @@
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+from typing import Iterable, Optional
+from ..models.user import User
+
+def bump_data_version(db: Session, user_id: int) -> None:
+    """
+    Incrément du compteur de version des données de l'utilisateur,
+    à appeler dans la transaction de chaque écriture
+    """
+    db.query(User).filter(User.id == user_id).update(
+        {User.data_version: User.data_version + 1},
+        synchronize_session=False
+    )
+
+def bump_data_versions(db: Session, user_ids: Iterable[int]) -> None:
+    """
+    Incrément groupé pour les traitements par lot touchant plusieurs utilisateurs
+    """
+    user_ids = list(user_ids)
+    if user_ids:
+        db.query(User).filter(User.id.in_(user_ids)).update(
+            {User.data_version: User.data_version + 1},
+            synchronize_session=False
+        )
+
+def user_etag(user: User) -> str:
+    return f'W/"{user.id}-{user.data_version or 0}"'
+
+def check_not_modified(request: Request, response: Response, user: User) -> Optional[Response]:
+    """
+    Réponse 304 si If-None-Match correspond à la version courante des données,
+    sinon None après avoir ajouté l'ETag aux en-têtes de la réponse
+    """
+    etag = user_etag(user)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Comparaison faible : le préfixe W/ est ignoré
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=304, headers=headers)
+    
+    response.headers.update(headers)
+    return None
\ No newline at end of file
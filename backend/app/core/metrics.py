@@ -0,0 +1,89 @@
+from contextvars import ContextVar
+from threading import Lock
+from typing import Dict, Optional
+
+class PoolMetrics:
+    """
+    Compteurs d'utilisation du pool de connexions, alimentés par les
+    événements du pool et par get_db (temps d'attente d'une connexion)
+    """
+    
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.overflow_checkouts = 0
+            self.peak_checked_out = 0
+            self.wait_count = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+    
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+    
+    def record_checkout(self, checked_out: int, pool_size: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            if checked_out > pool_size:
+                self.overflow_checkouts += 1
+    
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+    
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+    
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+    
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "peak_checked_out": self.peak_checked_out,
+                "wait_count": self.wait_count,
+                "wait_total_seconds": self.wait_total,
+                "wait_max_seconds": self.wait_max,
+                "wait_avg_seconds": self.wait_total / self.wait_count if self.wait_count else 0.0
+            }
+
+pool_metrics = PoolMetrics()
+
+
+class QueryCounter:
+    """
+    Nombre de requêtes SQL émises pendant une requête HTTP
+    """
+    
+    def __init__(self):
+        self._lock = Lock()
+        self.count = 0
+    
+    def increment(self) -> None:
+        with self._lock:
+            self.count += 1
+
+# Compteur de la requête HTTP en cours, positionné par le middleware de main.py
+# (le contexte est propagé aux threads qui exécutent les routes synchrones)
+current_query_counter: ContextVar[Optional[QueryCounter]] = ContextVar("current_query_counter", default=None)
@@ -0,0 +1,58 @@
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Annotated
+from pydantic import AfterValidator
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+def to_cents(value) -> int:
+    """
+    Montant en euros -> centimes entiers, arrondi au centime le plus proche
+    (moitié vers le haut) sur l'écriture décimale du nombre : 1.005 donne 101,
+    là où round(1.005 * 100) donne 100 (1.005 vaut 1.00499... en binaire)
+    """
+    return int(Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+
+def check_cents(value: float) -> float:
+    """
+    Validation des montants saisis : nombre fini, au plus deux décimales
+    """
+    try:
+        exact = Decimal(str(value))
+        whole_cents = exact.is_finite() and exact == exact.quantize(CENT)
+    except InvalidOperation:
+        whole_cents = False
+    if not whole_cents:
+        raise ValueError("Amounts must be finite with at most 2 decimal places")
+    return value
+
+# Montant en euros des schémas d'entrée : les fractions de centime sont refusées
+# plutôt qu'arrondies silencieusement à l'écriture
+MoneyAmount = Annotated[float, AfterValidator(check_cents)]
+
+class Money(TypeDecorator):
+    """
+    Montant stocké en centimes entiers (BIGINT) et exposé en euros (float).
+    Les agrégations (SUM, soldes relatifs) sont exactes en base ; la conversion
+    n'a lieu qu'à l'écriture des paramètres et à la lecture des résultats,
+    y compris pour les expressions (SUM, COALESCE, négation) qui héritent du type
+    """
+    
+    impl = BigInteger
+    cache_ok = True
+    
+    @property
+    def python_type(self):
+        return float
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return to_cents(value)
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Entier, ou Decimal / float selon le dialecte pour un SUM : toujours un nombre entier de centimes
+        return round(value) / 100
\ No newline at end of file
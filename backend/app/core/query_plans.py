@@ -0,0 +1,122 @@
+from datetime import date
+from typing import List, Optional, Tuple
+import argparse
+import re
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from ..schemas.transaction import TransactionFilter
+
+def hot_path_queries(db: Session, user_id: int) -> List[Tuple[str, object, Tuple[str, ...]]]:
+    """
+    Requêtes fréquentes, construites par les fonctions de production, et index
+    acceptés pour chacune (le planificateur choisit parmi eux selon le dialecte)
+    """
+    from ..routers.transactions import encode_cursor, transaction_list_query
+    from ..services.balance_calculator import BalanceCalculator
+    from ..services.budget_calculator import BudgetCalculator
+    
+    start_date, end_date = date(2026, 1, 1), date(2026, 1, 31)
+    budget_calculator = BudgetCalculator(db)
+    
+    return [
+        (
+            "transactions list",
+            transaction_list_query(db, user_id, TransactionFilter()).limit(101),
+            ("ix_transactions_user_id_date_id",)
+        ),
+        (
+            "transactions list after cursor",
+            transaction_list_query(db, user_id, TransactionFilter(), encode_cursor(end_date, 1000)).limit(101),
+            ("ix_transactions_user_id_date_id",)
+        ),
+        (
+            "transactions list by account",
+            transaction_list_query(db, user_id, TransactionFilter(account_id=1)).limit(101),
+            # Parcours dans l'ordre de tri (SQLite) ou union des deux index de compte (Postgres)
+            ("ix_transactions_user_id_date_id", "ix_transactions_user_id_account_from_id", "ix_transactions_user_id_account_to_id")
+        ),
+        (
+            "transactions list by category",
+            transaction_list_query(db, user_id, TransactionFilter(category_id=1, date_from=start_date)).limit(101),
+            ("ix_transactions_user_id_category_id_date",)
+        ),
+        (
+            "budget period",
+            budget_calculator.real_query(user_id, start_date, end_date),
+            ("ix_transactions_user_id_date_id",)
+        ),
+        (
+            "budget range",
+            budget_calculator.real_by_period_query(user_id, [(start_date, end_date), (date(2026, 2, 1), date(2026, 2, 28))]),
+            ("ix_transactions_user_id_date_id",)
+        ),
+        (
+            "balances aggregate",
+            BalanceCalculator(db).aggregate_query(user_id),
+            ("ix_transactions_user_id_account_from_id", "ix_transactions_user_id_account_to_id", "ix_transactions_user_id_date_id")
+        ),
+    ]
+
+# Lecture complète de la table des transactions (SQLite, Postgres)
+FULL_SCAN = re.compile(r"\bSCAN transactions\b|Seq Scan on transactions")
+
+def check_plan(plan: str, accepted_indexes: Tuple[str, ...]) -> Optional[str]:
+    """
+    Motif d'échec d'un plan, None s'il est conforme : aucune lecture complète
+    de la table et au moins un index accepté, nommé exactement (ix_a ne valide pas ix_a_b)
+    """
+    if FULL_SCAN.search(plan):
+        return "full scan of transactions"
+    used = [name for name in accepted_indexes if re.search(rf"(?<!\w){re.escape(name)}(?!\w)", plan)]
+    if not used:
+        return "none of the accepted indexes is used"
+    return None
+
+def explain(connection: Connection, statement) -> str:
+    """
+    Plan d'exécution d'une requête, sous forme de texte
+    """
+    if hasattr(statement, "statement"):
+        statement = statement.statement  # Query ORM
+    compiled = statement.compile(dialect=connection.dialect)
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+    
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+        return "\n".join(str(row[-1]) for row in rows)
+    
+    # Sur une table peu remplie le planificateur préfère un parcours séquentiel :
+    # on le désactive pour vérifier que l'index est bien utilisable
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    rows = connection.exec_driver_sql(f"EXPLAIN {compiled}", params).all()
+    return "\n".join(row[0] for row in rows)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    python -m app.core.query_plans [--verbose]
+    """
+    from .database import engine
+    
+    parser = argparse.ArgumentParser(description="Vérification des plans d'exécution des requêtes fréquentes")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+    
+    failures = 0
+    with engine.connect() as connection:
+        db = Session(bind=connection)
+        for name, statement, accepted_indexes in hot_path_queries(db, user_id=1):
+            with connection.begin():
+                plan = explain(connection, statement)
+            failure = check_plan(plan, accepted_indexes)
+            failures += failure is not None
+            print(f"{'KO ' if failure else 'OK '} {name}" + (f" : {failure}" if failure else ""))
+            if args.verbose or failure:
+                print(plan)
+    
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
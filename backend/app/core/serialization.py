@@ -0,0 +1,55 @@
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+from functools import lru_cache
+from types import NoneType
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Type, get_args
+
+def projection(model, schema: Type[BaseModel]) -> List:
+    """
+    Colonnes du modèle nécessaires au schéma de réponse (dans l'ordre de ses champs)
+    """
+    return [getattr(model, field) for field in schema.model_fields]
+
+@lru_cache(maxsize=None)
+def non_nullable_fields(schema: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Champs du schéma qui n'acceptent pas None, avec leur valeur par défaut
+    (PydanticUndefined si le champ est obligatoire) ; calculé une fois par schéma
+    """
+    return tuple(
+        (name, field.default)
+        for name, field in schema.model_fields.items()
+        if field.annotation is not NoneType and NoneType not in get_args(field.annotation)
+    )
+
+def rows_to_dicts(schema: Type[BaseModel], rows: Iterable[Sequence]) -> List[Dict[str, Any]]:
+    """
+    Lignes issues de projection() converties en dictionnaires, sans hydratation
+    ORM ni validation Pydantic (les colonnes sont déjà typées par la base).
+    Un NULL (colonne nullable en base) dans un champ non optionnel prend la
+    valeur par défaut du schéma ; sans défaut, la ligne est validée par le
+    schéma, qui lève la même erreur que response_model
+    """
+    fields = list(schema.model_fields)
+    defaults = non_nullable_fields(schema)
+    items = []
+    for row in rows:
+        item = dict(zip(fields, row))
+        for name, default in defaults:
+            if item[name] is None:
+                if default is PydanticUndefined:
+                    item = schema.model_validate(item).model_dump()
+                    break
+                item[name] = default
+        items.append(item)
+    return items
+
+def json_response(content: Any, response: Response) -> ORJSONResponse:
+    """
+    Réponse encodée par orjson (dates, enums et flottants pris en charge nativement),
+    reprenant les en-têtes déjà posés sur la réponse injectée (ETag, X-Next-Cursor)
+    """
+    headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return ORJSONResponse(content, headers=headers)
\ No newline at end of file
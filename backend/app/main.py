@@ -1,14 +1,13 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
-from .core.database import engine, Base
-from .routers import auth, config, transactions, budget
+from .core.metrics import QueryCounter, current_query_counter
+from .routers import auth, config, transactions, budget, recurring, savings, credits, forecasts, memos, internal
 
 # Import all models to ensure they are registered with SQLAlchemy
-from .models import user, category, account, transaction, budget_forecast, memo_item, savings_allocation, savings_goal, credit_detail
+from .models import user, category, account, transaction, budget_forecast, memo_item, savings_allocation, savings_goal, credit_detail, recurring_transaction, balance_snapshot
 
-# Création des tables
-Base.metadata.create_all(bind=engine)
+# Le schéma est géré par les migrations Alembic (alembic upgrade head)
 
 app = FastAPI(
     title="Budget Planner API",
@@ -23,13 +22,34 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
+# Nombre de requêtes SQL par requête HTTP (en-tête X-Query-Count)
+@app.middleware("http")
+async def count_queries(request: Request, call_next):
+    counter = QueryCounter()
+    token = current_query_counter.set(counter)
+    try:
+        response = await call_next(request)
+    finally:
+        current_query_counter.reset(token)
+    response.headers["X-Query-Count"] = str(counter.count)
+    return response
+
 # Routers
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(config.router, prefix="/api/v1")
 app.include_router(transactions.router, prefix="/api/v1")
 app.include_router(budget.router, prefix="/api/v1")
+app.include_router(recurring.router, prefix="/api/v1")
+app.include_router(savings.router, prefix="/api/v1")
+app.include_router(credits.router, prefix="/api/v1")
+app.include_router(forecasts.router, prefix="/api/v1")
+app.include_router(memos.router, prefix="/api/v1")
+
+# Métriques internes (hors API publique)
+app.include_router(internal.router)
 
 @app.get("/")
 async def root():
@@ -7,6 +7,8 @@ from .memo_item import MemoItem
 from .savings_allocation import SavingsAllocation
 from .savings_goal import SavingsGoal
 from .credit_detail import CreditDetail
+from .recurring_transaction import RecurringTransaction
+from .balance_snapshot import BalanceSnapshot
 
 __all__ = [
     "User",
@@ -17,5 +19,7 @@ __all__ = [
     "MemoItem",
     "SavingsAllocation",
     "SavingsGoal",
-    "CreditDetail"
+    "CreditDetail",
+    "RecurringTransaction",
+    "BalanceSnapshot"
 ]
\ No newline at end of file
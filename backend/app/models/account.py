@@ -1,15 +1,17 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 from ..core.database import Base
+from ..core.money import Money
 
 class Account(Base):
     __tablename__ = "accounts"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
-    initial_balance = Column(Float, default=0.0)
-    current_balance = Column(Float, default=0.0)
+    initial_balance = Column(Money, default=0.0)
+    current_balance = Column(Money, default=0.0)  # Solde RÉEL tenu à jour par BalanceLedger
+    upcoming_balance = Column(Money, default=0.0)  # Solde À VENIR tenu à jour par BalanceLedger
     is_savings_account = Column(Boolean, default=False)
     is_main_account = Column(Boolean, default=False)
     
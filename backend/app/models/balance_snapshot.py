@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey, Index
+from ..core.database import Base
+from ..core.money import Money
+
+class BalanceSnapshot(Base):
+    """
+    Soldes d'un compte en fin de mois (transactions datées jusqu'à period_end incluse)
+    """
+    __tablename__ = "balance_snapshots"
+    
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True)
+    period_end = Column(Date, primary_key=True)  # Dernier jour du mois
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    real_balance = Column(Money, nullable=False)  # Transactions pointées
+    upcoming_balance = Column(Money, nullable=False)  # Toutes les transactions
+    
+    __table_args__ = (
+        Index("ix_balance_snapshots_user_id_period_end", user_id, period_end),
+    )
\ No newline at end of file
@@ -1,16 +1,23 @@
-from sqlalchemy import Column, Integer, Float, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from ..core.database import Base
+from ..core.money import Money
 
 class BudgetForecast(Base):
     __tablename__ = "budget_forecasts"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    year = Column(Integer, nullable=False)
     month_number = Column(Integer, nullable=False)  # 1-12
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
-    forecasted_amount = Column(Float, default=0.0)
+    forecasted_amount = Column(Money, default=0.0)
     
     # Relations
     user = relationship("User", back_populates="budget_forecasts")
-    category = relationship("Category", back_populates="budget_forecasts")
\ No newline at end of file
+    category = relationship("Category", back_populates="budget_forecasts")
+    
+    __table_args__ = (
+        # Une prévision par cellule (année, mois, catégorie) ; sert aussi d'index de lecture
+        UniqueConstraint("user_id", "year", "month_number", "category_id", name="uq_budget_forecasts_user_id_year_month_category"),
+    )
\ No newline at end of file
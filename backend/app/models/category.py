@@ -13,7 +13,7 @@ class Category(Base):
     __tablename__ = "categories"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     type = Column(Enum(CategoryType), nullable=False)
     is_credit = Column(Boolean, default=False)  # Pour les factures
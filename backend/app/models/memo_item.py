@@ -1,15 +1,16 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 from ..core.database import Base
+from ..core.money import Money
 
 class MemoItem(Base):
     __tablename__ = "memo_items"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     month_number = Column(Integer, nullable=False)  # 1-12
     description = Column(String, nullable=False)
-    amount = Column(Float, nullable=False)
+    amount = Column(Money, nullable=False)
     is_paid = Column(Boolean, default=False)
     
     # Relations
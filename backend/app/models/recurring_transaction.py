@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, Enum
+from sqlalchemy.orm import relationship
+from enum import Enum as PyEnum
+from ..core.database import Base
+from ..core.money import Money
+from .transaction import TransactionType
+
+class RecurrenceFrequency(PyEnum):
+    MONTHLY = "mensuelle"
+    WEEKLY = "hebdomadaire"
+    PERIOD = "période"  # Jour de la période budgétaire (alignée sur budget_start_date)
+
+class RecurringTransaction(Base):
+    __tablename__ = "recurring_transactions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    description = Column(String, nullable=False)
+    amount = Column(Money, nullable=False)  # Toujours positif
+    type = Column(Enum(TransactionType), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
+    account_from_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    account_to_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    frequency = Column(Enum(RecurrenceFrequency), nullable=False)
+    repeat_every = Column(Integer, nullable=False, default=1)  # Toutes les N semaines / N mois / N périodes
+    day = Column(Integer, nullable=False, default=1)  # Jour du mois (1-31), de la semaine (0 = lundi) ou de la période (1 = premier jour)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    generated_until = Column(Date, nullable=True)  # Occurrences créées jusqu'à cette date incluse
+    
+    # Relations
+    user = relationship("User", back_populates="recurring_transactions")
+    transactions = relationship("Transaction", back_populates="recurring")
\ No newline at end of file
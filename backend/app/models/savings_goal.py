@@ -1,14 +1,15 @@
-from sqlalchemy import Column, Integer, Float, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey
 from sqlalchemy.orm import relationship
 from ..core.database import Base
+from ..core.money import Money
 
 class SavingsGoal(Base):
     __tablename__ = "savings_goals"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
-    target_amount = Column(Float, nullable=False)
+    target_amount = Column(Money, nullable=False)
     
     # Relations
     user = relationship("User", back_populates="savings_goals")
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, Date, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from enum import Enum as PyEnum
 from ..core.database import Base
+from ..core.money import Money
 
 class TransactionType(PyEnum):
     REVENUE = "revenus"
@@ -17,15 +18,27 @@ class Transaction(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_processed = Column(Boolean, default=False)  # VRAI/FAUX (système de pointage)
     date = Column(Date, nullable=False)
-    amount = Column(Float, nullable=False)  # Toujours positif
+    amount = Column(Money, nullable=False)  # Toujours positif
     type = Column(Enum(TransactionType), nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)  # Optionnel pour transferts
     account_from_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
     account_to_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
     description = Column(String, nullable=False)
+    recurring_id = Column(Integer, ForeignKey("recurring_transactions.id", ondelete="SET NULL"), nullable=True)  # Occurrence d'une transaction récurrente
+    
+    # Index des requêtes fréquentes (liste, budget par période, soldes par compte)
+    __table_args__ = (
+        Index("ix_transactions_user_id_date_id", user_id, date.desc(), id.desc()),
+        Index("ix_transactions_user_id_account_from_id", user_id, account_from_id),
+        Index("ix_transactions_user_id_account_to_id", user_id, account_to_id),
+        Index("ix_transactions_user_id_category_id_date", user_id, category_id, date),
+        # Une occurrence par règle et par date : la génération est idempotente
+        UniqueConstraint("recurring_id", "date", name="uq_transactions_recurring_id_date"),
+    )
     
     # Relations
     user = relationship("User", back_populates="transactions")
     category = relationship("Category", back_populates="transactions")
     account_from = relationship("Account", foreign_keys=[account_from_id], back_populates="transactions_from")
-    account_to = relationship("Account", foreign_keys=[account_to_id], back_populates="transactions_to")
\ No newline at end of file
+    account_to = relationship("Account", foreign_keys=[account_to_id], back_populates="transactions_to")
+    recurring = relationship("RecurringTransaction", back_populates="transactions")
\ No newline at end of file
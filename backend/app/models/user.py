@@ -12,6 +12,7 @@ class User(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     budget_start_date = Column(Date, nullable=True)
     starts_before_month = Column(Boolean, default=False)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")  # Incrémenté à chaque écriture (ETag)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -23,4 +24,5 @@ class User(Base):
     memo_items = relationship("MemoItem", back_populates="user", cascade="all, delete-orphan")
     savings_allocations = relationship("SavingsAllocation", back_populates="user", cascade="all, delete-orphan")
     savings_goals = relationship("SavingsGoal", back_populates="user", cascade="all, delete-orphan")
-    credit_details = relationship("CreditDetail", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
+    credit_details = relationship("CreditDetail", back_populates="user", cascade="all, delete-orphan")
+    recurring_transactions = relationship("RecurringTransaction", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
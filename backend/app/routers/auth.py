@@ -25,11 +25,13 @@ async def github_auth():
     return RedirectResponse(url=github_auth_url)
 
 @router.get("/callback")
-async def github_callback(code: str, db: Session = Depends(get_db)):
+def github_callback(code: str, db: Session = Depends(get_db)):
     """Handle GitHub OAuth callback"""
     # Exchange code for access token
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
+    # Route synchrone : FastAPI l'exécute dans le pool de threads, les appels
+    # HTTP et la session SQLAlchemy ne bloquent donc pas la boucle d'événements
+    with httpx.Client() as client:
+        token_response = client.post(
             "https://github.com/login/oauth/access_token",
             data={
                 "client_id": settings.GITHUB_CLIENT_ID,
@@ -46,7 +48,7 @@ async def github_callback(code: str, db: Session = Depends(get_db)):
             raise HTTPException(status_code=400, detail="Failed to get access token")
         
         # Get user info from GitHub
-        user_response = await client.get(
+        user_response = client.get(
             "https://api.github.com/user",
             headers={"Authorization": f"Bearer {access_token}"}
         )
@@ -81,6 +83,6 @@ async def github_callback(code: str, db: Session = Depends(get_db)):
         )
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(current_user: User = Depends(get_current_user)):
+def get_current_user(current_user: User = Depends(get_current_user)):
     """Get current user profile"""
     return current_user
\ No newline at end of file
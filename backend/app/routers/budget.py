@@ -1,19 +1,140 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from ..core.database import get_db
 from ..core.deps import get_current_user
+from ..core.etag import check_not_modified
+from ..models.category import CategoryType
 from ..models.user import User
 from ..services.budget_calculator import BudgetCalculator
 from ..services.balance_calculator import BalanceCalculator
+from ..services.balance_history import MAX_HISTORY_MONTHS, BalanceHistory
+from ..services.budget_cache import budget_cache
+from ..services.cash_flow import MAX_PROJECTION_MONTHS, CashFlowProjector
+from ..services.export import BUDGET_COLUMNS, MEDIA_TYPES, ReportExporter, stream_rows
+from ..services.savings import SavingsCalculator
 
 router = APIRouter(prefix="/budget", tags=["budget"])
 
+# Nombre maximal de périodes par requête /budget/range
+MAX_RANGE_PERIODS = 36
+
+def parse_period(value: str) -> Tuple[int, int]:
+    """Parse a YYYY-MM period into (month, year)"""
+    try:
+        year, month = (int(part) for part in value.split("-"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Period must be formatted as YYYY-MM")
+    
+    if month < 1 or month > 12:
+        raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
+    
+    if year < 2000 or year > 2100:
+        raise HTTPException(status_code=400, detail="Year must be between 2000 and 2100")
+    
+    return month, year
+
+def parse_range(period_from: str, period_to: str, max_periods: Optional[int] = MAX_RANGE_PERIODS) -> List[Tuple[int, int]]:
+    """(month, year) periods between two YYYY-MM bounds, inclusive"""
+    start_month, start_year = parse_period(period_from)
+    end_month, end_year = parse_period(period_to)
+    
+    first = start_year * 12 + start_month - 1
+    last = end_year * 12 + end_month - 1
+    if last < first:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    if max_periods is not None and last - first + 1 > max_periods:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {max_periods} periods")
+    
+    return [(index % 12 + 1, index // 12) for index in range(first, last + 1)]
+
+@router.get("/range")
+def get_budget_range(
+    request: Request,
+    response: Response,
+    period_from: str = Query(..., alias="from"),
+    period_to: str = Query(..., alias="to"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get budget data and summaries for every period between from and to (YYYY-MM)"""
+    periods = parse_range(period_from, period_to)
+    
+    not_modified = check_not_modified(request, response, current_user)
+    if not_modified:
+        return not_modified
+    
+    calculator = BudgetCalculator(db)
+    return {
+        "periods": budget_cache.budget_for_range(calculator, current_user, periods)
+    }
+
+@router.get("/export")
+def export_budget_report(
+    period_from: str = Query(..., alias="from"),
+    period_to: str = Query(..., alias="to"),
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Stream the budget report (one row per period and category) as CSV or NDJSON
+    
+    Unlike /range, the span is not limited: periods are computed in chunks.
+    """
+    periods = parse_range(period_from, period_to, max_periods=None)
+    exporter = ReportExporter(db, current_user.id)
+    
+    # La session de get_db reste ouverte jusqu'à la fin de l'envoi de la réponse
+    return StreamingResponse(
+        stream_rows(export_format, BUDGET_COLUMNS, exporter.budget_rows(periods)),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="budget_{period_from}_{period_to}.{export_format}"'}
+    )
+
+@router.get("/projection")
+def get_cash_flow_projection(
+    months: int = Query(6, ge=1, le=MAX_PROJECTION_MONTHS),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get projected day-by-day balances per account for the next months
+    
+    Starts from today's real balances, adds unprocessed transactions on their
+    date and spreads the unspent part of each forecast over its budget period.
+    """
+    return CashFlowProjector(db, budget_cache).project(current_user.id, months)
+
+@router.get("/history")
+def get_balance_history(
+    request: Request,
+    response: Response,
+    period_from: str = Query(..., alias="from"),
+    period_to: str = Query(..., alias="to"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get month-end balances per account for every month between from and to (YYYY-MM)
+    
+    Past months are read from the balance snapshots, the months after the last
+    snapshot add the transactions dated after it. Read-only: missing snapshots
+    are written by `python -m app.services.balance_history update`.
+    """
+    periods = parse_range(period_from, period_to, max_periods=MAX_HISTORY_MONTHS)
+    
+    not_modified = check_not_modified(request, response, current_user)
+    if not_modified:
+        return not_modified
+    
+    return BalanceHistory(db).series(current_user.id, periods)
+
 @router.get("/{month}/{year}")
-async def get_budget_period(
+def get_budget_period(
     month: int,
     year: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -24,9 +145,13 @@ async def get_budget_period(
     if year < 2000 or year > 2100:
         raise HTTPException(status_code=400, detail="Year must be between 2000 and 2100")
     
+    not_modified = check_not_modified(request, response, current_user)
+    if not_modified:
+        return not_modified
+    
     calculator = BudgetCalculator(db)
-    budget_data = calculator.calculate_budget_for_period(current_user.id, month, year)
-    summary = calculator.get_budget_summary(current_user.id, month, year)
+    budget_data = budget_cache.budget_for_period(calculator, current_user, month, year)
+    summary = calculator.summarize_budget(budget_data)
     
     return {
         "budget_data": budget_data,
@@ -34,14 +159,20 @@ async def get_budget_period(
     }
 
 @router.get("/balances/")
-async def get_balances(
+def get_balances(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get all account balances"""
+    not_modified = check_not_modified(request, response, current_user)
+    if not_modified:
+        return not_modified
+    
     calculator = BalanceCalculator(db)
-    balances = calculator.calculate_all_balances(current_user.id)
-    treasury = calculator.get_treasury_summary(current_user.id)
+    balances = budget_cache.balances(calculator, current_user)
+    treasury = calculator.summarize_treasury(balances)
     
     return {
         "balances": balances,
@@ -49,9 +180,11 @@ async def get_balances(
     }
 
 @router.get("/charts/{month}/{year}")
-async def get_chart_data(
+def get_chart_data(
     month: int,
     year: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -59,15 +192,22 @@ async def get_chart_data(
     if month < 1 or month > 12:
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
     
+    not_modified = check_not_modified(request, response, current_user)
+    if not_modified:
+        return not_modified
+    
     budget_calculator = BudgetCalculator(db)
     balance_calculator = BalanceCalculator(db)
     
     # Données budget
-    budget_data = budget_calculator.calculate_budget_for_period(current_user.id, month, year)
-    summary = budget_calculator.get_budget_summary(current_user.id, month, year)
+    budget_data = budget_cache.budget_for_period(budget_calculator, current_user, month, year)
+    summary = budget_calculator.summarize_budget(budget_data)
     
     # Données soldes
-    balances = balance_calculator.calculate_all_balances(current_user.id)
+    balances = budget_cache.balances(balance_calculator, current_user)
+    
+    # Avancement des objectifs d'épargne
+    savings_goals = budget_cache.savings_progress(SavingsCalculator(db), current_user)
     
     # Préparation des données pour les graphiques
     chart_data = {
@@ -80,14 +220,15 @@ async def get_chart_data(
             ]
         },
         "budget_repartition": {
-            "labels": list(summary.keys()),
-            "forecasted": [summary[key]["forecasted"] for key in summary.keys()],
-            "real": [summary[key]["real"] for key in summary.keys()]
+            "labels": [category_type.value for category_type in CategoryType],
+            "forecasted": [summary[category_type.value]["forecasted"] for category_type in CategoryType],
+            "real": [summary[category_type.value]["real"] for category_type in CategoryType]
         },
         "savings_progress": {
-            # À implémenter selon les objectifs d'épargne
-            "labels": [],
-            "data": []
+            "labels": [goal["category_name"] for goal in savings_goals],
+            "data": [goal["saved"] for goal in savings_goals],
+            "targets": [goal["target_amount"] for goal in savings_goals],
+            "progress_percent": [goal["progress_percent"] for goal in savings_goals]
         }
     }
     
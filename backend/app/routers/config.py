@@ -1,37 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 
 from ..core.database import get_db
-from ..core.deps import get_current_user
+from ..core.deps import get_current_user, invalidate_user_snapshot
+from ..core.etag import bump_data_version, check_not_modified
+from ..core.serialization import json_response, projection, rows_to_dicts
 from ..models.user import User
 from ..models.category import Category
 from ..models.account import Account
 from ..models.savings_allocation import SavingsAllocation
 from ..schemas.config import *
+from ..services.balance_history import BalanceHistory
+from ..services.balance_ledger import BalanceLedger
+from ..services.budget_cache import budget_cache
 
 router = APIRouter(prefix="/config", tags=["config"])
 
 @router.get("/", response_model=ConfigResponse)
-async def get_config(
+def get_config(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get complete user configuration"""
-    categories = db.query(Category).filter(Category.user_id == current_user.id).all()
-    accounts = db.query(Account).filter(Account.user_id == current_user.id).all()
-    allocations = db.query(SavingsAllocation).filter(SavingsAllocation.user_id == current_user.id).all()
+    not_modified = check_not_modified(request, response, current_user)
+    if not_modified:
+        return not_modified
     
-    return ConfigResponse(
-        budget_start_date=current_user.budget_start_date,
-        starts_before_month=current_user.starts_before_month,
-        categories=categories,
-        accounts=accounts,
-        savings_allocations=allocations
-    )
+    # Colonnes des schémas de réponse uniquement, sérialisées sans objets ORM
+    categories = db.query(*projection(Category, CategoryResponse)).filter(Category.user_id == current_user.id).all()
+    accounts = db.query(*projection(Account, AccountResponse)).filter(Account.user_id == current_user.id).all()
+    allocations = db.query(*projection(SavingsAllocation, SavingsAllocationResponse)).filter(
+        SavingsAllocation.user_id == current_user.id
+    ).all()
+    
+    return json_response({
+        "budget_start_date": current_user.budget_start_date,
+        "starts_before_month": bool(current_user.starts_before_month),
+        "categories": rows_to_dicts(CategoryResponse, categories),
+        "accounts": rows_to_dicts(AccountResponse, accounts),
+        "savings_allocations": rows_to_dicts(SavingsAllocationResponse, allocations)
+    }, response)
 
 @router.put("/start-date")
-async def update_start_date(
+def update_start_date(
     request: StartDateUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -39,11 +53,14 @@ async def update_start_date(
     """Update budget start date"""
     current_user.budget_start_date = request.budget_start_date
     current_user.starts_before_month = request.starts_before_month
+    bump_data_version(db, current_user.id)
     db.commit()
+    invalidate_user_snapshot(current_user)
+    budget_cache.invalidate_user(current_user.id)
     return {"message": "Start date updated"}
 
 @router.post("/categories", response_model=CategoryResponse)
-async def create_category(
+def create_category(
     category: CategoryCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -57,12 +74,14 @@ async def create_category(
         sort_order=category.sort_order
     )
     db.add(db_category)
+    bump_data_version(db, current_user.id)
     db.commit()
     db.refresh(db_category)
+    budget_cache.invalidate_user(current_user.id)
     return db_category
 
 @router.put("/categories/{category_id}", response_model=CategoryResponse)
-async def update_category(
+def update_category(
     category_id: int,
     category: CategoryUpdate,
     current_user: User = Depends(get_current_user),
@@ -84,12 +103,14 @@ async def update_category(
     if category.sort_order is not None:
         db_category.sort_order = category.sort_order
     
+    bump_data_version(db, current_user.id)
     db.commit()
     db.refresh(db_category)
+    budget_cache.invalidate_user(current_user.id)
     return db_category
 
 @router.delete("/categories/{category_id}")
-async def delete_category(
+def delete_category(
     category_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -104,11 +125,13 @@ async def delete_category(
         raise HTTPException(status_code=404, detail="Category not found")
     
     db.delete(db_category)
+    bump_data_version(db, current_user.id)
     db.commit()
+    budget_cache.invalidate_user(current_user.id)
     return {"message": "Category deleted"}
 
 @router.post("/accounts", response_model=AccountResponse)
-async def create_account(
+def create_account(
     account: AccountCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -119,16 +142,19 @@ async def create_account(
         name=account.name,
         initial_balance=account.initial_balance,
         current_balance=account.initial_balance,
+        upcoming_balance=account.initial_balance,
         is_savings_account=account.is_savings_account,
         is_main_account=account.is_main_account
     )
     db.add(db_account)
+    bump_data_version(db, current_user.id)
     db.commit()
     db.refresh(db_account)
+    budget_cache.invalidate_balances(current_user.id)
     return db_account
 
 @router.put("/accounts/{account_id}", response_model=AccountResponse)
-async def update_account(
+def update_account(
     account_id: int,
     account: AccountUpdate,
     current_user: User = Depends(get_current_user),
@@ -146,18 +172,23 @@ async def update_account(
     if account.name is not None:
         db_account.name = account.name
     if account.initial_balance is not None:
+        delta = account.initial_balance - db_account.initial_balance
+        BalanceLedger(db).shift_initial_balance(current_user.id, db_account.id, delta)
+        BalanceHistory(db).shift_initial_balance(current_user.id, db_account.id, delta)
         db_account.initial_balance = account.initial_balance
     if account.is_savings_account is not None:
         db_account.is_savings_account = account.is_savings_account
     if account.is_main_account is not None:
         db_account.is_main_account = account.is_main_account
     
+    bump_data_version(db, current_user.id)
     db.commit()
     db.refresh(db_account)
+    budget_cache.invalidate_balances(current_user.id)
     return db_account
 
 @router.delete("/accounts/{account_id}")
-async def delete_account(
+def delete_account(
     account_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -172,11 +203,13 @@ async def delete_account(
         raise HTTPException(status_code=404, detail="Account not found")
     
     db.delete(db_account)
+    bump_data_version(db, current_user.id)
     db.commit()
+    budget_cache.invalidate_balances(current_user.id)
     return {"message": "Account deleted"}
 
 @router.post("/savings-allocations")
-async def create_savings_allocation(
+def create_savings_allocation(
     allocation: SavingsAllocationCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -189,5 +222,6 @@ async def create_savings_allocation(
         account_id=allocation.account_id
     )
     db.add(db_allocation)
+    bump_data_version(db, current_user.id)
     db.commit()
     return {"message": "Savings allocation created"}
\ No newline at end of file
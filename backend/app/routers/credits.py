@@ -0,0 +1,124 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from ..core.database import get_db
+from ..core.deps import get_current_user
+from ..core.etag import bump_data_version
+from ..models.user import User
+from ..models.category import Category, CategoryType
+from ..models.credit_detail import CreditDetail
+from ..schemas.credit import *
+from ..services.credit_amortization import CreditAmortization, annuity_payment
+
+router = APIRouter(prefix="/credits", tags=["credits"])
+
+def complete_credit(credit: CreditDetail) -> None:
+    """Validate the loan terms and fill in the monthly payment and interest cost when needed"""
+    if credit.borrowed_amount <= 0:
+        raise HTTPException(status_code=400, detail="Borrowed amount must be positive")
+    if credit.duration_months <= 0:
+        raise HTTPException(status_code=400, detail="Duration must be at least one month")
+    if credit.interest_rate < 0:
+        raise HTTPException(status_code=400, detail="Interest rate must not be negative")
+    if (credit.already_repaid or 0) < 0:
+        raise HTTPException(status_code=400, detail="Already repaid must not be negative")
+    
+    if credit.monthly_payment is None:
+        credit.monthly_payment = annuity_payment(credit.borrowed_amount, credit.interest_rate, credit.duration_months)
+    if credit.monthly_payment <= 0:
+        raise HTTPException(status_code=400, detail="Monthly payment must be positive")
+    if credit.interest_amount is None:
+        credit.interest_amount = round(max(credit.monthly_payment * credit.duration_months - credit.borrowed_amount, 0.0), 2)
+
+def validate_credit_category(db: Session, user_id: int, category_id: int) -> None:
+    """Credits are attached to one of the user's credit bill categories"""
+    category = db.query(Category.type, Category.is_credit).filter(
+        Category.user_id == user_id,
+        Category.id == category_id
+    ).first()
+    if category is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if category.type != CategoryType.BILL or not category.is_credit:
+        raise HTTPException(status_code=400, detail="Credits require a bill category marked as credit")
+
+def get_user_credit(db: Session, user_id: int, credit_id: int) -> CreditDetail:
+    credit = db.query(CreditDetail).filter(
+        CreditDetail.id == credit_id,
+        CreditDetail.user_id == user_id
+    ).first()
+    if not credit:
+        raise HTTPException(status_code=404, detail="Credit not found")
+    return credit
+
+@router.get("/")
+def get_debt_overview(
+    include_schedules: bool = Query(False),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the debt overview: outstanding principal, monthly burden and payoff date of every credit
+    
+    Amounts already repaid are reconciled with the processed bill transactions
+    of the credit categories. Full amortization schedules are included on demand.
+    """
+    return CreditAmortization(db).overview(current_user.id, include_schedules)
+
+@router.post("/", response_model=CreditDetailResponse)
+def create_credit(
+    credit: CreditDetailCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create credit"""
+    validate_credit_category(db, current_user.id, credit.category_id)
+    db_credit = CreditDetail(user_id=current_user.id, **credit.model_dump())
+    complete_credit(db_credit)
+    
+    db.add(db_credit)
+    bump_data_version(db, current_user.id)
+    db.commit()
+    db.refresh(db_credit)
+    return db_credit
+
+@router.put("/{credit_id}", response_model=CreditDetailResponse)
+def update_credit(
+    credit_id: int,
+    credit: CreditDetailUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update credit
+    
+    Changing the amount, rate or duration recomputes the monthly payment and
+    interest cost unless they are provided as well.
+    """
+    db_credit = get_user_credit(db, current_user.id, credit_id)
+    changes = credit.model_dump(exclude_none=True)
+    for field, value in changes.items():
+        setattr(db_credit, field, value)
+    
+    if {"borrowed_amount", "interest_rate", "duration_months"} & set(changes):
+        # Valeurs dérivées recalculées par complete_credit
+        if "monthly_payment" not in changes:
+            db_credit.monthly_payment = None
+        if "interest_amount" not in changes:
+            db_credit.interest_amount = None
+    complete_credit(db_credit)
+    
+    bump_data_version(db, current_user.id)
+    db.commit()
+    db.refresh(db_credit)
+    return db_credit
+
+@router.delete("/{credit_id}")
+def delete_credit(
+    credit_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete credit"""
+    db_credit = get_user_credit(db, current_user.id, credit_id)
+    db.delete(db_credit)
+    bump_data_version(db, current_user.id)
+    db.commit()
+    return {"message": "Credit deleted"}
\ No newline at end of file
@@ -0,0 +1,188 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+
+from ..core.database import get_db, upsert
+from ..core.deps import get_current_user
+from ..core.etag import bump_data_version
+from ..models.user import User
+from ..models.budget_forecast import BudgetForecast
+from ..models.category import Category
+from ..schemas.forecast import *
+from ..services.budget_cache import budget_cache
+from ..services.forecast_suggestions import DEFAULT_WINDOW, HISTORY_PERIODS, ForecastSuggester
+
+router = APIRouter(prefix="/forecasts", tags=["forecasts"])
+
+# Cellule de la grille des prévisions : (année, mois, catégorie)
+ForecastCell = Tuple[int, int, int]
+
+def validate_year(year: int) -> None:
+    if year < 2000 or year > 2100:
+        raise HTTPException(status_code=400, detail="Year must be between 2000 and 2100")
+
+def upsert_forecasts(db: Session, user_id: int, cells: Dict[ForecastCell, float]) -> int:
+    """Create or update many forecast cells (one INSERT ... ON CONFLICT statement where supported)
+    
+    Relies on the (user_id, year, month_number, category_id) unique constraint.
+    """
+    if not cells:
+        return 0
+    
+    for year, month_number, _ in cells:
+        validate_year(year)
+        if month_number < 1 or month_number > 12:
+            raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
+    if any(amount < 0 for amount in cells.values()):
+        raise HTTPException(status_code=400, detail="Forecasted amounts must not be negative")
+    
+    category_ids = {category_id for _, _, category_id in cells}
+    owned_categories = db.query(Category.id).filter(Category.user_id == user_id, Category.id.in_(category_ids)).count()
+    if owned_categories != len(category_ids):
+        raise HTTPException(status_code=404, detail="Category not found")
+    
+    upsert(
+        db,
+        BudgetForecast.__table__,
+        ["user_id", "year", "month_number", "category_id"],
+        ["forecasted_amount"],
+        [
+            {"user_id": user_id, "year": year, "month_number": month_number, "category_id": category_id, "forecasted_amount": amount}
+            for (year, month_number, category_id), amount in cells.items()
+        ]
+    )
+    return len(cells)
+
+def commit_forecasts(db: Session, user_id: int, cells) -> None:
+    """Commit forecast changes and drop the cached budget periods they belong to"""
+    bump_data_version(db, user_id)
+    db.commit()
+    budget_cache.invalidate_periods(user_id, {(month_number, year) for year, month_number, _ in cells})
+
+def forecast_grid(db: Session, user_id: int, year: int) -> Dict:
+    """Year x categories matrix of forecasts (0 for empty cells)"""
+    categories = db.query(Category.id, Category.name, Category.type).filter(
+        Category.user_id == user_id
+    ).order_by(Category.type, Category.sort_order, Category.id).all()
+    
+    amounts = {category_id: [0.0] * 12 for category_id, _, _ in categories}
+    for month_number, category_id, forecasted_amount in db.query(
+        BudgetForecast.month_number,
+        BudgetForecast.category_id,
+        BudgetForecast.forecasted_amount
+    ).filter(BudgetForecast.user_id == user_id, BudgetForecast.year == year).all():
+        if category_id in amounts:
+            amounts[category_id][month_number - 1] = forecasted_amount or 0.0
+    
+    return {
+        "year": year,
+        "months": list(range(1, 13)),
+        "categories": [
+            {
+                "category_id": category_id,
+                "category_name": name,
+                "category_type": category_type.value,
+                "amounts": amounts[category_id]
+            }
+            for category_id, name, category_type in categories
+        ]
+    }
+
+@router.get("/", response_model=List[BudgetForecastResponse])
+def get_forecasts(
+    year: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get budget forecasts, optionally for one year"""
+    query = db.query(BudgetForecast).filter(BudgetForecast.user_id == current_user.id)
+    if year is not None:
+        query = query.filter(BudgetForecast.year == year)
+    return query.order_by(BudgetForecast.year, BudgetForecast.month_number, BudgetForecast.category_id).all()
+
+@router.get("/suggestions")
+def get_forecast_suggestions(
+    year: Optional[int] = None,
+    window: int = Query(DEFAULT_WINDOW, ge=1, le=HISTORY_PERIODS),
+    method: str = Query("mean", pattern="^(mean|median|seasonal)$"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Suggest forecasts for the 12 months of a year (current year by default) and every category
+    
+    Each cell carries the trailing mean and median over the last `window`
+    periods and the same month of the year before `year`, once elapsed;
+    `suggested` is the statistic selected by `method`.
+    """
+    year = year or date.today().year
+    validate_year(year)
+    return ForecastSuggester(db).suggest(current_user.id, year, window, method)
+
+@router.put("/bulk")
+def bulk_upsert_forecasts(
+    bulk: BudgetForecastBulk,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create or update many forecasts (e.g. accepted suggestions) in one write
+    
+    The last entry wins when a cell is sent twice.
+    """
+    cells = {
+        (entry.year, entry.month_number, entry.category_id): entry.forecasted_amount
+        for entry in bulk.forecasts
+    }
+    written = upsert_forecasts(db, current_user.id, cells)
+    commit_forecasts(db, current_user.id, cells)
+    return {"written": written}
+
+@router.get("/grid/{year}")
+def get_forecast_grid(
+    year: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the forecasts of a year as a categories x 12 months matrix"""
+    validate_year(year)
+    return forecast_grid(db, current_user.id, year)
+
+@router.put("/grid/{year}")
+def update_forecast_grid(
+    year: int,
+    grid: ForecastGridUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Write a year x categories matrix of forecasts in one statement
+    
+    Each row holds the 12 monthly amounts of a category; null cells are left unchanged.
+    """
+    validate_year(year)
+    cells = {}
+    for row in grid.categories:
+        if len(row.amounts) != 12:
+            raise HTTPException(status_code=400, detail="Each row must contain 12 monthly amounts")
+        for month_number, amount in enumerate(row.amounts, start=1):
+            if amount is not None:
+                cells[(year, month_number, row.category_id)] = amount
+    
+    upsert_forecasts(db, current_user.id, cells)
+    commit_forecasts(db, current_user.id, cells)
+    return forecast_grid(db, current_user.id, year)
+
+@router.delete("/grid/{year}")
+def delete_forecast_grid(
+    year: int,
+    category_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete the forecasts of a year, or of one category for that year"""
+    validate_year(year)
+    query = db.query(BudgetForecast).filter(BudgetForecast.user_id == current_user.id, BudgetForecast.year == year)
+    if category_id is not None:
+        query = query.filter(BudgetForecast.category_id == category_id)
+    deleted = query.delete(synchronize_session=False)
+    commit_forecasts(db, current_user.id, [(year, month_number, None) for month_number in range(1, 13)])
+    return {"deleted": deleted}
\ No newline at end of file
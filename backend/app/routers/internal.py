@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Header, HTTPException
+from typing import Optional
+import secrets
+
+from ..core.config import settings
+from ..core.cache import get_cache
+from ..core.database import get_pool_status
+from ..core.deps import auth_cache
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+def verify_metrics_token(x_metrics_token: Optional[str] = Header(None)):
+    """Require X-Metrics-Token; the endpoint is disabled until METRICS_TOKEN is configured"""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not secrets.compare_digest(x_metrics_token or "", settings.METRICS_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid metrics token")
+
+@router.get("/metrics", dependencies=[Depends(verify_metrics_token)])
+def get_metrics():
+    """Get internal runtime metrics (database pool usage, result and auth caches)"""
+    return {
+        "database_pool": get_pool_status(),
+        "cache": get_cache().stats(),
+        "auth_cache": auth_cache.stats()
+    }
\ No newline at end of file
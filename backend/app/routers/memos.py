@@ -0,0 +1,117 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import case
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ..core.database import get_db
+from ..core.deps import get_current_user
+from ..core.etag import bump_data_version
+from ..models.user import User
+from ..models.memo_item import MemoItem
+from ..schemas.memo import *
+from ..services.budget_cache import budget_cache
+
+router = APIRouter(prefix="/memos", tags=["memos"])
+
+def validate_month(month_number: int) -> None:
+    if month_number < 1 or month_number > 12:
+        raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
+
+def get_user_memo(db: Session, user_id: int, memo_id: int) -> MemoItem:
+    memo = db.query(MemoItem).filter(
+        MemoItem.id == memo_id,
+        MemoItem.user_id == user_id
+    ).first()
+    if not memo:
+        raise HTTPException(status_code=404, detail="Memo item not found")
+    return memo
+
+def commit_memos(db: Session, user_id: int) -> None:
+    """Commit memo changes and drop the cached budget periods
+    
+    A memo has no year: it counts in its month of every year, so all the
+    user's cached periods are invalidated.
+    """
+    bump_data_version(db, user_id)
+    db.commit()
+    budget_cache.invalidate_user(user_id)
+
+@router.get("/", response_model=List[MemoItemResponse])
+def get_memo_items(
+    month: Optional[int] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get memo items, optionally for one month"""
+    query = db.query(MemoItem).filter(MemoItem.user_id == current_user.id)
+    if month is not None:
+        validate_month(month)
+        query = query.filter(MemoItem.month_number == month)
+    return query.order_by(MemoItem.month_number, MemoItem.id).all()
+
+@router.post("/", response_model=MemoItemResponse)
+def create_memo_item(
+    memo: MemoItemCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create memo item"""
+    validate_month(memo.month_number)
+    db_memo = MemoItem(user_id=current_user.id, **memo.model_dump())
+    db.add(db_memo)
+    commit_memos(db, current_user.id)
+    db.refresh(db_memo)
+    return db_memo
+
+@router.post("/batch/paid", response_model=MemoItemBatchResult)
+def batch_pay_memo_items(
+    batch: MemoItemBatchPaid,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Set (or toggle when is_paid is omitted) the paid status of several memo items"""
+    if not batch.ids:
+        return {"affected": 0}
+    
+    if batch.is_paid is None:
+        is_paid = case((MemoItem.is_paid == True, False), else_=True)
+    else:
+        is_paid = batch.is_paid
+    
+    affected = db.query(MemoItem).filter(
+        MemoItem.user_id == current_user.id,
+        MemoItem.id.in_(batch.ids)
+    ).update({MemoItem.is_paid: is_paid}, synchronize_session=False)
+    commit_memos(db, current_user.id)
+    return {"affected": affected}
+
+@router.put("/{memo_id}", response_model=MemoItemResponse)
+def update_memo_item(
+    memo_id: int,
+    memo: MemoItemUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update memo item"""
+    db_memo = get_user_memo(db, current_user.id, memo_id)
+    changes = memo.model_dump(exclude_none=True)
+    if "month_number" in changes:
+        validate_month(changes["month_number"])
+    for field, value in changes.items():
+        setattr(db_memo, field, value)
+    
+    commit_memos(db, current_user.id)
+    db.refresh(db_memo)
+    return db_memo
+
+@router.delete("/{memo_id}")
+def delete_memo_item(
+    memo_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete memo item"""
+    db_memo = get_user_memo(db, current_user.id, memo_id)
+    db.delete(db_memo)
+    commit_memos(db, current_user.id)
+    return {"message": "Memo item deleted"}
\ No newline at end of file
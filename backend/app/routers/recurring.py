@@ -0,0 +1,153 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from typing import List
+from datetime import date
+
+from ..core.database import get_db
+from ..core.deps import get_current_user
+from ..core.etag import bump_data_version
+from ..models.user import User
+from ..models.account import Account
+from ..models.category import Category
+from ..models.recurring_transaction import RecurringTransaction
+from ..models.transaction import Transaction
+from ..schemas.recurring import *
+from ..services.balance_ledger import BalanceLedger
+from ..services.budget_cache import budget_cache
+from ..services.recurring_scheduler import RecurringScheduler
+from ..services.transaction_rules import validate_recurrence, validate_transaction
+
+router = APIRouter(prefix="/recurring", tags=["recurring"])
+
+def validate_rule(db: Session, user_id: int, rule: RecurringTransaction) -> None:
+    """Check amounts, schedule and ownership of the referenced accounts and category"""
+    error = validate_transaction(rule.amount, rule.account_from_id, rule.account_to_id) or validate_recurrence(
+        rule.frequency, rule.repeat_every, rule.day, rule.start_date, rule.end_date
+    )
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    
+    account_ids = {rule.account_from_id, rule.account_to_id}
+    owned_accounts = db.query(Account.id).filter(Account.user_id == user_id, Account.id.in_(account_ids)).count()
+    if owned_accounts != len(account_ids):
+        raise HTTPException(status_code=404, detail="Account not found")
+    
+    if rule.category_id is not None and not db.query(Category.id).filter(
+        Category.user_id == user_id,
+        Category.id == rule.category_id
+    ).first():
+        raise HTTPException(status_code=404, detail="Category not found")
+
+def get_user_rule(db: Session, user_id: int, rule_id: int) -> RecurringTransaction:
+    rule = db.query(RecurringTransaction).filter(
+        RecurringTransaction.id == rule_id,
+        RecurringTransaction.user_id == user_id
+    ).first()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Recurring transaction not found")
+    return rule
+
+@router.get("/", response_model=List[RecurringTransactionResponse])
+def get_recurring_transactions(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get recurring transaction rules"""
+    return db.query(RecurringTransaction).filter(
+        RecurringTransaction.user_id == current_user.id
+    ).order_by(RecurringTransaction.id).all()
+
+@router.post("/", response_model=RecurringTransactionResponse)
+def create_recurring_transaction(
+    recurring: RecurringTransactionCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create a recurring transaction rule and generate its upcoming occurrences"""
+    rule = RecurringTransaction(user_id=current_user.id, **recurring.model_dump())
+    validate_rule(db, current_user.id, rule)
+    
+    db.add(rule)
+    bump_data_version(db, current_user.id)
+    db.commit()
+    
+    # Occurrences jusqu'à l'horizon du planificateur, sans attendre son prochain passage
+    RecurringScheduler(db).run(rule_ids=[rule.id])
+    db.refresh(rule)
+    return rule
+
+@router.put("/{recurring_id}", response_model=RecurringTransactionResponse)
+def update_recurring_transaction(
+    recurring_id: int,
+    recurring: RecurringTransactionUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update a recurring transaction rule
+    
+    Occurrences already generated are kept as they are; the changes apply
+    to the occurrences generated from now on. Only the fields sent are changed:
+    an explicit null clears end_date or category_id.
+    """
+    changes = recurring.model_dump(exclude_unset=True)
+    required = sorted(
+        field for field, value in changes.items()
+        if value is None and not RecurringTransaction.__table__.c[field].nullable
+    )
+    if required:
+        raise HTTPException(status_code=400, detail=f"Fields cannot be null: {', '.join(required)}")
+    
+    rule = get_user_rule(db, current_user.id, recurring_id)
+    for field, value in changes.items():
+        setattr(rule, field, value)
+    validate_rule(db, current_user.id, rule)
+    
+    bump_data_version(db, current_user.id)
+    db.commit()
+    
+    RecurringScheduler(db).run(rule_ids=[rule.id])
+    db.refresh(rule)
+    return rule
+
+@router.delete("/{recurring_id}")
+def delete_recurring_transaction(
+    recurring_id: int,
+    delete_upcoming: bool = Query(False),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete a recurring transaction rule
+    
+    Generated transactions are kept and detached from the rule, except the
+    unprocessed ones from today on when delete_upcoming is set.
+    """
+    rule = get_user_rule(db, current_user.id, recurring_id)
+    
+    deleted = 0
+    if delete_upcoming:
+        ledger = BalanceLedger(db)
+        upcoming, locked = ledger.lock_selection(and_(
+            Transaction.user_id == current_user.id,
+            Transaction.recurring_id == rule.id,
+            Transaction.is_processed.isnot(True),
+            Transaction.date >= date.today()
+        ))
+        if locked:
+            deltas = ledger.selection_deltas(upcoming, -1)
+            deleted = db.query(Transaction).filter(upcoming).delete(synchronize_session=False)
+            if deleted != locked:
+                raise HTTPException(status_code=409, detail="Transactions changed during the deletion, please retry")
+            ledger.apply_deltas(current_user.id, deltas)
+    
+    db.query(Transaction).filter(Transaction.recurring_id == rule.id).update(
+        {Transaction.recurring_id: None},
+        synchronize_session=False
+    )
+    db.delete(rule)
+    bump_data_version(db, current_user.id)
+    db.commit()
+    if deleted:
+        budget_cache.invalidate_user(current_user.id)
+    
+    return {"message": "Recurring transaction deleted", "deleted_transactions": deleted}
\ No newline at end of file
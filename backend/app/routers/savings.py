@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from ..core.database import get_db
+from ..core.deps import get_current_user
+from ..core.etag import bump_data_version
+from ..models.user import User
+from ..models.category import Category, CategoryType
+from ..models.savings_goal import SavingsGoal
+from ..schemas.savings import *
+from ..services.savings import SavingsCalculator
+
+router = APIRouter(prefix="/savings", tags=["savings"])
+
+def validate_goal(db: Session, user_id: int, goal: SavingsGoal) -> None:
+    """Check the target amount and that the category is one of the user's savings categories"""
+    if goal.target_amount <= 0:
+        raise HTTPException(status_code=400, detail="Target amount must be positive")
+    
+    category_type = db.query(Category.type).filter(
+        Category.user_id == user_id,
+        Category.id == goal.category_id
+    ).scalar()
+    if category_type is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if category_type != CategoryType.SAVINGS:
+        raise HTTPException(status_code=400, detail="Savings goals require a savings category")
+
+def get_user_goal(db: Session, user_id: int, goal_id: int) -> SavingsGoal:
+    goal = db.query(SavingsGoal).filter(
+        SavingsGoal.id == goal_id,
+        SavingsGoal.user_id == user_id
+    ).first()
+    if not goal:
+        raise HTTPException(status_code=404, detail="Savings goal not found")
+    return goal
+
+@router.get("/", response_model=SavingsProgressResponse)
+def get_savings_progress(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the progress of every savings goal
+    
+    Saved amounts come from processed savings transactions of the goal's
+    category; the completion date is estimated from the recent savings rate.
+    """
+    goals = SavingsCalculator(db).goal_progress(current_user.id)
+    return {
+        "goals": goals,
+        "summary": SavingsCalculator.summarize(goals)
+    }
+
+@router.post("/goals", response_model=SavingsGoalResponse)
+def create_savings_goal(
+    goal: SavingsGoalCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create savings goal"""
+    db_goal = SavingsGoal(user_id=current_user.id, **goal.model_dump())
+    validate_goal(db, current_user.id, db_goal)
+    
+    db.add(db_goal)
+    bump_data_version(db, current_user.id)
+    db.commit()
+    db.refresh(db_goal)
+    return db_goal
+
+@router.put("/goals/{goal_id}", response_model=SavingsGoalResponse)
+def update_savings_goal(
+    goal_id: int,
+    goal: SavingsGoalUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update savings goal"""
+    db_goal = get_user_goal(db, current_user.id, goal_id)
+    if goal.target_amount is not None:
+        db_goal.target_amount = goal.target_amount
+    validate_goal(db, current_user.id, db_goal)
+    
+    bump_data_version(db, current_user.id)
+    db.commit()
+    db.refresh(db_goal)
+    return db_goal
+
+@router.delete("/goals/{goal_id}")
+def delete_savings_goal(
+    goal_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete savings goal"""
+    db_goal = get_user_goal(db, current_user.id, goal_id)
+    db.delete(db_goal)
+    bump_data_version(db, current_user.id)
+    db.commit()
+    return {"message": "Savings goal deleted"}
\ No newline at end of file
@@ -1,18 +1,129 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import and_, case, tuple_
+from sqlalchemy.sql.expression import ColumnElement
+from typing import Dict, List, Optional, Tuple
 from datetime import date
+import base64
+import binascii
+import json
 
 from ..core.database import get_db
 from ..core.deps import get_current_user
+from ..core.etag import bump_data_version, check_not_modified
+from ..core.serialization import json_response, projection, rows_to_dicts
 from ..models.user import User
 from ..models.transaction import Transaction
 from ..schemas.transaction import *
+from ..services.balance_history import BalanceHistory
+from ..services.balance_ledger import BalanceLedger
+from ..services.budget_cache import budget_cache
+from ..services.export import MEDIA_TYPES, TRANSACTION_COLUMNS, ReportExporter, stream_rows
+from ..services.transaction_import import ImportFormatError, TransactionImporter, iter_upload_rows
+from ..services.transaction_rules import validate_transaction
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+def encode_cursor(transaction_date: date, transaction_id: int) -> str:
+    """Opaque cursor pointing after (date, id) in the (date DESC, id DESC) order"""
+    raw = json.dumps([transaction_date.isoformat(), transaction_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        transaction_date, transaction_id = json.loads(raw)
+        return date.fromisoformat(transaction_date), int(transaction_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def filter_conditions(filters: TransactionFilter) -> List:
+    """SQL conditions of the get_transactions filters on Transaction"""
+    conditions = []
+    if filters.date_from:
+        conditions.append(Transaction.date >= filters.date_from)
+    if filters.date_to:
+        conditions.append(Transaction.date <= filters.date_to)
+    if filters.account_id:
+        conditions.append(
+            (Transaction.account_from_id == filters.account_id) | 
+            (Transaction.account_to_id == filters.account_id)
+        )
+    if filters.category_id:
+        conditions.append(Transaction.category_id == filters.category_id)
+    if filters.transaction_type:
+        conditions.append(Transaction.type == filters.transaction_type)
+    if filters.processed_only is not None:
+        conditions.append(Transaction.is_processed == filters.processed_only)
+    return conditions
+
+def filter_transactions(query, filters: TransactionFilter):
+    """Apply the get_transactions filters to a query on Transaction"""
+    return query.filter(*filter_conditions(filters))
+
+def transaction_list_query(db: Session, user_id: int, filters: TransactionFilter, cursor: Optional[str] = None):
+    """Query behind GET /transactions/: TransactionResponse columns, (date DESC, id DESC) order"""
+    # Colonnes de TransactionResponse uniquement, sérialisées sans objets ORM
+    query = filter_transactions(
+        db.query(*projection(Transaction, TransactionResponse)).filter(Transaction.user_id == user_id),
+        filters
+    )
+    
+    # Ordre stable (date, id) : les transactions d'une même date ne sont pas permutées entre deux pages
+    query = query.order_by(Transaction.date.desc(), Transaction.id.desc())
+    
+    if cursor:
+        # Pagination par clé : reprise après la dernière ligne de la page précédente
+        query = query.filter(tuple_(Transaction.date, Transaction.id) < tuple_(*decode_cursor(cursor)))
+    return query
+
+def lock_selection(db: Session, user_id: int, selection: TransactionSelection) -> Tuple[Optional[ColumnElement], int]:
+    """SQL condition matching the user's transactions targeted by a batch request
+    (ids or filter), and their count
+    
+    The rows are locked (FOR UPDATE, in id order) until the commit: the ledger
+    deltas are computed from their current state, so two concurrent batches on
+    the same transactions must not both apply them. The filter itself goes into
+    the UPDATE/DELETE and the ledger aggregates, the ids are never loaded.
+    """
+    if (selection.ids is None) == (selection.filter is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or filter")
+    
+    if selection.ids is not None:
+        conditions = [Transaction.id.in_(selection.ids)]
+    else:
+        conditions = filter_conditions(selection.filter)
+    return BalanceLedger(db).lock_selection(and_(Transaction.user_id == user_id, *conditions))
+
+def check_selection_unchanged(affected: int, locked: int) -> None:
+    """Reject a batch whose selection changed between the lock and the write"""
+    if affected != locked:
+        raise HTTPException(status_code=409, detail="Transactions changed during the batch, please retry")
+
+def get_user_transaction_for_update(db: Session, user_id: int, transaction_id: int) -> Transaction:
+    """Load one of the user's transactions, locked until the commit
+    
+    The ledger snapshot is taken from the locked row: a concurrent toggle or
+    delete of the same transaction waits and then sees the committed state.
+    """
+    db_transaction = db.query(Transaction).filter(
+        Transaction.id == transaction_id,
+        Transaction.user_id == user_id
+    ).with_for_update().first()
+    
+    if not db_transaction:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    return db_transaction
+
+def transaction_dates(db: Session, selected: ColumnElement) -> List[date]:
+    """Distinct dates of the selected transactions (budget periods to invalidate)"""
+    return [day for (day,) in db.query(Transaction.date).filter(selected).distinct().all()]
+
 @router.get("/", response_model=List[TransactionResponse])
-async def get_transactions(
+def get_transactions(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
@@ -22,44 +133,85 @@ async def get_transactions(
     account_id: Optional[int] = Query(None),
     category_id: Optional[int] = Query(None),
     transaction_type: Optional[str] = Query(None),
+    processed_only: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None)
+):
+    """Get transactions with filters
+    
+    Pagination by skip/limit, or by cursor: the X-Next-Cursor response header
+    points to the next page and is absent on the last one.
+    """
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="skip cannot be combined with cursor")
+    
+    not_modified = check_not_modified(request, response, current_user)
+    if not_modified:
+        return not_modified
+    
+    filters = TransactionFilter(
+        date_from=date_from,
+        date_to=date_to,
+        account_id=account_id,
+        category_id=category_id,
+        transaction_type=transaction_type,
+        processed_only=processed_only
+    )
+    query = transaction_list_query(db, current_user.id, filters, cursor)
+    if not cursor:
+        query = query.offset(skip)
+    
+    transactions = rows_to_dicts(TransactionResponse, query.limit(limit + 1).all())
+    if len(transactions) > limit:
+        transactions = transactions[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(transactions[-1]["date"], transactions[-1]["id"])
+    return json_response(transactions, response)
+
+@router.get("/export")
+def export_transactions(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    account_id: Optional[int] = Query(None),
+    category_id: Optional[int] = Query(None),
+    transaction_type: Optional[str] = Query(None),
     processed_only: Optional[bool] = Query(None)
 ):
-    """Get transactions with filters"""
-    query = db.query(Transaction).filter(Transaction.user_id == current_user.id)
-    
-    if date_from:
-        query = query.filter(Transaction.date >= date_from)
-    if date_to:
-        query = query.filter(Transaction.date <= date_to)
-    if account_id:
-        query = query.filter(
-            (Transaction.account_from_id == account_id) | 
-            (Transaction.account_to_id == account_id)
+    """Stream every matching transaction as CSV or NDJSON (same filters as the list)
+    
+    The CSV columns are those accepted by POST /transactions/import.
+    """
+    exporter = ReportExporter(db, current_user.id)
+    query = filter_transactions(
+        exporter.transaction_query(),
+        TransactionFilter(
+            date_from=date_from,
+            date_to=date_to,
+            account_id=account_id,
+            category_id=category_id,
+            transaction_type=transaction_type,
+            processed_only=processed_only
         )
-    if category_id:
-        query = query.filter(Transaction.category_id == category_id)
-    if transaction_type:
-        query = query.filter(Transaction.type == transaction_type)
-    if processed_only is not None:
-        query = query.filter(Transaction.is_processed == processed_only)
+    )
     
-    transactions = query.order_by(Transaction.date.desc()).offset(skip).limit(limit).all()
-    return transactions
+    # La session de get_db reste ouverte jusqu'à la fin de l'envoi de la réponse
+    return StreamingResponse(
+        stream_rows(export_format, TRANSACTION_COLUMNS, exporter.transaction_rows(query)),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="transactions.{export_format}"'}
+    )
 
 @router.post("/", response_model=TransactionResponse)
-async def create_transaction(
+def create_transaction(
     transaction: TransactionCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create new transaction"""
-    # Validation: montant positif
-    if transaction.amount <= 0:
-        raise HTTPException(status_code=400, detail="Amount must be positive")
-    
-    # Validation: comptes différents (sauf pour certains transferts)
-    if transaction.account_from_id == transaction.account_to_id:
-        raise HTTPException(status_code=400, detail="Source and destination accounts must be different")
+    error = validate_transaction(transaction.amount, transaction.account_from_id, transaction.account_to_id)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
     
     db_transaction = Transaction(
         user_id=current_user.id,
@@ -74,25 +226,155 @@ async def create_transaction(
     )
     
     db.add(db_transaction)
+    BalanceLedger(db).record(current_user.id, None, BalanceLedger.snapshot(db_transaction))
+    BalanceHistory(db).invalidate_from(current_user.id, db_transaction.date)
+    bump_data_version(db, current_user.id)
     db.commit()
     db.refresh(db_transaction)
+    budget_cache.invalidate_transaction_dates(current_user, [db_transaction.date])
     return db_transaction
 
+@router.post("/import")
+def import_transactions(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Import transactions from a CSV or Excel (.xlsx) file
+    
+    Valid rows are inserted in a single database transaction, invalid rows are
+    reported with their line number. Categories and accounts are matched by name.
+    """
+    importer = TransactionImporter(db, current_user)
+    try:
+        report = importer.import_rows(iter_upload_rows(file.filename, file.file))
+    except ImportFormatError as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc))
+    
+    if report["imported"]:
+        BalanceHistory(db).invalidate_from(current_user.id, importer.earliest_date)
+        bump_data_version(db, current_user.id)
+        db.commit()
+        budget_cache.invalidate_user(current_user.id)
+    return report
+
+def apply_batch(db: Session, user_id: int, selected: ColumnElement, locked: int, values: Dict) -> int:
+    """Set-based UPDATE of the selected transactions, ledger kept in sync
+    
+    The balance deltas are aggregated over the selection (one GROUP BY for the
+    current state, one for the new values) before the UPDATE, which may take
+    rows out of a filter selection, instead of being tracked row by row.
+    """
+    ledger = BalanceLedger(db)
+    deltas = ledger.merge_deltas(
+        ledger.selection_deltas(selected, -1),
+        ledger.selection_deltas(selected, 1, values)
+    )
+    affected = db.query(Transaction).filter(selected).update(values, synchronize_session=False)
+    check_selection_unchanged(affected, locked)
+    ledger.apply_deltas(user_id, deltas)
+    return affected
+
+@router.post("/batch/process", response_model=TransactionBatchResult)
+def batch_process_transactions(
+    batch: TransactionBatchProcess,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Set (or toggle when is_processed is omitted) the processing status of several transactions"""
+    selected, locked = lock_selection(db, current_user.id, batch)
+    if not locked:
+        return {"affected": 0}
+    
+    if batch.is_processed is None:
+        is_processed = case((Transaction.is_processed == True, False), else_=True)
+    else:
+        is_processed = batch.is_processed
+    
+    dates = transaction_dates(db, selected)
+    affected = apply_batch(db, current_user.id, selected, locked, {"is_processed": is_processed})
+    BalanceHistory(db).invalidate_from(current_user.id, min(dates))
+    bump_data_version(db, current_user.id)
+    db.commit()
+    # Le pointage ne change que les soldes, pas les montants budgétaires
+    budget_cache.invalidate_balances(current_user.id)
+    return {"affected": affected}
+
+@router.post("/batch/update", response_model=TransactionBatchResult)
+def batch_update_transactions(
+    batch: TransactionBatchUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Apply the same field changes to several transactions"""
+    changes = batch.changes.model_dump(exclude_none=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="No changes provided")
+    if "amount" in changes and changes["amount"] <= 0:
+        raise HTTPException(status_code=400, detail="Amount must be positive")
+    
+    selected, locked = lock_selection(db, current_user.id, batch)
+    if not locked:
+        return {"affected": 0}
+    
+    if "account_from_id" in changes or "account_to_id" in changes:
+        # Comptes après modification, évalués sur les lignes avant l'UPDATE
+        _, account_from_id, account_to_id, _ = BalanceLedger.state_columns(changes)
+        same_account = db.query(Transaction.id).filter(selected, account_from_id == account_to_id).first()
+        if same_account:
+            raise HTTPException(status_code=400, detail="Source and destination accounts must be different")
+    
+    dates = transaction_dates(db, selected)
+    affected = apply_batch(db, current_user.id, selected, locked, changes)
+    
+    if "date" in changes:
+        dates.append(changes["date"])
+    
+    BalanceHistory(db).invalidate_from(current_user.id, min(dates))
+    bump_data_version(db, current_user.id)
+    db.commit()
+    if set(changes) == {"is_processed"}:
+        budget_cache.invalidate_balances(current_user.id)
+    else:
+        budget_cache.invalidate_transaction_dates(current_user, dates)
+    return {"affected": affected}
+
+@router.post("/batch/delete", response_model=TransactionBatchResult)
+def batch_delete_transactions(
+    batch: TransactionSelection,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete several transactions"""
+    selected, locked = lock_selection(db, current_user.id, batch)
+    if not locked:
+        return {"affected": 0}
+    
+    ledger = BalanceLedger(db)
+    dates = transaction_dates(db, selected)
+    deltas = ledger.selection_deltas(selected, -1)
+    affected = db.query(Transaction).filter(selected).delete(synchronize_session=False)
+    check_selection_unchanged(affected, locked)
+    ledger.apply_deltas(current_user.id, deltas)
+    BalanceHistory(db).invalidate_from(current_user.id, min(dates))
+    bump_data_version(db, current_user.id)
+    db.commit()
+    budget_cache.invalidate_transaction_dates(current_user, dates)
+    return {"affected": affected}
+
 @router.put("/{transaction_id}", response_model=TransactionResponse)
-async def update_transaction(
+def update_transaction(
     transaction_id: int,
     transaction: TransactionUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update transaction"""
-    db_transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
-    ).first()
+    db_transaction = get_user_transaction_for_update(db, current_user.id, transaction_id)
     
-    if not db_transaction:
-        raise HTTPException(status_code=404, detail="Transaction not found")
+    previous_state = BalanceLedger.snapshot(db_transaction)
+    previous_date = db_transaction.date
     
     # Mise à jour des champs
     if transaction.is_processed is not None:
@@ -114,46 +396,49 @@ async def update_transaction(
     if transaction.description is not None:
         db_transaction.description = transaction.description
     
+    BalanceLedger(db).record(current_user.id, previous_state, BalanceLedger.snapshot(db_transaction))
+    BalanceHistory(db).invalidate_from(current_user.id, min(previous_date, db_transaction.date))
+    bump_data_version(db, current_user.id)
     db.commit()
     db.refresh(db_transaction)
+    budget_cache.invalidate_transaction_dates(current_user, [previous_date, db_transaction.date])
     return db_transaction
 
 @router.delete("/{transaction_id}")
-async def delete_transaction(
+def delete_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete transaction"""
-    db_transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
-    ).first()
-    
-    if not db_transaction:
-        raise HTTPException(status_code=404, detail="Transaction not found")
+    db_transaction = get_user_transaction_for_update(db, current_user.id, transaction_id)
     
+    transaction_date = db_transaction.date
+    BalanceLedger(db).record(current_user.id, BalanceLedger.snapshot(db_transaction), None)
     db.delete(db_transaction)
+    BalanceHistory(db).invalidate_from(current_user.id, transaction_date)
+    bump_data_version(db, current_user.id)
     db.commit()
+    budget_cache.invalidate_transaction_dates(current_user, [transaction_date])
     return {"message": "Transaction deleted"}
 
 @router.patch("/{transaction_id}/process")
-async def toggle_transaction_processing(
+def toggle_transaction_processing(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Toggle transaction processing status (pointage)"""
-    db_transaction = db.query(Transaction).filter(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
-    ).first()
-    
-    if not db_transaction:
-        raise HTTPException(status_code=404, detail="Transaction not found")
+    db_transaction = get_user_transaction_for_update(db, current_user.id, transaction_id)
     
+    previous_state = BalanceLedger.snapshot(db_transaction)
     db_transaction.is_processed = not db_transaction.is_processed
+    BalanceLedger(db).record(current_user.id, previous_state, BalanceLedger.snapshot(db_transaction))
+    BalanceHistory(db).invalidate_from(current_user.id, db_transaction.date)
+    bump_data_version(db, current_user.id)
     db.commit()
+    # Le pointage ne change que les soldes, pas les montants budgétaires
+    budget_cache.invalidate_balances(current_user.id)
     
     return {
         "message": "Transaction processing status updated",
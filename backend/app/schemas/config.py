@@ -2,6 +2,7 @@ from pydantic import BaseModel
 from typing import Optional, List
 from datetime import date
 from ..models.category import CategoryType
+from ..core.money import MoneyAmount
 
 class StartDateUpdate(BaseModel):
     budget_start_date: Optional[date] = None
@@ -22,37 +23,38 @@ class CategoryResponse(BaseModel):
     id: int
     name: str
     type: CategoryType
-    is_credit: bool
-    sort_order: int
+    is_credit: bool = False
+    sort_order: int = 0
     
     class Config:
         from_attributes = True
 
 class AccountCreate(BaseModel):
     name: str
-    initial_balance: float
+    initial_balance: MoneyAmount
     is_savings_account: bool = False
     is_main_account: bool = False
 
 class AccountUpdate(BaseModel):
     name: Optional[str] = None
-    initial_balance: Optional[float] = None
+    initial_balance: Optional[MoneyAmount] = None
     is_savings_account: Optional[bool] = None
     is_main_account: Optional[bool] = None
 
 class AccountResponse(BaseModel):
     id: int
     name: str
-    initial_balance: float
-    current_balance: float
-    is_savings_account: bool
-    is_main_account: bool
+    initial_balance: float = 0.0
+    current_balance: float = 0.0
+    upcoming_balance: float = 0.0
+    is_savings_account: bool = False
+    is_main_account: bool = False
     
     class Config:
         from_attributes = True
 
 class SavingsAllocationCreate(BaseModel):
-    amount: float
+    amount: MoneyAmount
     category_id: int
     account_id: int
 
@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+from typing import Optional
+from ..core.money import MoneyAmount
+
+class CreditDetailCreate(BaseModel):
+    category_id: int
+    borrowed_amount: MoneyAmount
+    interest_rate: float  # Taux annuel en %
+    duration_months: int
+    monthly_payment: Optional[MoneyAmount] = None  # Calculée (annuité constante) si absente
+    interest_amount: Optional[MoneyAmount] = None  # Coût total des intérêts, calculé si absent
+    already_repaid: MoneyAmount = 0.0
+
+class CreditDetailUpdate(BaseModel):
+    borrowed_amount: Optional[MoneyAmount] = None
+    interest_rate: Optional[float] = None
+    duration_months: Optional[int] = None
+    monthly_payment: Optional[MoneyAmount] = None
+    interest_amount: Optional[MoneyAmount] = None
+    already_repaid: Optional[MoneyAmount] = None
+
+class CreditDetailResponse(BaseModel):
+    id: int
+    category_id: int
+    borrowed_amount: float
+    interest_amount: float
+    duration_months: int
+    interest_rate: float
+    monthly_payment: float
+    already_repaid: float
+    
+    class Config:
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from ..core.money import MoneyAmount
+
+class BudgetForecastEntry(BaseModel):
+    year: int
+    month_number: int
+    category_id: int
+    forecasted_amount: MoneyAmount
+
+class BudgetForecastBulk(BaseModel):
+    forecasts: List[BudgetForecastEntry]
+
+class BudgetForecastResponse(BaseModel):
+    id: int
+    year: int
+    month_number: int
+    category_id: int
+    forecasted_amount: float
+    
+    class Config:
+        from_attributes = True
+
+class ForecastGridRow(BaseModel):
+    category_id: int
+    amounts: List[Optional[MoneyAmount]]  # 12 montants (janvier à décembre), None : inchangé
+
+class ForecastGridUpdate(BaseModel):
+    categories: List[ForecastGridRow]
\ No newline at end of file
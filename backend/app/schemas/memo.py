@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from ..core.money import MoneyAmount
+
+class MemoItemCreate(BaseModel):
+    month_number: int
+    description: str
+    amount: MoneyAmount
+    is_paid: bool = False
+
+class MemoItemUpdate(BaseModel):
+    month_number: Optional[int] = None
+    description: Optional[str] = None
+    amount: Optional[MoneyAmount] = None
+    is_paid: Optional[bool] = None
+
+class MemoItemResponse(BaseModel):
+    id: int
+    month_number: int
+    description: str
+    amount: float
+    is_paid: bool
+    
+    class Config:
+        from_attributes = True
+
+class MemoItemBatchPaid(BaseModel):
+    ids: List[int]
+    is_paid: Optional[bool] = None  # None : inversion de l'état de chaque pense-bête
+
+class MemoItemBatchResult(BaseModel):
+    affected: int
\ No newline at end of file
@@ -0,0 +1,52 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import date
+from ..models.recurring_transaction import RecurrenceFrequency
+from ..models.transaction import TransactionType
+from ..core.money import MoneyAmount
+
+class RecurringTransactionCreate(BaseModel):
+    description: str
+    amount: MoneyAmount
+    type: TransactionType
+    category_id: Optional[int] = None
+    account_from_id: int
+    account_to_id: int
+    frequency: RecurrenceFrequency
+    repeat_every: int = 1
+    day: int = 1
+    start_date: date
+    end_date: Optional[date] = None
+    is_active: bool = True
+
+class RecurringTransactionUpdate(BaseModel):
+    description: Optional[str] = None
+    amount: Optional[MoneyAmount] = None
+    type: Optional[TransactionType] = None
+    category_id: Optional[int] = None
+    account_from_id: Optional[int] = None
+    account_to_id: Optional[int] = None
+    frequency: Optional[RecurrenceFrequency] = None
+    repeat_every: Optional[int] = None
+    day: Optional[int] = None
+    end_date: Optional[date] = None
+    is_active: Optional[bool] = None
+
+class RecurringTransactionResponse(BaseModel):
+    id: int
+    description: str
+    amount: float
+    type: TransactionType
+    category_id: Optional[int] = None
+    account_from_id: int
+    account_to_id: int
+    frequency: RecurrenceFrequency
+    repeat_every: int
+    day: int
+    start_date: date
+    end_date: Optional[date] = None
+    is_active: bool
+    generated_until: Optional[date] = None
+    
+    class Config:
+        from_attributes = True
\ No newline at end of file
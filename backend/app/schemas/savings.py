@@ -0,0 +1,43 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import date
+from ..core.money import MoneyAmount
+
+class SavingsGoalCreate(BaseModel):
+    category_id: int
+    target_amount: MoneyAmount
+
+class SavingsGoalUpdate(BaseModel):
+    target_amount: Optional[MoneyAmount] = None
+
+class SavingsGoalResponse(BaseModel):
+    id: int
+    category_id: int
+    target_amount: float
+    
+    class Config:
+        from_attributes = True
+
+class SavingsGoalProgress(BaseModel):
+    goal_id: int
+    category_id: int
+    category_name: str
+    target_amount: float
+    allocated: float
+    saved: float
+    pending: float
+    remaining: float
+    progress_percent: float
+    monthly_rate: float
+    estimated_completion: Optional[date] = None
+
+class SavingsSummary(BaseModel):
+    target_amount: float
+    allocated: float
+    saved: float
+    remaining: float
+    progress_percent: float
+
+class SavingsProgressResponse(BaseModel):
+    goals: List[SavingsGoalProgress]
+    summary: SavingsSummary
\ No newline at end of file
@@ -1,12 +1,14 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import date
+import datetime
 from ..models.transaction import TransactionType
+from ..core.money import MoneyAmount
 
 class TransactionCreate(BaseModel):
     is_processed: bool = False
     date: date
-    amount: float
+    amount: MoneyAmount
     type: TransactionType
     category_id: Optional[int] = None
     account_from_id: int
@@ -15,8 +17,8 @@ class TransactionCreate(BaseModel):
 
 class TransactionUpdate(BaseModel):
     is_processed: Optional[bool] = None
-    date: Optional[date] = None
-    amount: Optional[float] = None
+    date: Optional[datetime.date] = None  # datetime.date : le nom du champ masque le type
+    amount: Optional[MoneyAmount] = None
     type: Optional[TransactionType] = None
     category_id: Optional[int] = None
     account_from_id: Optional[int] = None
@@ -25,7 +27,7 @@ class TransactionUpdate(BaseModel):
 
 class TransactionResponse(BaseModel):
     id: int
-    is_processed: bool
+    is_processed: bool = False
     date: date
     amount: float
     type: TransactionType
@@ -35,4 +37,25 @@ class TransactionResponse(BaseModel):
     description: str
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class TransactionFilter(BaseModel):
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    account_id: Optional[int] = None
+    category_id: Optional[int] = None
+    transaction_type: Optional[str] = None
+    processed_only: Optional[bool] = None
+
+class TransactionSelection(BaseModel):
+    ids: Optional[List[int]] = None
+    filter: Optional[TransactionFilter] = None
+
+class TransactionBatchProcess(TransactionSelection):
+    is_processed: Optional[bool] = None  # None : inversion du pointage de chaque transaction
+
+class TransactionBatchUpdate(TransactionSelection):
+    changes: TransactionUpdate
+
+class TransactionBatchResult(BaseModel):
+    affected: int
\ No newline at end of file
@@ -1,19 +1,74 @@
 from sqlalchemy.orm import Session
-from typing import Dict, List
+from sqlalchemy import func, select, union_all
+from typing import Dict, List, Tuple
 from datetime import date, datetime
 from ..models.account import Account
 from ..models.transaction import Transaction
 from ..models.user import User
 
 class BalanceCalculator:
+    """
+    Calculs de soldes. Une instance est créée par requête : les soldes déjà
+    calculés y sont mémorisés et réutilisés par le résumé de trésorerie.
+    Ne pas réutiliser une instance après une écriture.
+    """
+    
     def __init__(self, db: Session):
         self.db = db
+        self._balances: Dict[Tuple[int, bool], Dict[str, Dict[int, float]]] = {}
     
-    def calculate_account_balance(self, account_id: int, user_id: int, processed_only: bool = False) -> float:
+    def _movements(self, user_id: int):
+        """
+        Mouvements signés par compte : une ligne débit (account_from) et une
+        ligne crédit (account_to) pour chaque transaction de l'utilisateur
+        """
+        debits = select(
+            Transaction.account_from_id.label("account_id"),
+            (-Transaction.amount).label("amount"),
+            Transaction.is_processed.label("is_processed")
+        ).where(Transaction.user_id == user_id)
+        
+        credits = select(
+            Transaction.account_to_id.label("account_id"),
+            Transaction.amount.label("amount"),
+            Transaction.is_processed.label("is_processed")
+        ).where(Transaction.user_id == user_id)
+        
+        return union_all(debits, credits).subquery("movements")
+    
+    def aggregate_query(self, user_id: int, account_id: int = None):
+        """
+        Requête des mouvements sommés par compte et par statut de pointage
+        """
+        movements = self._movements(user_id)
+        query = self.db.query(
+            movements.c.account_id,
+            movements.c.is_processed,
+            func.sum(movements.c.amount)
+        )
+        
+        if account_id is not None:
+            query = query.filter(movements.c.account_id == account_id)
+        
+        return query.group_by(movements.c.account_id, movements.c.is_processed)
+    
+    def _aggregate_movements(self, user_id: int, account_id: int = None) -> Dict[int, Dict[bool, float]]:
+        """
+        Somme des mouvements par compte et par statut de pointage,
+        calculée en une seule requête GROUP BY
+        """
+        totals: Dict[int, Dict[bool, float]] = {}
+        for row_account_id, is_processed, amount in self.aggregate_query(user_id, account_id).all():
+            totals.setdefault(row_account_id, {})[bool(is_processed)] = amount or 0.0
+        
+        return totals
+    
+    def calculate_account_balance(self, account_id: int, user_id: int, processed_only: bool = False, use_ledger: bool = True) -> float:
         """
         Calcul du solde d'un compte
         processed_only = True : solde RÉEL (transactions pointées)
         processed_only = False : solde À VENIR (toutes les transactions)
+        use_ledger = False : recalcul complet depuis les transactions
         """
         account = self.db.query(Account).filter(
             Account.id == account_id,
@@ -23,33 +78,40 @@ class BalanceCalculator:
         if not account:
             return 0.0
         
-        balance = account.initial_balance
+        if use_ledger:
+            return account.current_balance if processed_only else account.upcoming_balance
         
-        # Requête pour les transactions
-        query = self.db.query(Transaction).filter(
-            Transaction.user_id == user_id
-        )
+        totals = self._aggregate_movements(user_id, account_id).get(account_id, {})
         
-        if processed_only:
-            query = query.filter(Transaction.is_processed == True)
+        # Sommes exactes en base (centimes) ; l'addition en flottants est ramenée au centime
+        balance = account.initial_balance + totals.get(True, 0.0)
+        if not processed_only:
+            balance += totals.get(False, 0.0)
         
-        transactions = query.all()
-        
-        for transaction in transactions:
-            # Si le compte est la source (account_from), on soustrait
-            if transaction.account_from_id == account_id:
-                balance -= transaction.amount
-            # Si le compte est la destination (account_to), on ajoute
-            elif transaction.account_to_id == account_id:
-                balance += transaction.amount
-        
-        return balance
+        return round(balance, 2)
     
-    def calculate_all_balances(self, user_id: int) -> Dict[str, Dict[int, float]]:
+    def calculate_all_balances(self, user_id: int, use_ledger: bool = True) -> Dict[str, Dict[int, float]]:
         """
         Calcul de tous les soldes (RÉEL, À VENIR, ENCOURS) pour tous les comptes
+        use_ledger = True : lecture du registre tenu à jour par BalanceLedger
+        use_ledger = False : recalcul complet depuis les transactions
+        """
+        key = (user_id, use_ledger)
+        if key not in self._balances:
+            if use_ledger:
+                self._balances[key] = self._read_ledger(user_id)
+            else:
+                self._balances[key] = self._recompute_balances(user_id)
+        return self._balances[key]
+    
+    def _recompute_balances(self, user_id: int) -> Dict[str, Dict[int, float]]:
         """
-        accounts = self.db.query(Account).filter(Account.user_id == user_id).all()
+        Recalcul complet des soldes depuis les transactions (une agrégation)
+        """
+        accounts = self.db.query(Account.id, Account.initial_balance).filter(
+            Account.user_id == user_id
+        ).all()
+        totals = self._aggregate_movements(user_id)
         
         balances = {
             "real": {},      # Soldes RÉEL (pointés)
@@ -57,24 +119,49 @@ class BalanceCalculator:
             "pending": {}    # ENCOURS (différence)
         }
         
-        for account in accounts:
-            real_balance = self.calculate_account_balance(account.id, user_id, processed_only=True)
-            upcoming_balance = self.calculate_account_balance(account.id, user_id, processed_only=False)
+        for account_id, initial_balance in accounts:
+            account_totals = totals.get(account_id, {})
+            processed = account_totals.get(True, 0.0)
+            pending = account_totals.get(False, 0.0)
             
-            balances["real"][account.id] = real_balance
-            balances["upcoming"][account.id] = upcoming_balance
-            balances["pending"][account.id] = upcoming_balance - real_balance
+            balances["real"][account_id] = round(initial_balance + processed, 2)
+            balances["upcoming"][account_id] = round(initial_balance + processed + pending, 2)
+            balances["pending"][account_id] = pending
+        
+        return balances
+    
+    def _read_ledger(self, user_id: int) -> Dict[str, Dict[int, float]]:
+        """
+        Lecture des soldes tenus à jour sur les comptes
+        """
+        accounts = self.db.query(
+            Account.id,
+            Account.current_balance,
+            Account.upcoming_balance
+        ).filter(Account.user_id == user_id).all()
+        
+        balances = {"real": {}, "upcoming": {}, "pending": {}}
+        for account_id, real_balance, upcoming_balance in accounts:
+            balances["real"][account_id] = real_balance
+            balances["upcoming"][account_id] = upcoming_balance
+            balances["pending"][account_id] = round(upcoming_balance - real_balance, 2)
         
         return balances
     
     def get_treasury_summary(self, user_id: int) -> Dict[str, float]:
         """
         Résumé de trésorerie globale
+        (dérivé des soldes mémorisés s'ils ont déjà été calculés)
+        """
+        return self.summarize_treasury(self.calculate_all_balances(user_id))
+    
+    @staticmethod
+    def summarize_treasury(balances: Dict[str, Dict[int, float]]) -> Dict[str, float]:
+        """
+        Totaux de trésorerie à partir de soldes déjà calculés
         """
-        balances = self.calculate_all_balances(user_id)
-        
         return {
-            "total_real": sum(balances["real"].values()),
-            "total_upcoming": sum(balances["upcoming"].values()),
-            "total_pending": sum(balances["pending"].values())
+            "total_real": round(sum(balances["real"].values()), 2),
+            "total_upcoming": round(sum(balances["upcoming"].values()), 2),
+            "total_pending": round(sum(balances["pending"].values()), 2)
         }
\ No newline at end of file
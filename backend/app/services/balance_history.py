@@ -0,0 +1,284 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, union_all
+from typing import Dict, List, Optional, Tuple
+from datetime import date, timedelta
+import argparse
+import calendar
+import numpy as np
+from ..core.database import insert_ignoring_conflicts
+from ..models.account import Account
+from ..models.balance_snapshot import BalanceSnapshot
+from ..models.transaction import Transaction
+from ..models.user import User
+
+# Nombre maximal de mois par requête d'historique
+MAX_HISTORY_MONTHS = 120
+
+def month_end(year: int, month: int) -> date:
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+def last_closed_month_end(today: Optional[date] = None) -> date:
+    """
+    Fin du dernier mois entièrement écoulé
+    """
+    today = today or date.today()
+    return today.replace(day=1) - timedelta(days=1)
+
+class BalanceHistory:
+    """
+    Historique des soldes de fin de mois. Les mois écoulés sont figés dans
+    balance_snapshots (un solde RÉEL et À VENIR par compte et par mois) :
+    une série ne relit que ces lignes, plus les transactions postérieures au
+    dernier instantané. Une écriture datée dans le passé supprime les
+    instantanés à partir de sa date ; la lecture reste exacte (mois recalculés
+    en mémoire depuis l'instantané précédent) et ils sont réécrits par la
+    commande update, jamais par une lecture.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _movements(self, user_id: int, after: Optional[date], through: date) -> List[Tuple[int, date, bool, float]]:
+        """
+        Mouvements sommés par (compte, date, pointage) dans ]after, through]
+        """
+        window = (Transaction.user_id == user_id) & (Transaction.date <= through)
+        if after is not None:
+            window &= Transaction.date > after
+        movements = union_all(
+            select(
+                Transaction.account_from_id.label("account_id"),
+                Transaction.date.label("date"),
+                Transaction.is_processed.label("is_processed"),
+                (-Transaction.amount).label("amount")
+            ).where(window),
+            select(
+                Transaction.account_to_id.label("account_id"),
+                Transaction.date.label("date"),
+                Transaction.is_processed.label("is_processed"),
+                Transaction.amount.label("amount")
+            ).where(window)
+        ).subquery("movements")
+        
+        return self.db.query(
+            movements.c.account_id,
+            movements.c.date,
+            movements.c.is_processed,
+            func.sum(movements.c.amount)
+        ).group_by(movements.c.account_id, movements.c.date, movements.c.is_processed).all()
+    
+    def _accumulate(self, accounts: List[int], base: np.ndarray, ends: List[date], movements) -> np.ndarray:
+        """
+        Soldes (réel, à venir) de chaque compte à chaque fin de mois :
+        base + somme cumulée des mouvements répartis par mois
+        Retourne un tableau (2, comptes, mois)
+        """
+        buckets = np.zeros((2, len(accounts), len(ends)))
+        account_index = {account_id: row for row, account_id in enumerate(accounts)}
+        movements = [row for row in movements if row[0] in account_index]
+        if movements:
+            rows = np.array([account_index[account_id] for account_id, _, _, _ in movements])
+            # Premier mois dont la fin est postérieure ou égale à la date du mouvement
+            columns = np.searchsorted(
+                np.array(ends, dtype="datetime64[D]"),
+                np.array([day for _, day, _, _ in movements], dtype="datetime64[D]")
+            )
+            amounts = np.array([amount or 0.0 for _, _, _, amount in movements])
+            processed = np.array([bool(is_processed) for _, _, is_processed, _ in movements])
+            np.add.at(buckets[0], (rows[processed], columns[processed]), amounts[processed])
+            np.add.at(buckets[1], (rows, columns), amounts)
+        return base[:, :, None] + np.cumsum(buckets, axis=2)
+    
+    def _base(self, user_id: int, accounts: List[Tuple[int, float]], period_end: Optional[date]) -> np.ndarray:
+        """
+        Soldes de départ (2, comptes) : instantané de period_end, ou soldes initiaux
+        """
+        initial = [initial_balance or 0.0 for _, initial_balance in accounts]
+        base = np.array([initial, initial], dtype=float)
+        if period_end is None:
+            return base
+        
+        snapshots = {
+            account_id: (real, upcoming)
+            for account_id, real, upcoming in self.db.query(
+                BalanceSnapshot.account_id,
+                BalanceSnapshot.real_balance,
+                BalanceSnapshot.upcoming_balance
+            ).filter(BalanceSnapshot.user_id == user_id, BalanceSnapshot.period_end == period_end).all()
+        }
+        for row, (account_id, _) in enumerate(accounts):
+            if account_id in snapshots:
+                base[:, row] = snapshots[account_id]
+        return base
+    
+    def _accounts(self, user_id: int) -> List[Tuple[int, float]]:
+        return self.db.query(Account.id, Account.initial_balance).filter(
+            Account.user_id == user_id
+        ).order_by(Account.id).all()
+    
+    def _last_snapshot(self, user_id: int) -> Optional[date]:
+        return self.db.query(func.max(BalanceSnapshot.period_end)).filter(
+            BalanceSnapshot.user_id == user_id
+        ).scalar()
+    
+    def extend(self, user_id: int, today: Optional[date] = None) -> int:
+        """
+        Ajout des instantanés manquants jusqu'au dernier mois écoulé, depuis
+        le dernier instantané (ou depuis le mois de la première transaction)
+        Retourne le nombre de lignes insérées ; le commit revient à l'appelant
+        """
+        through = last_closed_month_end(today)
+        last = self._last_snapshot(user_id)
+        if last is not None and last >= through:
+            return 0
+        
+        accounts = self._accounts(user_id)
+        if not accounts:
+            return 0
+        
+        if last is not None:
+            first_index = last.year * 12 + last.month
+        else:
+            first_day = self.db.query(func.min(Transaction.date)).filter(Transaction.user_id == user_id).scalar()
+            first_day = min(first_day or through, through)
+            first_index = first_day.year * 12 + first_day.month - 1
+        last_index = through.year * 12 + through.month - 1
+        ends = [month_end(index // 12, index % 12 + 1) for index in range(first_index, last_index + 1)]
+        
+        account_ids = [account_id for account_id, _ in accounts]
+        balances = np.round(self._accumulate(
+            account_ids,
+            self._base(user_id, accounts, last),
+            ends,
+            self._movements(user_id, last, through)
+        ), 2)
+        
+        rows = [
+            {
+                "account_id": account_id,
+                "period_end": period_end,
+                "user_id": user_id,
+                "real_balance": float(balances[0, row, column]),
+                "upcoming_balance": float(balances[1, row, column])
+            }
+            for row, account_id in enumerate(account_ids)
+            for column, period_end in enumerate(ends)
+        ]
+        # Deux lectures concurrentes peuvent compléter le même mois : doublons ignorés
+        self.db.execute(insert_ignoring_conflicts(self.db, BalanceSnapshot.__table__, ["account_id", "period_end"]), rows)
+        return len(rows)
+    
+    def invalidate_from(self, user_id: int, day: Optional[date] = None) -> None:
+        """
+        Suppression des instantanés couvrant day et les mois suivants
+        (tous les instantanés si day = None)
+        """
+        if day is not None and day > last_closed_month_end():
+            # Mois en cours ou à venir : aucun instantané concerné, pas de requête
+            return
+        query = self.db.query(BalanceSnapshot).filter(BalanceSnapshot.user_id == user_id)
+        if day is not None:
+            query = query.filter(BalanceSnapshot.period_end >= day)
+        query.delete(synchronize_session=False)
+    
+    def shift_initial_balance(self, user_id: int, account_id: int, delta: float) -> None:
+        """
+        Report d'une modification du solde initial sur les instantanés du compte
+        """
+        self.db.query(BalanceSnapshot).filter(
+            BalanceSnapshot.user_id == user_id,
+            BalanceSnapshot.account_id == account_id
+        ).update({
+            BalanceSnapshot.real_balance: BalanceSnapshot.real_balance + delta,
+            BalanceSnapshot.upcoming_balance: BalanceSnapshot.upcoming_balance + delta
+        }, synchronize_session=False)
+    
+    def series(self, user_id: int, periods: List[Tuple[int, int]]) -> Dict:
+        """
+        Soldes de fin de mois de chaque compte pour des périodes (mois, année) :
+        instantanés pour les mois écoulés, instantané le plus récent + transactions
+        suivantes pour les mois sans instantané (en mémoire, sans écriture)
+        """
+        ends = [month_end(year, month) for month, year in periods]
+        result = {
+            "dates": [period_end.isoformat() for period_end in ends],
+            "accounts": {},
+            "total": {"real": [], "upcoming": []}
+        }
+        accounts = self._accounts(user_id)
+        if not accounts or not ends:
+            return result
+        
+        last = self._last_snapshot(user_id)
+        account_ids = [account_id for account_id, _ in accounts]
+        account_index = {account_id: row for row, account_id in enumerate(account_ids)}
+        
+        # Mois antérieurs au premier instantané : aucune transaction, soldes initiaux
+        balances = np.repeat(self._base(user_id, accounts, None)[:, :, None], len(ends), axis=2)
+        
+        stored = [period_end for period_end in ends if last is not None and period_end <= last]
+        if stored:
+            columns = {period_end: column for column, period_end in enumerate(ends)}
+            for account_id, period_end, real, upcoming in self.db.query(
+                BalanceSnapshot.account_id,
+                BalanceSnapshot.period_end,
+                BalanceSnapshot.real_balance,
+                BalanceSnapshot.upcoming_balance
+            ).filter(BalanceSnapshot.user_id == user_id, BalanceSnapshot.period_end.in_(stored)).all():
+                if account_id in account_index:
+                    balances[:, account_index[account_id], columns[period_end]] = (real, upcoming)
+        
+        tail = [column for column, period_end in enumerate(ends) if last is None or period_end > last]
+        if tail:
+            tail_ends = [ends[column] for column in tail]
+            balances[:, :, tail] = self._accumulate(
+                account_ids,
+                self._base(user_id, accounts, last),
+                tail_ends,
+                self._movements(user_id, last, max(tail_ends))
+            )
+        
+        balances = np.round(balances, 2)
+        totals = np.round(balances.sum(axis=1), 2)
+        result["accounts"] = {
+            account_id: {"real": balances[0, row].tolist(), "upcoming": balances[1, row].tolist()}
+            for account_id, row in account_index.items()
+        }
+        result["total"] = {"real": totals[0].tolist(), "upcoming": totals[1].tolist()}
+        return result
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    python -m app.services.balance_history {backfill,update} [--user-id ID]
+    backfill : reconstruction complète ; update : ajout des mois écoulés manquants
+    """
+    from ..core.database import SessionLocal
+    
+    parser = argparse.ArgumentParser(description="Instantanés des soldes de fin de mois")
+    parser.add_argument("command", choices=["backfill", "update"])
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args(argv)
+    
+    db = SessionLocal()
+    try:
+        query = db.query(User.id)
+        if args.user_id is not None:
+            query = query.filter(User.id == args.user_id)
+        user_ids = [user_id for (user_id,) in query.order_by(User.id).all()]
+        
+        history = BalanceHistory(db)
+        row_count = 0
+        for user_id in user_ids:
+            if args.command == "backfill":
+                history.invalidate_from(user_id)
+            row_count += history.extend(user_id)
+            # Un commit par utilisateur : la reprise après interruption repart du dernier instantané
+            db.commit()
+    finally:
+        db.close()
+    
+    print(f"{row_count} snapshots written for {len(user_ids)} users")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
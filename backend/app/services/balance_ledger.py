@@ -0,0 +1,266 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, func, literal, select, union_all, update
+from sqlalchemy.sql.expression import ClauseElement, ColumnElement
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+from ..models.account import Account
+from ..models.transaction import Transaction
+from ..models.user import User
+from .balance_calculator import BalanceCalculator
+
+# Tolérance de rapprochement entre le registre et un recalcul complet
+BALANCE_TOLERANCE = 0.005
+
+# État d'une transaction vu par le registre : (montant, compte source, compte destination, pointée)
+TransactionState = Tuple[float, int, int, bool]
+
+class BalanceLedger:
+    """
+    Registre des soldes par compte : Account.current_balance (RÉEL) et
+    Account.upcoming_balance (À VENIR) sont mis à jour à chaque écriture de
+    transaction au lieu d'être recalculés à chaque lecture.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @staticmethod
+    def snapshot(transaction: Transaction) -> TransactionState:
+        """
+        État d'une transaction avant modification
+        """
+        return (
+            transaction.amount,
+            transaction.account_from_id,
+            transaction.account_to_id,
+            bool(transaction.is_processed)
+        )
+    
+    @staticmethod
+    def transaction_deltas(state: TransactionState, sign: int = 1) -> Dict[int, Tuple[float, float]]:
+        """
+        Variations (réel, à venir) par compte induites par une transaction
+        sign = 1 : application, sign = -1 : annulation
+        """
+        amount, account_from_id, account_to_id, is_processed = state
+        amount = sign * amount
+        real_amount = amount if is_processed else 0.0
+        
+        deltas: Dict[int, Tuple[float, float]] = {}
+        for account_id, factor in ((account_from_id, -1), (account_to_id, 1)):
+            real, upcoming = deltas.get(account_id, (0.0, 0.0))
+            deltas[account_id] = (real + factor * real_amount, upcoming + factor * amount)
+        return deltas
+    
+    @staticmethod
+    def merge_deltas(*changes: Dict[int, Tuple[float, float]]) -> Dict[int, Tuple[float, float]]:
+        """
+        Cumul de plusieurs jeux de variations par compte
+        """
+        deltas: Dict[int, Tuple[float, float]] = {}
+        for change in changes:
+            for account_id, (real, upcoming) in change.items():
+                current_real, current_upcoming = deltas.get(account_id, (0.0, 0.0))
+                deltas[account_id] = (current_real + real, current_upcoming + upcoming)
+        return deltas
+    
+    @staticmethod
+    def state_columns(values: Optional[Dict[str, Any]] = None) -> Tuple:
+        """
+        État d'une transaction en expressions SQL (montant, compte source,
+        compte destination, pointée) ; values : nouvelles valeurs d'un UPDATE
+        {champ: valeur ou expression}, évaluées sur les lignes avant écriture
+        """
+        values = values or {}
+        columns = []
+        for name in ("amount", "account_from_id", "account_to_id", "is_processed"):
+            column = getattr(Transaction, name)
+            if name not in values:
+                columns.append(column)
+            elif isinstance(values[name], ClauseElement):
+                columns.append(values[name])
+            else:
+                columns.append(literal(values[name], column.type))
+        return tuple(columns)
+    
+    def lock_selection(self, selected: ColumnElement) -> Tuple[Optional[ColumnElement], int]:
+        """
+        Verrouillage (FOR UPDATE, par id croissant) des transactions vérifiant
+        la condition, sans rapatrier leurs ids ; retourne la condition bornée au
+        plus grand id verrouillé (les lignes insérées entre-temps en sont exclues)
+        et le nombre de lignes, à comparer au nombre de lignes écrites
+        """
+        locked = select(Transaction.id).where(selected).order_by(Transaction.id).with_for_update().subquery("locked")
+        count, last_id = self.db.query(func.count(), func.max(locked.c.id)).one()
+        if not count:
+            return None, 0
+        return and_(selected, Transaction.id <= last_id), count
+    
+    def selection_deltas(self, selected: ColumnElement, sign: int = 1, values: Optional[Dict[str, Any]] = None) -> Dict[int, Tuple[float, float]]:
+        """
+        Variations (réel, à venir) par compte induites par les transactions
+        vérifiant la condition, agrégées en une seule requête GROUP BY ;
+        values : état après un UPDATE, calculé avant son exécution
+        sign = 1 : application, sign = -1 : annulation
+        """
+        amount, account_from_id, account_to_id, is_processed = self.state_columns(values)
+        movements = union_all(
+            select(
+                account_from_id.label("account_id"),
+                (-amount).label("amount"),
+                is_processed.label("is_processed")
+            ).where(selected),
+            select(
+                account_to_id.label("account_id"),
+                amount.label("amount"),
+                is_processed.label("is_processed")
+            ).where(selected)
+        ).subquery("movements")
+        
+        deltas: Dict[int, Tuple[float, float]] = {}
+        for account_id, is_processed, amount in self.db.query(
+            movements.c.account_id,
+            movements.c.is_processed,
+            func.sum(movements.c.amount)
+        ).group_by(movements.c.account_id, movements.c.is_processed).all():
+            amount = sign * (amount or 0.0)
+            real, upcoming = deltas.get(account_id, (0.0, 0.0))
+            deltas[account_id] = (real + (amount if is_processed else 0.0), upcoming + amount)
+        return deltas
+    
+    def apply_deltas(self, user_id: int, deltas: Dict[int, Tuple[float, float]]) -> None:
+        """
+        Application des variations par un UPDATE relatif, sans relire les soldes
+        """
+        for account_id, (real_delta, upcoming_delta) in deltas.items():
+            if real_delta == 0 and upcoming_delta == 0:
+                continue
+            self.db.query(Account).filter(
+                Account.id == account_id,
+                Account.user_id == user_id
+            ).update({
+                Account.current_balance: Account.current_balance + real_delta,
+                Account.upcoming_balance: Account.upcoming_balance + upcoming_delta
+            }, synchronize_session=False)
+    
+    def apply_bulk_deltas(self, deltas: Dict[Tuple[int, int], Tuple[float, float]]) -> None:
+        """
+        Application groupée des variations de plusieurs utilisateurs, indexées
+        par (utilisateur, compte), en un seul UPDATE exécuté par lot (executemany)
+        """
+        params = [
+            {"target_user_id": user_id, "target_account_id": account_id, "real_delta": real, "upcoming_delta": upcoming}
+            for (user_id, account_id), (real, upcoming) in deltas.items()
+            if real != 0 or upcoming != 0
+        ]
+        if not params:
+            return
+        
+        accounts = Account.__table__
+        self.db.connection().execute(
+            update(accounts).where(
+                accounts.c.id == bindparam("target_account_id"),
+                accounts.c.user_id == bindparam("target_user_id")
+            ).values(
+                current_balance=accounts.c.current_balance + bindparam("real_delta"),
+                upcoming_balance=accounts.c.upcoming_balance + bindparam("upcoming_delta")
+            ),
+            params
+        )
+    
+    def record(self, user_id: int, old: Optional[TransactionState], new: Optional[TransactionState]) -> None:
+        """
+        Enregistrement d'une écriture : old = None pour une création,
+        new = None pour une suppression
+        """
+        changes = []
+        if old is not None:
+            changes.append(self.transaction_deltas(old, -1))
+        if new is not None:
+            changes.append(self.transaction_deltas(new, 1))
+        
+        self.apply_deltas(user_id, self.merge_deltas(*changes))
+    
+    def shift_initial_balance(self, user_id: int, account_id: int, delta: float) -> None:
+        """
+        Report d'une modification du solde initial sur les deux soldes
+        """
+        self.apply_deltas(user_id, {account_id: (delta, delta)})
+    
+    def verify(self, user_id: int) -> List[Dict]:
+        """
+        Rapprochement du registre avec un recalcul complet depuis les transactions
+        Retourne la liste des comptes en écart
+        """
+        expected = BalanceCalculator(self.db).calculate_all_balances(user_id, use_ledger=False)
+        accounts = self.db.query(Account).filter(Account.user_id == user_id).all()
+        
+        mismatches = []
+        for account in accounts:
+            real = expected["real"].get(account.id, 0.0)
+            upcoming = expected["upcoming"].get(account.id, 0.0)
+            if (
+                account.current_balance is None
+                or account.upcoming_balance is None
+                or abs(account.current_balance - real) > BALANCE_TOLERANCE
+                or abs(account.upcoming_balance - upcoming) > BALANCE_TOLERANCE
+            ):
+                mismatches.append({
+                    "account_id": account.id,
+                    "ledger_real": account.current_balance,
+                    "ledger_upcoming": account.upcoming_balance,
+                    "expected_real": real,
+                    "expected_upcoming": upcoming
+                })
+        return mismatches
+    
+    def rebuild(self, user_id: int) -> int:
+        """
+        Reconstruction du registre depuis les transactions
+        Retourne le nombre de comptes mis à jour
+        """
+        expected = BalanceCalculator(self.db).calculate_all_balances(user_id, use_ledger=False)
+        accounts = self.db.query(Account).filter(Account.user_id == user_id).all()
+        
+        for account in accounts:
+            account.current_balance = expected["real"].get(account.id, account.initial_balance)
+            account.upcoming_balance = expected["upcoming"].get(account.id, account.initial_balance)
+        return len(accounts)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    python -m app.services.balance_ledger {verify,rebuild} [--user-id ID]
+    """
+    from ..core.database import SessionLocal
+    
+    parser = argparse.ArgumentParser(description="Vérification / reconstruction du registre des soldes")
+    parser.add_argument("command", choices=["verify", "rebuild"])
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args(argv)
+    
+    db = SessionLocal()
+    try:
+        query = db.query(User.id)
+        if args.user_id is not None:
+            query = query.filter(User.id == args.user_id)
+        user_ids = [user_id for (user_id,) in query.all()]
+        
+        ledger = BalanceLedger(db)
+        mismatch_count = 0
+        for user_id in user_ids:
+            mismatches = ledger.verify(user_id)
+            mismatch_count += len(mismatches)
+            for mismatch in mismatches:
+                print(f"user {user_id}: {mismatch}")
+            if args.command == "rebuild" and mismatches:
+                ledger.rebuild(user_id)
+        
+        if args.command == "rebuild":
+            db.commit()
+        print(f"{len(user_ids)} users checked, {mismatch_count} accounts out of sync")
+        return 1 if args.command == "verify" and mismatch_count else 0
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
@@ -0,0 +1,158 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import date
+from ..core.cache import CacheBackend, get_cache
+from ..models.user import User
+from .budget_calculator import BudgetCalculator
+from .balance_calculator import BalanceCalculator
+from .savings import SavingsCalculator
+
+class BudgetCache:
+    """
+    Cache entre requêtes des vues budget et soldes, par utilisateur :
+    - budget:{user_id}:period:{année}-{mois}:v{data_version} : données d'une période
+    - budget:{user_id}:balances:v{data_version} : soldes de tous les comptes
+    - budget:{user_id}:savings:{date}:v{data_version} : avancement des objectifs d'épargne
+    La version des données de l'utilisateur (bumpée à chaque écriture) fait
+    partie de la clé : après une écriture traitée par un autre worker ou par
+    le planificateur, les entrées de l'ancienne version ne sont plus lues et
+    le résultat servi correspond toujours à l'ETag émis.
+    Les routes d'écriture suppriment en plus les entrées touchées du worker local.
+    """
+    
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self._backend = backend
+    
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend or get_cache()
+    
+    @staticmethod
+    def user_prefix(user_id: int) -> str:
+        return f"budget:{user_id}:"
+    
+    @classmethod
+    def period_prefix(cls, user_id: int, month: int, year: int) -> str:
+        return f"{cls.user_prefix(user_id)}period:{year}-{month:02d}:"
+    
+    @classmethod
+    def balances_prefix(cls, user_id: int) -> str:
+        return f"{cls.user_prefix(user_id)}balances:"
+    
+    @classmethod
+    def savings_prefix(cls, user_id: int) -> str:
+        return f"{cls.user_prefix(user_id)}savings:"
+    
+    @classmethod
+    def period_key(cls, user: User, month: int, year: int) -> str:
+        return f"{cls.period_prefix(user.id, month, year)}v{user.data_version or 0}"
+    
+    @classmethod
+    def balances_key(cls, user: User) -> str:
+        return f"{cls.balances_prefix(user.id)}v{user.data_version or 0}"
+    
+    def budget_for_period(self, calculator: BudgetCalculator, user: User, month: int, year: int) -> Dict:
+        """
+        Données budgétaires d'une période, depuis le cache si possible
+        """
+        key = self.period_key(user, month, year)
+        budget_data = self.backend.get(key)
+        if budget_data is None:
+            budget_data = calculator.calculate_budget_for_period(user.id, month, year)
+            self.backend.set(key, budget_data)
+        return budget_data
+    
+    def budget_for_range(self, calculator: BudgetCalculator, user: User, periods: List[Tuple[int, int]]) -> List[Dict]:
+        """
+        Données et résumés de plusieurs périodes : seules les périodes
+        absentes du cache sont calculées, en une seule agrégation
+        """
+        cached = {period: self.backend.get(self.period_key(user, *period)) for period in periods}
+        missing = [period for period, budget_data in cached.items() if budget_data is None]
+        
+        if missing:
+            for period, result in zip(missing, calculator.calculate_budget_for_range(user.id, missing)):
+                cached[period] = result["budget_data"]
+                self.backend.set(self.period_key(user, *period), result["budget_data"])
+        
+        return [
+            {
+                "budget_data": cached[period],
+                "summary": BudgetCalculator.summarize_budget(cached[period])
+            }
+            for period in periods
+            if cached[period] is not None
+        ]
+    
+    def balances(self, calculator: BalanceCalculator, user: User) -> Dict[str, Dict[int, float]]:
+        """
+        Soldes de tous les comptes, depuis le cache si possible
+        """
+        key = self.balances_key(user)
+        balances = self.backend.get(key)
+        if balances is None:
+            balances = calculator.calculate_all_balances(user.id)
+            self.backend.set(key, balances)
+        return balances
+    
+    def savings_progress(self, calculator: SavingsCalculator, user: User, today: Optional[date] = None) -> List[Dict]:
+        """
+        Avancement des objectifs d'épargne, depuis le cache si possible
+        (la date fait partie de la clé : le rythme récent et l'échéance en dépendent)
+        """
+        today = today or date.today()
+        key = f"{self.savings_prefix(user.id)}{today.isoformat()}:v{user.data_version or 0}"
+        goals = self.backend.get(key)
+        if goals is None:
+            goals = calculator.goal_progress(user.id, today)
+            self.backend.set(key, goals)
+        return goals
+    
+    @staticmethod
+    def periods_containing(user: User, day: date) -> List[Tuple[int, int]]:
+        """
+        Périodes budgétaires (mois, année) contenant une date : selon la date de
+        début, une date peut appartenir à la période du mois précédent ou suivant
+        """
+        calculator = BudgetCalculator(None)
+        periods = []
+        for offset in (-1, 0, 1):
+            index = day.year * 12 + day.month - 1 + offset
+            month, year = index % 12 + 1, index // 12
+            start_date, end_date = calculator.get_budget_period_dates(user, month, year)
+            if start_date <= day <= end_date:
+                periods.append((month, year))
+        return periods
+    
+    def invalidate_transaction_dates(self, user: User, dates: Iterable[date], budget: bool = True) -> None:
+        """
+        Invalidation après écriture de transactions : soldes, et périodes
+        contenant les dates touchées (ancienne et nouvelle date)
+        """
+        self.invalidate_balances(user.id)
+        if not budget:
+            return
+        
+        for day in set(dates):
+            try:
+                periods = self.periods_containing(user, day)
+            except ValueError:
+                # Date de début atypique (jour absent du mois) : invalidation complète
+                self.invalidate_user(user.id)
+                return
+            for month, year in periods:
+                self.backend.delete_prefix(self.period_prefix(user.id, month, year))
+    
+    def invalidate_periods(self, user_id: int, periods: Iterable[Tuple[int, int]]) -> None:
+        """
+        Invalidation de périodes (mois, année) précises (modification des prévisions)
+        """
+        for month, year in set(periods):
+            self.backend.delete_prefix(self.period_prefix(user_id, month, year))
+    
+    def invalidate_balances(self, user_id: int) -> None:
+        self.backend.delete_prefix(self.balances_prefix(user_id))
+    
+    def invalidate_user(self, user_id: int) -> None:
+        self.backend.delete_prefix(self.user_prefix(user_id))
+
+budget_cache = BudgetCache()
\ No newline at end of file
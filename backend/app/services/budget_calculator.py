@@ -1,14 +1,29 @@
 from sqlalchemy.orm import Session
-from typing import Dict, List
+from sqlalchemy import and_, case, func, select, tuple_
+from typing import Dict, List, Tuple
 from datetime import date, datetime, timedelta
 from ..models.user import User
 from ..models.category import Category, CategoryType
 from ..models.transaction import Transaction, TransactionType
 from ..models.budget_forecast import BudgetForecast
+from ..models.memo_item import MemoItem
 
 class BudgetCalculator:
+    """
+    Calculs budgétaires. Une instance est créée par requête : les périodes
+    déjà calculées y sont mémorisées pour ne pas être recalculées (résumé,
+    graphiques). Ne pas réutiliser une instance après une écriture.
+    """
+    
     def __init__(self, db: Session):
         self.db = db
+        self._periods: Dict[Tuple[int, int, int], Dict] = {}
+    
+    def _get_user(self, user_id: int) -> User:
+        """
+        Utilisateur courant, lu dans la session (déjà chargé par get_current_user)
+        """
+        return self.db.get(User, user_id)
     
     def get_budget_period_dates(self, user: User, month: int, year: int) -> tuple[date, date]:
         """
@@ -48,68 +63,230 @@ class BudgetCalculator:
         """
         Calcul du budget pour une période donnée
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
+        key = (user_id, month, year)
+        if key in self._periods:
+            return self._periods[key]
+        
+        user = self._get_user(user_id)
         if not user:
             return {}
         
         start_date, end_date = self.get_budget_period_dates(user, month, year)
         
-        # Récupération des prévisions pour ce mois
-        forecasts = self.db.query(BudgetForecast).filter(
+        # Une seule requête : catégories, prévision de la période (contrainte unique
+        # (user_id, year, month_number, category_id)), montants réels sommés par
+        # catégorie côté base et pense-bêtes du mois
+        real = self.real_query(user_id, start_date, end_date).subquery()
+        query = self.db.query(
+            Category,
+            BudgetForecast.forecasted_amount,
+            real.c.real
+        ).outerjoin(BudgetForecast, and_(
+            BudgetForecast.category_id == Category.id,
             BudgetForecast.user_id == user_id,
+            BudgetForecast.year == year,
             BudgetForecast.month_number == month
-        ).all()
+        )).outerjoin(
+            real, real.c.category_id == Category.id
+        ).filter(Category.user_id == user_id)
+        rows, memo_index = self._with_memos(query, user_id, [month])
         
-        # Récupération des transactions réelles pour cette période
-        transactions = self.db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.date >= start_date,
-            Transaction.date <= end_date
-        ).all()
-        
-        # Calcul par catégorie
-        budget_data = {}
-        categories = self.db.query(Category).filter(Category.user_id == user_id).all()
-        
-        for category in categories:
-            forecast_amount = 0.0
-            for forecast in forecasts:
-                if forecast.category_id == category.id:
-                    forecast_amount = forecast.forecasted_amount
-                    break
-            
-            real_amount = 0.0
-            for transaction in transactions:
-                if transaction.category_id == category.id:
-                    real_amount += transaction.amount
-            
-            variance = real_amount - forecast_amount
-            
-            budget_data[category.id] = {
-                "category_name": category.name,
-                "category_type": category.type.value,
-                "forecasted": forecast_amount,
-                "real": real_amount,
-                "variance": variance,
-                "variance_percent": (variance / forecast_amount * 100) if forecast_amount != 0 else 0
-            }
+        budget_data = {
+            category.id: self._category_budget(category, forecast_amount or 0.0, real_amount or 0.0)
+            for category, forecast_amount, real_amount in rows
+        }
         
-        return {
+        self._periods[key] = {
             "period": {
                 "start_date": start_date,
                 "end_date": end_date,
                 "month": month,
                 "year": year
             },
-            "categories": budget_data
+            "categories": budget_data,
+            "memo": memo_index.get(month, {"unpaid": 0.0, "count": 0})
         }
+        return self._periods[key]
+    
+    def _with_memos(self, query, user_id: int, months: List[int]) -> Tuple[List[tuple], Dict[int, Dict]]:
+        """
+        Lignes d'une requête sur les catégories et pense-bêtes non payés des mois
+        demandés (montant et nombre, par mois) lus dans la même requête : les
+        agrégats des pense-bêtes sont des sous-requêtes scalaires ajoutées à ses colonnes.
+        Un pense-bête n'a pas d'année : il vaut pour le mois de chaque année.
+        Sans catégorie, la requête ne renvoie aucune ligne : les agrégats sont
+        alors lus seuls, les pense-bêtes restent comptés
+        """
+        columns = []
+        for month in months:
+            unpaid = (MemoItem.user_id == user_id, MemoItem.is_paid.isnot(True), MemoItem.month_number == month)
+            columns.append(select(func.coalesce(func.sum(MemoItem.amount), 0)).where(*unpaid).scalar_subquery())
+            columns.append(select(func.count(MemoItem.id)).where(*unpaid).scalar_subquery())
+        
+        rows = query.add_columns(*columns).all()
+        width = len(columns)
+        if rows:
+            totals = rows[0][-width:]
+        else:
+            totals = self.db.execute(select(*columns)).one()
+        return [tuple(row[:-width]) for row in rows], {
+            month: {"unpaid": totals[2 * index] or 0.0, "count": totals[2 * index + 1]}
+            for index, month in enumerate(months)
+        }
+    
+    def _forecast_index(self, user_id: int, periods: List[Tuple[int, int]]) -> Dict[Tuple[int, int, int], float]:
+        """
+        Prévisions des périodes (mois, année) demandées, indexées par
+        (année, mois, catégorie) ; lues par la contrainte unique
+        (user_id, year, month_number, category_id)
+        """
+        forecasts = self.db.query(
+            BudgetForecast.year,
+            BudgetForecast.month_number,
+            BudgetForecast.category_id,
+            BudgetForecast.forecasted_amount
+        ).filter(
+            BudgetForecast.user_id == user_id,
+            tuple_(BudgetForecast.year, BudgetForecast.month_number).in_([(year, month) for month, year in periods])
+        ).all()
+        
+        return {
+            (year, month_number, category_id): forecasted_amount or 0.0
+            for year, month_number, category_id, forecasted_amount in forecasts
+        }
+    
+    @staticmethod
+    def _category_budget(category: Category, forecast_amount: float, real_amount: float) -> Dict:
+        """
+        Ligne budgétaire d'une catégorie (prévu, réel, écart)
+        """
+        variance = round(real_amount - forecast_amount, 2)
+        
+        return {
+            "category_name": category.name,
+            "category_type": category.type.value,
+            "forecasted": forecast_amount,
+            "real": real_amount,
+            "variance": variance,
+            "variance_percent": (variance / forecast_amount * 100) if forecast_amount != 0 else 0
+        }
+    
+    def calculate_budget_for_range(self, user_id: int, periods: List[Tuple[int, int]]) -> List[Dict]:
+        """
+        Calcul du budget pour plusieurs périodes (mois, année) en une seule
+        agrégation des transactions par période et par catégorie
+        """
+        user = self._get_user(user_id)
+        if not user or not periods:
+            return []
+        
+        bounds = [self.get_budget_period_dates(user, month, year) for month, year in periods]
+        
+        # Prévisions des périodes concernées, indexées par (année, mois, catégorie)
+        forecast_index = self._forecast_index(user_id, periods)
+        rows, memo_index = self._with_memos(
+            self.db.query(Category).filter(Category.user_id == user_id),
+            user_id,
+            sorted({month for month, _ in periods})
+        )
+        categories = [category for category, in rows]
+        
+        real_index = self.real_by_period(user_id, bounds)
+        
+        results = []
+        for index, ((month, year), (start_date, end_date)) in enumerate(zip(periods, bounds)):
+            budget_data = {
+                "period": {
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "month": month,
+                    "year": year
+                },
+                "categories": {
+                    category.id: self._category_budget(
+                        category,
+                        forecast_index.get((year, month, category.id), 0.0),
+                        real_index.get((index, category.id), 0.0)
+                    )
+                    for category in categories
+                },
+                "memo": memo_index.get(month, {"unpaid": 0.0, "count": 0})
+            }
+            self._periods[(user_id, month, year)] = budget_data
+            results.append({
+                "budget_data": budget_data,
+                "summary": self.summarize_budget(budget_data)
+            })
+        
+        return results
+    
+    def real_query(self, user_id: int, start_date: date, end_date: date):
+        """
+        Requête des montants réels d'une période sommés par catégorie
+        """
+        return self.db.query(
+            Transaction.category_id,
+            func.sum(Transaction.amount).label("real")
+        ).filter(
+            Transaction.user_id == user_id,
+            Transaction.date >= start_date,
+            Transaction.date <= end_date
+        ).group_by(Transaction.category_id)
+    
+    def real_by_period_query(self, user_id: int, bounds: List[Tuple[date, date]]):
+        """
+        Requête des montants réels de plusieurs périodes : (rang de la période, catégorie, somme)
+        """
+        bucket = case(
+            *[
+                (and_(Transaction.date >= start_date, Transaction.date <= end_date), index)
+                for index, (start_date, end_date) in enumerate(bounds)
+            ],
+            else_=None
+        )
+        bucketed = self.db.query(
+            bucket.label("period_index"),
+            Transaction.category_id.label("category_id"),
+            Transaction.amount.label("amount")
+        ).filter(
+            Transaction.user_id == user_id,
+            Transaction.date >= min(start_date for start_date, _ in bounds),
+            Transaction.date <= max(end_date for _, end_date in bounds)
+        ).subquery()
+        
+        return self.db.query(
+            bucketed.c.period_index,
+            bucketed.c.category_id,
+            func.sum(bucketed.c.amount)
+        ).group_by(bucketed.c.period_index, bucketed.c.category_id)
+    
+    def real_by_period(self, user_id: int, bounds: List[Tuple[date, date]]) -> Dict[Tuple[int, int], float]:
+        """
+        Montants réels indexés par (rang de la période dans bounds, catégorie) :
+        transactions rattachées à leur période puis sommées en une seule agrégation
+        """
+        if not bounds:
+            return {}
+        
+        real_index = {}
+        for period_index, category_id, real_amount in self.real_by_period_query(user_id, bounds).all():
+            if period_index is not None:
+                real_index[(period_index, category_id)] = real_amount or 0.0
+        return real_index
     
     def get_budget_summary(self, user_id: int, month: int, year: int) -> Dict:
         """
         Résumé budgétaire par type de catégorie
+        (dérivé de la période mémorisée si elle a déjà été calculée)
         """
         budget_data = self.calculate_budget_for_period(user_id, month, year)
-        
+        return self.summarize_budget(budget_data)
+    
+    @staticmethod
+    def summarize_budget(budget_data: Dict) -> Dict:
+        """
+        Agrégation par type de catégorie de données budgétaires déjà calculées
+        """
         summary = {
             "revenus": {"forecasted": 0, "real": 0, "variance": 0},
             "factures": {"forecasted": 0, "real": 0, "variance": 0},
@@ -124,4 +301,13 @@ class BudgetCalculator:
                 summary[cat_type]["real"] += category_data["real"]
                 summary[cat_type]["variance"] += category_data["variance"]
         
+        # Montants au centime : les sommes de flottants ne laissent pas de résidu
+        for totals in summary.values():
+            for key in totals:
+                totals[key] = round(totals[key], 2)
+        
+        # Pense-bêtes non payés du mois, hors totaux par type (absents des entrées en cache antérieures)
+        memo = budget_data.get("memo") or {"unpaid": 0.0, "count": 0}
+        summary["memo"] = {"unpaid": round(memo["unpaid"], 2), "count": memo["count"]}
+        
         return summary
\ No newline at end of file
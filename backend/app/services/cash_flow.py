@@ -0,0 +1,175 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, union_all
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+import calendar
+import numpy as np
+from ..models.account import Account
+from ..models.category import CategoryType
+from ..models.savings_allocation import SavingsAllocation
+from ..models.transaction import Transaction
+from ..models.user import User
+from .balance_calculator import BalanceCalculator
+from .budget_calculator import BudgetCalculator
+
+# Horizon maximal de projection, en mois
+MAX_PROJECTION_MONTHS = 24
+
+def add_months(day: date, months: int) -> date:
+    """
+    Même jour N mois plus tard (ramené au dernier jour du mois si besoin)
+    """
+    index = day.year * 12 + day.month - 1 + months
+    year, month = index // 12, index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+class CashFlowProjector:
+    """
+    Projection jour par jour des soldes de chaque compte :
+    solde RÉEL du jour + transactions non pointées à leur date
+    + reste à consommer des prévisions, réparti uniformément sur les jours
+    restants de chaque période budgétaire, et pense-bêtes non payés, répartis
+    sur la période en cours seulement (sans année, ils ne comptent qu'une fois).
+    Les séries sont obtenues par sommes cumulées (numpy), sans boucle par jour.
+    """
+    
+    def __init__(self, db: Session, cache=None):
+        self.db = db
+        self.cache = cache  # BudgetCache optionnel pour les périodes et soldes
+        self.budget_calculator = BudgetCalculator(db)
+        self.balance_calculator = BalanceCalculator(db)
+    
+    def _real_balances(self, user: User) -> Dict[int, float]:
+        if self.cache is not None:
+            return self.cache.balances(self.balance_calculator, user)["real"]
+        return self.balance_calculator.calculate_all_balances(user.id)["real"]
+    
+    def _budget_periods(self, user: User, start: date, end: date) -> List[Dict]:
+        """
+        Données budgétaires (prévu, réel) des périodes chevauchant [start, end]
+        """
+        periods = []
+        first = start.year * 12 + start.month - 2
+        last = end.year * 12 + end.month
+        for index in range(first, last + 1):
+            month, year = index % 12 + 1, index // 12
+            period_start, period_end = self.budget_calculator.get_budget_period_dates(user, month, year)
+            if period_end >= start and period_start <= end:
+                periods.append((month, year))
+        
+        if self.cache is not None:
+            results = self.cache.budget_for_range(self.budget_calculator, user, periods)
+        else:
+            results = self.budget_calculator.calculate_budget_for_range(user.id, periods)
+        return [result["budget_data"] for result in results]
+    
+    def _scheduled_movements(self, user_id: int, end: date) -> List[Tuple[int, date, float]]:
+        """
+        Mouvements non pointés jusqu'à end, sommés par (compte, date)
+        """
+        pending = (Transaction.user_id == user_id) & Transaction.is_processed.isnot(True) & (Transaction.date <= end)
+        movements = union_all(
+            select(
+                Transaction.account_from_id.label("account_id"),
+                Transaction.date.label("date"),
+                (-Transaction.amount).label("amount")
+            ).where(pending),
+            select(
+                Transaction.account_to_id.label("account_id"),
+                Transaction.date.label("date"),
+                Transaction.amount.label("amount")
+            ).where(pending)
+        ).subquery("movements")
+        
+        return self.db.query(
+            movements.c.account_id,
+            movements.c.date,
+            func.sum(movements.c.amount)
+        ).group_by(movements.c.account_id, movements.c.date).all()
+    
+    def project(self, user_id: int, months: int, start: Optional[date] = None) -> Dict:
+        """
+        Séries de soldes projetés de start (aujourd'hui par défaut) à start + months mois
+        """
+        start = start or date.today()
+        end = add_months(start, months)
+        day_count = (end - start).days + 1
+        
+        user = self.db.get(User, user_id)
+        accounts = self.db.query(Account.id, Account.is_main_account).filter(
+            Account.user_id == user_id
+        ).order_by(Account.id).all()
+        
+        result = {
+            "start_date": start,
+            "end_date": end,
+            "dates": np.arange(np.datetime64(start), np.datetime64(end) + 1).astype(str).tolist(),
+            "main_account_id": None,
+            "accounts": {},
+            "total": []
+        }
+        if not user or not accounts:
+            return result
+        
+        account_index = {account_id: row for row, (account_id, _) in enumerate(accounts)}
+        main_account_id = next((account_id for account_id, is_main in accounts if is_main), accounts[0][0])
+        result["main_account_id"] = main_account_id
+        
+        real_balances = self._real_balances(user)
+        opening = np.array([real_balances.get(account_id, 0.0) for account_id, _ in accounts])
+        
+        # Mouvements ponctuels (une colonne par jour) ; les non pointés passés comptent dès aujourd'hui
+        movements = np.zeros((len(accounts), day_count))
+        scheduled = [row for row in self._scheduled_movements(user_id, end) if row[0] in account_index]
+        if scheduled:
+            rows = np.array([account_index[account_id] for account_id, _, _ in scheduled])
+            days = (np.array([day for _, day, _ in scheduled], dtype="datetime64[D]") - np.datetime64(start)).astype(int)
+            np.add.at(movements, (rows, np.clip(days, 0, None)), np.array([amount or 0.0 for _, _, amount in scheduled]))
+        
+        # Prévisions : débit journalier posé en début d'intervalle et retiré après sa fin (tableau de différences)
+        allocations = dict(self.db.query(SavingsAllocation.category_id, SavingsAllocation.account_id).filter(
+            SavingsAllocation.user_id == user_id
+        ).all())
+        rates = np.zeros((len(accounts), day_count + 1))
+        main_row = account_index[main_account_id]
+        
+        for budget_data in self._budget_periods(user, start, end):
+            period = budget_data["period"]
+            first_day = max(period["start_date"], start)
+            remaining_days = (period["end_date"] - first_day).days + 1
+            first = (first_day - start).days
+            stop = min((period["end_date"] - start).days, day_count - 1) + 1
+            
+            for category_id, category in budget_data["categories"].items():
+                remaining = category["forecasted"] - category["real"]
+                if remaining <= 0:
+                    continue
+                rate = remaining / remaining_days
+                
+                if category["category_type"] == CategoryType.REVENUE.value:
+                    targets = [(main_row, rate)]
+                else:
+                    targets = [(main_row, -rate)]
+                    # Épargne : le montant quitte le compte principal vers le compte d'affectation
+                    savings_account = allocations.get(int(category_id))
+                    if category["category_type"] == CategoryType.SAVINGS.value and savings_account in account_index:
+                        targets.append((account_index[savings_account], rate))
+                
+                for row, daily in targets:
+                    rates[row, first] += daily
+                    rates[row, stop] -= daily
+            
+            # Pense-bêtes non payés : sortie du compte principal sur la période en cours ;
+            # un pense-bête n'a pas d'année, il n'est pas répété sur les mêmes mois des années suivantes
+            memo = budget_data.get("memo") or {"unpaid": 0.0}
+            if memo["unpaid"] > 0 and period["start_date"] <= start <= period["end_date"]:
+                daily = memo["unpaid"] / remaining_days
+                rates[main_row, first] -= daily
+                rates[main_row, stop] += daily
+        
+        daily_flows = movements + np.cumsum(rates, axis=1)[:, :day_count]
+        balances = np.round(opening[:, None] + np.cumsum(daily_flows, axis=1), 2)
+        
+        result["accounts"] = {account_id: balances[row].tolist() for account_id, row in account_index.items()}
+        result["total"] = np.round(balances.sum(axis=0), 2).tolist()
+        return result
\ No newline at end of file
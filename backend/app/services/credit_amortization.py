@@ -0,0 +1,195 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from typing import Dict, Optional
+from datetime import date
+import numpy as np
+from ..models.category import Category
+from ..models.credit_detail import CreditDetail
+from ..models.transaction import Transaction, TransactionType
+from .cash_flow import add_months
+
+def annuity_payment(borrowed_amount: float, interest_rate: float, duration_months: int) -> float:
+    """
+    Mensualité constante d'un prêt (taux annuel en %)
+    """
+    rate = interest_rate / 100 / 12
+    if rate == 0:
+        return round(borrowed_amount / duration_months, 2)
+    return round(borrowed_amount * rate / (1 - (1 + rate) ** -duration_months), 2)
+
+def amortization_schedules(borrowed: np.ndarray, interest_rates: np.ndarray, payments: np.ndarray, durations: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Tableaux d'amortissement de plusieurs crédits à la fois : une ligne par
+    crédit, une colonne par échéance (jusqu'à la plus longue durée, zéros au-delà).
+    Le capital restant dû suit la formule fermée B(1+r)^t - P((1+r)^t - 1)/r ;
+    la dernière échéance solde le capital restant.
+    Retourne payment, interest, principal et balance (capital restant après l'échéance)
+    """
+    rates = interest_rates / 100 / 12
+    months = np.arange(1, max(int(durations.max(initial=0)), 1) + 1)[None, :]
+    growth = (1 + rates[:, None]) ** months
+    safe_rates = np.where(rates > 0, rates, 1.0)[:, None]
+    closed_form = np.where(
+        rates[:, None] > 0,
+        borrowed[:, None] * growth - payments[:, None] * (growth - 1) / safe_rates,
+        borrowed[:, None] - payments[:, None] * months
+    )
+    
+    # Capital restant avant chaque échéance (nul après la dernière)
+    previous = np.hstack([borrowed[:, None], np.clip(closed_form, 0, None)[:, :-1]])
+    previous[months > durations[:, None]] = 0.0
+    interest = previous * rates[:, None]
+    payment = np.minimum(payments[:, None], previous + interest)
+    last = months == durations[:, None]
+    payment[last] = (previous + interest)[last]
+    
+    return {
+        "payment": payment,
+        "interest": interest,
+        "principal": payment - interest,
+        "balance": previous + interest - payment
+    }
+
+class CreditAmortization:
+    """
+    Suivi des crédits : tableaux d'amortissement calculés pour tous les crédits
+    d'un utilisateur en une passe (numpy), rapprochement du montant déjà
+    remboursé avec les transactions « factures » pointées des catégories de
+    crédit, capital restant dû et date de fin.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _repayments(self, user_id: int) -> Dict[int, tuple]:
+        """
+        Remboursements pointés par catégorie de crédit : (montant, nombre, dernière date)
+        """
+        rows = self.db.query(
+            Transaction.category_id,
+            func.sum(Transaction.amount),
+            func.count(Transaction.id),
+            func.max(Transaction.date)
+        ).join(Category, Category.id == Transaction.category_id).filter(
+            Transaction.user_id == user_id,
+            Transaction.type == TransactionType.BILL,
+            Transaction.is_processed == True,
+            Category.is_credit == True
+        ).group_by(Transaction.category_id).all()
+        return {category_id: (amount or 0.0, count, last_date) for category_id, amount, count, last_date in rows}
+    
+    def overview(self, user_id: int, include_schedules: bool = False, today: Optional[date] = None) -> Dict:
+        """
+        Situation de chaque crédit et totaux (capital restant, mensualités en cours, fin)
+        """
+        today = today or date.today()
+        credits = self.db.query(CreditDetail, Category.name).join(
+            Category, Category.id == CreditDetail.category_id
+        ).filter(CreditDetail.user_id == user_id).order_by(CreditDetail.id).all()
+        
+        result = {
+            "credits": [],
+            "total_borrowed": 0.0,
+            "total_outstanding": 0.0,
+            "total_remaining_to_pay": 0.0,
+            "monthly_burden": 0.0,
+            "payoff_date": None
+        }
+        if not credits:
+            return result
+        
+        details = [credit for credit, _ in credits]
+        payments = np.array([credit.monthly_payment for credit in details], dtype=float)
+        durations = np.array([credit.duration_months for credit in details], dtype=int)
+        schedules = amortization_schedules(
+            np.array([credit.borrowed_amount for credit in details], dtype=float),
+            np.array([credit.interest_rate or 0.0 for credit in details], dtype=float),
+            payments,
+            durations
+        )
+        
+        # Remboursements d'une catégorie partagés entre ses crédits au prorata des mensualités
+        repayments = self._repayments(user_id)
+        category_payments: Dict[int, float] = {}
+        for credit in details:
+            category_payments[credit.category_id] = category_payments.get(credit.category_id, 0.0) + credit.monthly_payment
+        transactions_repaid = np.array([
+            repayments.get(credit.category_id, (0.0, 0, None))[0] * credit.monthly_payment / category_payments[credit.category_id]
+            if category_payments[credit.category_id] else 0.0
+            for credit in details
+        ])
+        already_repaid = np.array([credit.already_repaid or 0.0 for credit in details], dtype=float)
+        
+        # Montant saisi pour l'historique antérieur ; les transactions prennent le relais s'il est dépassé
+        repaid = np.maximum(already_repaid, transactions_repaid)
+        cumulative_paid = np.cumsum(schedules["payment"], axis=1)
+        payments_made = np.minimum((cumulative_paid <= repaid[:, None] + 0.005).sum(axis=1), durations)
+        remaining_payments = durations - payments_made
+        
+        columns = np.arange(schedules["payment"].shape[1])[None, :]
+        remaining = columns >= payments_made[:, None]
+        outstanding = np.where(
+            payments_made > 0,
+            schedules["balance"][np.arange(len(details)), np.maximum(payments_made - 1, 0)],
+            np.array([credit.borrowed_amount for credit in details], dtype=float)
+        )
+        remaining_to_pay = (schedules["payment"] * remaining).sum(axis=1)
+        remaining_interest = (schedules["interest"] * remaining).sum(axis=1)
+        total_interest = schedules["interest"].sum(axis=1)
+        
+        for row, (credit, category_name) in enumerate(credits):
+            last_date = repayments.get(credit.category_id, (0.0, 0, None))[2]
+            # Prochaine échéance : un mois après le dernier remboursement pointé, sinon ce mois-ci
+            next_payment = add_months(last_date, 1) if last_date else today
+            first_payment = add_months(next_payment, -int(payments_made[row]))
+            payoff_date = add_months(next_payment, int(remaining_payments[row]) - 1) if remaining_payments[row] else None
+            
+            entry = {
+                "id": credit.id,
+                "category_id": credit.category_id,
+                "category_name": category_name,
+                "borrowed_amount": credit.borrowed_amount,
+                "interest_rate": credit.interest_rate,
+                "duration_months": credit.duration_months,
+                "monthly_payment": credit.monthly_payment,
+                "interest_amount": credit.interest_amount,
+                "schedule_interest": round(float(total_interest[row]), 2),
+                "already_repaid": float(already_repaid[row]),
+                "transactions_repaid": round(float(transactions_repaid[row]), 2),
+                "repaid_difference": round(float(transactions_repaid[row] - already_repaid[row]), 2),
+                "payments_made": int(payments_made[row]),
+                "remaining_payments": int(remaining_payments[row]),
+                "outstanding_principal": round(float(outstanding[row]), 2),
+                "remaining_to_pay": round(float(remaining_to_pay[row]), 2),
+                "remaining_interest": round(float(remaining_interest[row]), 2),
+                "next_payment_date": next_payment if remaining_payments[row] else None,
+                "payoff_date": payoff_date
+            }
+            if include_schedules:
+                count = int(durations[row])
+                entry["schedule"] = [
+                    {
+                        "number": index + 1,
+                        "date": add_months(first_payment, index),
+                        "payment": payment,
+                        "interest": interest,
+                        "principal": principal,
+                        "balance": balance
+                    }
+                    for index, (payment, interest, principal, balance) in enumerate(zip(
+                        np.round(schedules["payment"][row, :count], 2).tolist(),
+                        np.round(schedules["interest"][row, :count], 2).tolist(),
+                        np.round(schedules["principal"][row, :count], 2).tolist(),
+                        np.round(schedules["balance"][row, :count], 2).tolist()
+                    ))
+                ]
+            result["credits"].append(entry)
+        
+        active = remaining_payments > 0
+        payoff_dates = [entry["payoff_date"] for entry in result["credits"] if entry["payoff_date"]]
+        result["total_borrowed"] = round(float(sum(credit.borrowed_amount for credit in details)), 2)
+        result["total_outstanding"] = round(float(outstanding.sum()), 2)
+        result["total_remaining_to_pay"] = round(float(remaining_to_pay.sum()), 2)
+        result["monthly_burden"] = round(float(payments[active].sum()), 2)
+        result["payoff_date"] = max(payoff_dates) if payoff_dates else None
+        return result
\ No newline at end of file
@@ -0,0 +1,137 @@
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+import csv
+import io
+import json
+from ..models.account import Account
+from ..models.category import Category
+from ..models.transaction import Transaction
+from .budget_calculator import BudgetCalculator
+
+# Nombre de lignes lues par aller-retour avec le curseur serveur, et écrites par bloc
+EXPORT_BATCH_SIZE = 1000
+
+# Nombre de périodes calculées par agrégation lors de l'export du budget
+EXPORT_PERIODS_PER_CHUNK = 12
+
+# Colonnes reconnues par l'import (TransactionImporter) : un export peut être réimporté
+TRANSACTION_COLUMNS = ["id", "is_processed", "date", "amount", "type", "category", "account_from", "account_to", "description"]
+
+BUDGET_COLUMNS = ["period", "start_date", "end_date", "category_type", "category", "forecasted", "real", "variance", "variance_percent"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson"
+}
+
+def csv_chunks(columns: List[str], rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Lignes CSV regroupées par blocs de EXPORT_BATCH_SIZE
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def ndjson_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Un objet JSON par ligne, regroupés par blocs de EXPORT_BATCH_SIZE
+    """
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str, ensure_ascii=False))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+def stream_rows(export_format: str, columns: List[str], rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    if export_format == "ndjson":
+        return ndjson_chunks(rows)
+    return csv_chunks(columns, rows)
+
+class ReportExporter:
+    """
+    Exports en flux : les transactions sont lues par un curseur serveur
+    (yield_per) sous forme de tuples de colonnes, sans objets ORM, et le
+    budget est calculé par tranches de périodes. La mémoire consommée ne
+    dépend pas de la taille de l'historique.
+    """
+    
+    def __init__(self, db: Session, user_id: int):
+        self.db = db
+        self.user_id = user_id
+    
+    def transaction_query(self):
+        """
+        Requête de base de l'export (colonnes seules), à filtrer par l'appelant
+        """
+        return self.db.query(
+            Transaction.id,
+            Transaction.is_processed,
+            Transaction.date,
+            Transaction.amount,
+            Transaction.type,
+            Transaction.category_id,
+            Transaction.account_from_id,
+            Transaction.account_to_id,
+            Transaction.description
+        ).filter(Transaction.user_id == self.user_id)
+    
+    def _names(self, model) -> Dict[int, str]:
+        return dict(self.db.query(model.id, model.name).filter(model.user_id == self.user_id).all())
+    
+    def transaction_rows(self, query) -> Iterator[Dict[str, Any]]:
+        """
+        Lignes d'export des transactions, par date croissante
+        (catégories et comptes exportés par leur nom)
+        """
+        categories = self._names(Category)
+        accounts = self._names(Account)
+        
+        rows = query.order_by(Transaction.date, Transaction.id).yield_per(EXPORT_BATCH_SIZE)
+        for (transaction_id, is_processed, transaction_date, amount, transaction_type,
+                category_id, account_from_id, account_to_id, description) in rows:
+            yield {
+                "id": transaction_id,
+                "is_processed": bool(is_processed),
+                "date": transaction_date.isoformat(),
+                "amount": amount,
+                "type": transaction_type.value,
+                "category": categories.get(category_id, ""),
+                "account_from": accounts.get(account_from_id, ""),
+                "account_to": accounts.get(account_to_id, ""),
+                "description": description
+            }
+    
+    def budget_rows(self, periods: List[Tuple[int, int]]) -> Iterator[Dict[str, Any]]:
+        """
+        Lignes du rapport budgétaire (une par période et par catégorie),
+        calculées par tranches de EXPORT_PERIODS_PER_CHUNK périodes
+        """
+        for offset in range(0, len(periods), EXPORT_PERIODS_PER_CHUNK):
+            # Nouvelle instance par tranche : la mémoïsation du calculateur ne s'accumule pas
+            calculator = BudgetCalculator(self.db)
+            chunk = periods[offset:offset + EXPORT_PERIODS_PER_CHUNK]
+            for result in calculator.calculate_budget_for_range(self.user_id, chunk):
+                period = result["budget_data"]["period"]
+                for category in result["budget_data"]["categories"].values():
+                    yield {
+                        "period": f"{period['year']:04d}-{period['month']:02d}",
+                        "start_date": period["start_date"].isoformat(),
+                        "end_date": period["end_date"].isoformat(),
+                        "category_type": category["category_type"],
+                        "category": category["category_name"],
+                        "forecasted": category["forecasted"],
+                        "real": category["real"],
+                        "variance": category["variance"],
+                        "variance_percent": category["variance_percent"]
+                    }
\ No newline at end of file
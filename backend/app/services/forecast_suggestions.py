@@ -0,0 +1,126 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from datetime import date
+import numpy as np
+from ..models.budget_forecast import BudgetForecast
+from ..models.category import Category
+from ..models.user import User
+from .budget_calculator import BudgetCalculator
+
+# Nombre de périodes d'historique analysées (une année : valeur saisonnière de chaque mois)
+HISTORY_PERIODS = 12
+
+# Fenêtre par défaut des moyennes / médianes glissantes
+DEFAULT_WINDOW = 3
+
+SUGGESTION_METHODS = ("mean", "median", "seasonal")
+
+class ForecastSuggester:
+    """
+    Propositions de prévisions à partir de l'historique : moyenne et médiane
+    des N dernières périodes budgétaires actives, et valeur du même mois de
+    l'année précédant l'année cible, pour chaque catégorie. Les 12 périodes
+    écoulées et celles de l'année précédente sont agrégées en une seule requête
+    (transactions rattachées à leur période), puis les statistiques sont
+    calculées sur une matrice catégories x périodes.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.budget_calculator = BudgetCalculator(db)
+    
+    def _history(self, today: date) -> List[tuple]:
+        """
+        HISTORY_PERIODS périodes (mois, année) précédant la période du mois courant
+        """
+        current = today.year * 12 + today.month - 1
+        return [(index % 12 + 1, index // 12) for index in range(current - HISTORY_PERIODS, current)]
+    
+    def _seasonal_history(self, year: int, today: date) -> List[tuple]:
+        """
+        Périodes (mois, year - 1) déjà écoulées : valeur saisonnière de chaque mois de year
+        """
+        current = today.year * 12 + today.month - 1
+        return [(month, year - 1) for month in range(1, 13) if (year - 1) * 12 + month - 1 < current]
+    
+    def suggest(self, user_id: int, year: int, window: int = DEFAULT_WINDOW, method: str = "mean", today: Optional[date] = None) -> Dict:
+        """
+        Propositions pour les 12 mois de year et toutes les catégories de l'utilisateur
+        method : statistique retenue comme proposition (mean, median ou seasonal)
+        """
+        today = today or date.today()
+        periods = self._history(today)
+        seasonal_periods = self._seasonal_history(year, today)
+        result = {
+            "year": year,
+            "method": method,
+            "window": window,
+            "history": [{"month": month, "year": year} for month, year in periods],
+            "seasonal_history": [{"month": month, "year": year} for month, year in seasonal_periods],
+            "suggestions": []
+        }
+        
+        user = self.db.get(User, user_id)
+        categories = self.db.query(Category.id, Category.name, Category.type).filter(
+            Category.user_id == user_id
+        ).order_by(Category.type, Category.sort_order, Category.id).all()
+        if not user or not categories:
+            return result
+        
+        # Historique glissant, puis mois de l'année précédente qui n'en font pas partie
+        aggregated = periods + [period for period in seasonal_periods if period not in periods]
+        bounds = [self.budget_calculator.get_budget_period_dates(user, month, year) for month, year in aggregated]
+        real_index = self.budget_calculator.real_by_period(user_id, bounds)
+        
+        category_index = {category_id: row for row, (category_id, _, _) in enumerate(categories)}
+        amounts = np.zeros((len(categories), len(aggregated)))
+        for (period_index, category_id), amount in real_index.items():
+            if category_id in category_index:
+                amounts[category_index[category_id], period_index] = amount
+        
+        # Périodes sans aucune transaction (avant les débuts de l'utilisateur) : hors statistiques
+        active = np.zeros(len(aggregated), dtype=bool)
+        for period_index, _ in real_index:
+            active[period_index] = True
+        recent = amounts[:, np.flatnonzero(active[:len(periods)])[-window:]]
+        if recent.shape[1]:
+            means = np.round(recent.mean(axis=1), 2)
+            medians = np.round(np.median(recent, axis=1), 2)
+        else:
+            means = medians = np.zeros(len(categories))
+        
+        current = {
+            (month_number, category_id): amount or 0.0
+            for month_number, category_id, amount in self.db.query(
+                BudgetForecast.month_number,
+                BudgetForecast.category_id,
+                BudgetForecast.forecasted_amount
+            ).filter(BudgetForecast.user_id == user_id, BudgetForecast.year == year).all()
+        }
+        
+        # Colonne du même mois de l'année précédente, si elle est écoulée et active
+        columns = {period: column for column, period in enumerate(aggregated)}
+        for month_number in range(1, 13):
+            column = columns.get((month_number, year - 1))
+            if column is not None and not active[column]:
+                column = None
+            for row, (category_id, name, category_type) in enumerate(categories):
+                seasonal = round(float(amounts[row, column]), 2) if column is not None else None
+                statistics = {
+                    "mean": float(means[row]),
+                    "median": float(medians[row]),
+                    "seasonal": seasonal
+                }
+                suggested = statistics[method]
+                result["suggestions"].append({
+                    "year": year,
+                    "month_number": month_number,
+                    "category_id": category_id,
+                    "category_name": name,
+                    "category_type": category_type.value,
+                    **statistics,
+                    # Pas d'historique pour ce mois : repli sur la moyenne glissante
+                    "suggested": suggested if suggested is not None else statistics["mean"],
+                    "current": current.get((month_number, category_id))
+                })
+        return result
\ No newline at end of file
@@ -0,0 +1,263 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import or_, update
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import date, timedelta
+from time import perf_counter
+import argparse
+import calendar
+from ..core.database import insert_ignoring_conflicts
+from ..core.etag import bump_data_versions
+from ..models.recurring_transaction import RecurrenceFrequency, RecurringTransaction
+from ..models.transaction import Transaction
+from ..models.user import User
+from .balance_history import BalanceHistory
+from .balance_ledger import BalanceLedger
+from .budget_cache import budget_cache
+from .budget_calculator import BudgetCalculator
+
+# Horizon de génération par défaut (jours après aujourd'hui)
+DEFAULT_DAYS_AHEAD = 31
+
+# Nombre de règles traitées par lot (une transaction de base par lot)
+SCHEDULER_BATCH_SIZE = 1000
+
+def occurrences(rule, window_start: date, window_end: date) -> List[date]:
+    """
+    Dates d'occurrence d'une règle comprises dans [window_start, window_end]
+    rule porte frequency, repeat_every, day, start_date et, pour une règle
+    alignée sur la période budgétaire, budget_start_date et starts_before_month
+    """
+    window_start = max(window_start, rule.start_date)
+    if window_start > window_end:
+        return []
+    step = max(rule.repeat_every or 1, 1)
+    
+    if rule.frequency == RecurrenceFrequency.WEEKLY:
+        days_between = 7 * step
+        first = rule.start_date + timedelta(days=(rule.day - rule.start_date.weekday()) % 7)
+        if first < window_start:
+            first += timedelta(days=-(-(window_start - first).days // days_between) * days_between)
+        count = max((window_end - first).days // days_between + 1, 0)
+        return [first + timedelta(days=index * days_between) for index in range(count)]
+    
+    # Mensuelle ou par période : tous les `step` mois depuis le mois de start_date
+    anchor = rule.start_date.year * 12 + rule.start_date.month - 1
+    first_index = window_start.year * 12 + window_start.month - 2  # une période peut débuter le mois précédent
+    last_index = window_end.year * 12 + window_end.month  # ... ou finir le mois suivant
+    periods = BudgetCalculator(None)
+    
+    dates = []
+    for index in range(anchor + max(0, -(-(first_index - anchor) // step)) * step, last_index + 1, step):
+        month, year = index % 12 + 1, index // 12
+        if rule.frequency == RecurrenceFrequency.MONTHLY:
+            day = date(year, month, min(rule.day, calendar.monthrange(year, month)[1]))
+        else:
+            try:
+                period_start, period_end = periods.get_budget_period_dates(rule, month, year)
+            except ValueError:
+                # Jour de début absent du mois : période ignorée
+                continue
+            day = min(period_start + timedelta(days=rule.day - 1), period_end)
+        if window_start <= day <= window_end:
+            dates.append(day)
+    return dates
+
+class RecurringScheduler:
+    """
+    Génération des occurrences à venir des transactions récurrentes, pour
+    tous les utilisateurs en une passe : les règles sont lues par lots (tous
+    utilisateurs confondus), les occurrences insérées en masse et les soldes
+    mis à jour par un UPDATE groupé. Idempotent : chaque règle mémorise la
+    date jusqu'à laquelle elle a été générée et la contrainte unique
+    (recurring_id, date) écarte les doublons en cas d'exécutions concurrentes.
+    """
+    
+    def __init__(self, db: Session, batch_size: int = SCHEDULER_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+    
+    def _rule_batches(self, horizon: date, rule_ids: Optional[List[int]]) -> Iterator[list]:
+        """
+        Règles actives à générer, par lots paginés sur l'id
+        """
+        query = self.db.query(
+            RecurringTransaction.id,
+            RecurringTransaction.user_id,
+            RecurringTransaction.description,
+            RecurringTransaction.amount,
+            RecurringTransaction.type,
+            RecurringTransaction.category_id,
+            RecurringTransaction.account_from_id,
+            RecurringTransaction.account_to_id,
+            RecurringTransaction.frequency,
+            RecurringTransaction.repeat_every,
+            RecurringTransaction.day,
+            RecurringTransaction.start_date,
+            RecurringTransaction.end_date,
+            RecurringTransaction.generated_until,
+            User.budget_start_date,
+            User.starts_before_month
+        ).join(User, User.id == RecurringTransaction.user_id).filter(
+            RecurringTransaction.is_active == True,
+            or_(RecurringTransaction.generated_until.is_(None), RecurringTransaction.generated_until < horizon),
+            or_(
+                RecurringTransaction.end_date.is_(None),
+                RecurringTransaction.generated_until.is_(None),
+                RecurringTransaction.end_date > RecurringTransaction.generated_until
+            )
+        )
+        if rule_ids is not None:
+            query = query.filter(RecurringTransaction.id.in_(rule_ids))
+        
+        last_id = 0
+        while True:
+            rules = query.filter(RecurringTransaction.id > last_id).order_by(RecurringTransaction.id).limit(self.batch_size).all()
+            if not rules:
+                return
+            yield rules
+            last_id = rules[-1].id
+    
+    def _insert_statement(self):
+        """
+        INSERT ignorant les occurrences déjà présentes, avec retour des lignes insérées
+        """
+        transactions = Transaction.__table__
+        statement = insert_ignoring_conflicts(self.db, transactions, ["recurring_id", "date"])
+        return statement.returning(
+            transactions.c.user_id,
+            transactions.c.amount,
+            transactions.c.account_from_id,
+            transactions.c.account_to_id,
+            transactions.c.date
+        )
+    
+    def run(self, today: Optional[date] = None, days_ahead: int = DEFAULT_DAYS_AHEAD, dry_run: bool = False, rule_ids: Optional[List[int]] = None) -> Dict:
+        """
+        Génération jusqu'à today + days_ahead ; dry_run = True : calcul seul, sans écriture
+        rule_ids : limite la génération à certaines règles (création d'une règle)
+        Retourne les compteurs et durées (secondes) de chaque étape
+        """
+        started = perf_counter()
+        today = today or date.today()
+        horizon = today + timedelta(days=days_ahead)
+        stats = {
+            "dry_run": dry_run,
+            "horizon": horizon.isoformat(),
+            "rules": 0,
+            "occurrences": 0,
+            "inserted": 0,
+            "users": 0,
+            "batches": 0,
+            "timings": {"load": 0.0, "compute": 0.0, "write": 0.0, "total": 0.0}
+        }
+        statement = self._insert_statement()
+        ledger = BalanceLedger(self.db)
+        history = BalanceHistory(self.db)
+        touched_users = set()
+        
+        batches = self._rule_batches(horizon, rule_ids)
+        while True:
+            step = perf_counter()
+            rules = next(batches, None)
+            stats["timings"]["load"] += perf_counter() - step
+            if rules is None:
+                break
+            
+            step = perf_counter()
+            rows = []
+            watermarks = []
+            for rule in rules:
+                # Jamais avant aujourd'hui : une règle réactivée (ou un planificateur
+                # longtemps arrêté) ne recrée pas les occurrences passées manquées
+                window_start = max(rule.generated_until + timedelta(days=1), today) if rule.generated_until else max(rule.start_date, today)
+                window_end = min(rule.end_date, horizon) if rule.end_date else horizon
+                for day in occurrences(rule, window_start, window_end):
+                    rows.append({
+                        "user_id": rule.user_id,
+                        "is_processed": False,
+                        "date": day,
+                        "amount": rule.amount,
+                        "type": rule.type,
+                        "category_id": rule.category_id,
+                        "account_from_id": rule.account_from_id,
+                        "account_to_id": rule.account_to_id,
+                        "description": rule.description,
+                        "recurring_id": rule.id
+                    })
+                watermarks.append({"id": rule.id, "generated_until": horizon})
+            stats["rules"] += len(rules)
+            stats["occurrences"] += len(rows)
+            stats["batches"] += 1
+            stats["timings"]["compute"] += perf_counter() - step
+            
+            if dry_run:
+                continue
+            
+            step = perf_counter()
+            inserted = self.db.execute(statement, rows).all() if rows else []
+            
+            # Occurrences non pointées : seul le solde À VENIR bouge
+            deltas: Dict[Tuple[int, int], Tuple[float, float]] = {}
+            earliest: Dict[int, date] = {}
+            for user_id, amount, account_from_id, account_to_id, day in inserted:
+                earliest[user_id] = min(earliest.get(user_id, day), day)
+                for account_id, signed in ((account_from_id, -amount), (account_to_id, amount)):
+                    real, upcoming = deltas.get((user_id, account_id), (0.0, 0.0))
+                    deltas[(user_id, account_id)] = (real, upcoming + signed)
+            ledger.apply_bulk_deltas(deltas)
+            # Occurrences d'un mois écoulé (--today antérieur) : sans requête sinon
+            for user_id, day in earliest.items():
+                history.invalidate_from(user_id, day)
+            
+            self.db.execute(update(RecurringTransaction), watermarks)
+            users = set(earliest)
+            # Nouvelle version des données : ETag et clés du cache de résultats
+            # changent pour tous les workers, pas seulement pour ce processus
+            bump_data_versions(self.db, users)
+            self.db.commit()
+            stats["timings"]["write"] += perf_counter() - step
+            
+            stats["inserted"] += len(inserted)
+            touched_users |= users
+        
+        if dry_run:
+            self.db.rollback()
+        else:
+            # Libération des entrées du processus courant ; ailleurs, les entrées de
+            # l'ancienne version ne sont plus lues (clés par version des données)
+            for user_id in touched_users:
+                budget_cache.invalidate_user(user_id)
+        
+        stats["users"] = len(touched_users)
+        stats["timings"]["total"] = perf_counter() - started
+        return stats
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    python -m app.services.recurring_scheduler [--dry-run] [--days-ahead N] [--today AAAA-MM-JJ] [--batch-size N]
+    """
+    from ..core.database import SessionLocal
+    
+    parser = argparse.ArgumentParser(description="Génération des occurrences des transactions récurrentes")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--days-ahead", type=int, default=DEFAULT_DAYS_AHEAD)
+    parser.add_argument("--today", type=date.fromisoformat, default=None)
+    parser.add_argument("--batch-size", type=int, default=SCHEDULER_BATCH_SIZE)
+    args = parser.parse_args(argv)
+    
+    db = SessionLocal()
+    try:
+        stats = RecurringScheduler(db, args.batch_size).run(args.today, args.days_ahead, args.dry_run)
+    finally:
+        db.close()
+    
+    timings = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in stats["timings"].items())
+    prefix = "[dry-run] " if stats["dry_run"] else ""
+    print(
+        f"{prefix}{stats['rules']} rules, {stats['occurrences']} occurrences until {stats['horizon']}, "
+        f"{stats['inserted']} inserted for {stats['users']} users in {stats['batches']} batches ({timings})"
+    )
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
@@ -0,0 +1,122 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import case, func, select
+from typing import Dict, List, Optional
+from datetime import date
+import math
+from ..models.category import Category
+from ..models.savings_allocation import SavingsAllocation
+from ..models.savings_goal import SavingsGoal
+from ..models.transaction import Transaction, TransactionType
+from .cash_flow import add_months
+
+# Fenêtre (en mois) du rythme d'épargne utilisé pour estimer la date d'atteinte
+SAVINGS_RATE_MONTHS = 6
+
+class SavingsCalculator:
+    """
+    Avancement des objectifs d'épargne : montant affecté (SavingsAllocation),
+    montant épargné (transactions « épargnes » pointées de la catégorie) et
+    date d'atteinte estimée au rythme des derniers mois.
+    Les montants d'une catégorie portant plusieurs objectifs sont répartis
+    entre eux au prorata de leur cible (jamais comptés deux fois).
+    Tous les objectifs sont calculés en une seule requête agrégée.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def goal_progress(self, user_id: int, today: Optional[date] = None) -> List[Dict]:
+        """
+        Avancement de chaque objectif de l'utilisateur
+        """
+        today = today or date.today()
+        since = add_months(today, -SAVINGS_RATE_MONTHS)
+        
+        # Branche montant en premier : le CASE (et sa somme) prend le type Money de la colonne
+        processed = Transaction.is_processed == True
+        savings = select(
+            Transaction.category_id.label("category_id"),
+            func.sum(case((processed, Transaction.amount), else_=0)).label("saved"),
+            func.sum(case((processed & (Transaction.date > since) & (Transaction.date <= today), Transaction.amount), else_=0)).label("recent"),
+            func.sum(case((Transaction.is_processed.isnot(True), Transaction.amount), else_=0)).label("pending")
+        ).where(
+            Transaction.user_id == user_id,
+            Transaction.type == TransactionType.SAVINGS,
+            Transaction.category_id.isnot(None)
+        ).group_by(Transaction.category_id).subquery("savings")
+        
+        allocations = select(
+            SavingsAllocation.category_id.label("category_id"),
+            func.sum(SavingsAllocation.amount).label("allocated")
+        ).where(SavingsAllocation.user_id == user_id).group_by(SavingsAllocation.category_id).subquery("allocations")
+        
+        rows = self.db.query(
+            SavingsGoal.id,
+            SavingsGoal.category_id,
+            Category.name,
+            SavingsGoal.target_amount,
+            func.coalesce(allocations.c.allocated, 0.0),
+            func.coalesce(savings.c.saved, 0.0),
+            func.coalesce(savings.c.recent, 0.0),
+            func.coalesce(savings.c.pending, 0.0)
+        ).join(
+            Category, Category.id == SavingsGoal.category_id
+        ).outerjoin(
+            allocations, allocations.c.category_id == SavingsGoal.category_id
+        ).outerjoin(
+            savings, savings.c.category_id == SavingsGoal.category_id
+        ).filter(SavingsGoal.user_id == user_id).order_by(Category.sort_order, SavingsGoal.id).all()
+        
+        # Cibles cumulées et nombre d'objectifs par catégorie, pour la répartition
+        category_targets: Dict[int, float] = {}
+        category_goals: Dict[int, int] = {}
+        for row in rows:
+            category_targets[row[1]] = category_targets.get(row[1], 0.0) + row[3]
+            category_goals[row[1]] = category_goals.get(row[1], 0) + 1
+        
+        goals = []
+        for goal_id, category_id, category_name, target, allocated, saved, recent, pending in rows:
+            if category_goals[category_id] > 1:
+                total = category_targets[category_id]
+                share = target / total if total > 0 else 1 / category_goals[category_id]
+                allocated, saved, recent, pending = (amount * share for amount in (allocated, saved, recent, pending))
+            remaining = max(target - saved, 0.0)
+            monthly_rate = recent / SAVINGS_RATE_MONTHS
+            
+            # Objectif atteint : aujourd'hui ; pas d'épargne récente : pas d'estimation
+            if remaining == 0:
+                estimated_completion = today
+            elif monthly_rate > 0:
+                estimated_completion = add_months(today, math.ceil(remaining / monthly_rate))
+            else:
+                estimated_completion = None
+            
+            goals.append({
+                "goal_id": goal_id,
+                "category_id": category_id,
+                "category_name": category_name,
+                "target_amount": target,
+                "allocated": round(allocated, 2),
+                "saved": round(saved, 2),
+                "pending": round(pending, 2),
+                "remaining": round(remaining, 2),
+                "progress_percent": round(saved / target * 100, 2) if target > 0 else 0.0,
+                "monthly_rate": round(monthly_rate, 2),
+                "estimated_completion": estimated_completion
+            })
+        return goals
+    
+    @staticmethod
+    def summarize(goals: List[Dict]) -> Dict[str, float]:
+        """
+        Totaux de tous les objectifs
+        """
+        target = sum(goal["target_amount"] for goal in goals)
+        saved = sum(goal["saved"] for goal in goals)
+        return {
+            "target_amount": round(target, 2),
+            "allocated": round(sum(goal["allocated"] for goal in goals), 2),
+            "saved": round(saved, 2),
+            "remaining": round(sum(goal["remaining"] for goal in goals), 2),
+            "progress_percent": round(saved / target * 100, 2) if target > 0 else 0.0
+        }
\ No newline at end of file
@@ -0,0 +1,309 @@
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import date, datetime
+import codecs
+import csv
+import io
+import itertools
+import unicodedata
+from ..core.money import check_cents
+from ..models.account import Account
+from ..models.category import Category
+from ..models.transaction import Transaction, TransactionType
+from ..models.user import User
+from .balance_ledger import BalanceLedger
+from .transaction_rules import validate_transaction
+
+# Nombre de lignes insérées par requête INSERT
+IMPORT_BATCH_SIZE = 1000
+
+# Nombre maximal d'erreurs détaillées dans le rapport d'import
+MAX_REPORTED_ERRORS = 100
+
+# En-têtes reconnus (comparés sans accents ni casse) : export CSV de l'API,
+# onglet Transactions du Budget Planner Excel v1.3, exports bancaires courants
+COLUMN_ALIASES = {
+    "is_processed": {"is_processed", "pointe", "pointage", "pointee", "processed"},
+    "date": {"date", "date operation", "date d'operation"},
+    "amount": {"amount", "montant"},
+    "type": {"type", "type d'operation"},
+    "category": {"category", "category_id", "categorie"},
+    "account_from": {"account_from", "account_from_id", "de", "depuis", "compte source", "compte debite", "compte de"},
+    "account_to": {"account_to", "account_to_id", "vers", "a", "compte destination", "compte credite", "compte vers"},
+    "description": {"description", "libelle", "intitule"},
+}
+
+REQUIRED_COLUMNS = {"date", "amount", "type", "account_from", "account_to", "description"}
+
+TRUE_VALUES = {"vrai", "true", "1", "x", "oui", "yes"}
+FALSE_VALUES = {"faux", "false", "0", "non", "no", ""}
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d/%m/%y", "%d-%m-%Y", "%d.%m.%Y")
+
+# Encodage de repli des CSV qui ne sont pas en UTF-8 (exports Excel et bancaires Windows)
+FALLBACK_ENCODING = "cp1252"
+
+class ImportFormatError(ValueError):
+    """
+    Fichier inexploitable (format inconnu, colonnes obligatoires absentes)
+    """
+
+def normalize(value: Any) -> str:
+    """
+    Clé de comparaison : minuscules, sans accents ni espaces superflus
+    """
+    text = unicodedata.normalize("NFKD", str(value if value is not None else "")).encode("ascii", "ignore").decode()
+    return " ".join(text.lower().split())
+
+def map_header(header: List[Any]) -> Dict[int, str]:
+    """
+    Correspondance index de colonne -> champ de transaction
+    """
+    aliases = {alias: field for field, names in COLUMN_ALIASES.items() for alias in names}
+    columns = {}
+    for index, name in enumerate(header):
+        field = aliases.get(normalize(name))
+        if field and field not in columns.values():
+            columns[index] = field
+    return columns
+
+def iter_csv_rows(stream: io.TextIOBase) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Lignes d'un CSV (séparateur ; ou ,) lues au fil de l'eau
+    """
+    header_line = stream.readline()
+    delimiter = ";" if header_line.count(";") > header_line.count(",") else ","
+    reader = csv.reader(itertools.chain([header_line], stream), delimiter=delimiter)
+    
+    columns = map_header(next(reader, []))
+    missing = REQUIRED_COLUMNS - set(columns.values())
+    if missing:
+        raise ImportFormatError(f"Missing columns: {', '.join(sorted(missing))}")
+    
+    for line_number, values in enumerate(reader, start=2):
+        if not any(value.strip() for value in values):
+            continue
+        yield line_number, {field: values[index] if index < len(values) else None for index, field in columns.items()}
+
+def detect_csv_encoding(file) -> str:
+    """
+    UTF-8 (avec ou sans BOM) si tout le fichier se décode, sinon l'encodage
+    de repli ; le fichier est relu par blocs puis rembobiné
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for chunk in iter(lambda: file.read(64 * 1024), b""):
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    finally:
+        file.seek(0)
+
+def iter_csv_upload(file) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Lignes d'un CSV téléversé, dans l'encodage détecté ; un fichier
+    indécodable est une erreur de format, pas une erreur serveur
+    """
+    stream = io.TextIOWrapper(file, encoding=detect_csv_encoding(file), newline="")
+    try:
+        yield from iter_csv_rows(stream)
+    except UnicodeDecodeError:
+        raise ImportFormatError("Unreadable CSV file, expected UTF-8 or Windows-1252 text")
+
+def iter_xlsx_rows(file) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Lignes de l'onglet Transactions d'un classeur Excel, en lecture seule
+    (la ligne d'en-tête est la première contenant les colonnes obligatoires)
+    """
+    from openpyxl import load_workbook
+    
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFormatError("Unreadable Excel file")
+    
+    try:
+        sheet = next(
+            (workbook[name] for name in workbook.sheetnames if "transaction" in normalize(name)),
+            workbook.active
+        )
+        
+        columns = None
+        for line_number, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+            if columns is None:
+                candidate = map_header(list(values))
+                if REQUIRED_COLUMNS <= set(candidate.values()):
+                    columns = candidate
+                continue
+            if not any(value not in (None, "") for value in values):
+                continue
+            yield line_number, {field: values[index] if index < len(values) else None for index, field in columns.items()}
+        
+        if columns is None:
+            raise ImportFormatError(f"Missing columns: {', '.join(sorted(REQUIRED_COLUMNS))}")
+    finally:
+        workbook.close()
+
+def iter_upload_rows(filename: Optional[str], file) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Lignes d'un fichier téléversé, selon son extension (.csv ou .xlsx)
+    """
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension in ("xlsx", "xlsm"):
+        return iter_xlsx_rows(file)
+    if extension in ("csv", "txt"):
+        return iter_csv_upload(file)
+    raise ImportFormatError("Unsupported file type, expected .csv or .xlsx")
+
+def parse_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or "").strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date: {text!r}")
+
+def parse_amount(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        amount = float(value)
+    else:
+        text = str(value or "").replace("€", "").replace(" ", "").replace(" ", "").replace(" ", "")
+        try:
+            amount = float(text.replace(",", "."))
+        except ValueError:
+            raise ValueError(f"Invalid amount: {value!r}")
+    try:
+        return check_cents(amount)
+    except ValueError:
+        raise ValueError(f"Invalid amount, at most 2 decimal places: {value!r}")
+
+def parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = normalize(value)
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid processed flag: {value!r}")
+
+class TransactionImporter:
+    """
+    Import en masse de transactions : les noms de catégories et de comptes
+    sont résolus par une table chargée une fois, les lignes valides sont
+    insérées par lots et les soldes mis à jour en une seule passe.
+    Les écritures restent dans la transaction de la session (commit par l'appelant).
+    """
+    
+    def __init__(self, db: Session, user: User):
+        self.db = db
+        self.user_id = user.id
+        self.categories = self._lookup(Category)
+        self.accounts = self._lookup(Account)
+        self.types = {}
+        self.earliest_date: Optional[date] = None  # Date la plus ancienne importée (historique des soldes)
+        for transaction_type in TransactionType:
+            for name in (transaction_type.value, transaction_type.name):
+                self.types[normalize(name)] = transaction_type
+                self.types[normalize(name).rstrip("s")] = transaction_type
+    
+    def _lookup(self, model) -> Dict[str, int]:
+        """
+        Table nom -> id (et id -> id) des catégories ou comptes de l'utilisateur
+        """
+        lookup = {}
+        for object_id, name in self.db.query(model.id, model.name).filter(model.user_id == self.user_id).all():
+            lookup.setdefault(normalize(name), object_id)
+            lookup[str(object_id)] = object_id
+        return lookup
+    
+    def _resolve(self, lookup: Dict[str, int], value: Any, label: str) -> int:
+        key = normalize(int(value) if isinstance(value, float) and value.is_integer() else value)
+        if key not in lookup:
+            raise ValueError(f"Unknown {label}: {value!r}")
+        return lookup[key]
+    
+    def parse_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Conversion d'une ligne en valeurs de transaction, avec les mêmes règles
+        que la saisie unitaire (ValueError si la ligne est invalide)
+        """
+        transaction_type = self.types.get(normalize(row.get("type")))
+        if transaction_type is None:
+            raise ValueError(f"Unknown type: {row.get('type')!r}")
+        
+        category_id = None
+        if row.get("category") not in (None, ""):
+            category_id = self._resolve(self.categories, row["category"], "category")
+        
+        values = {
+            "user_id": self.user_id,
+            "is_processed": parse_bool(row.get("is_processed")),
+            "date": parse_date(row.get("date")),
+            "amount": parse_amount(row.get("amount")),
+            "type": transaction_type,
+            "category_id": category_id,
+            "account_from_id": self._resolve(self.accounts, row.get("account_from"), "account"),
+            "account_to_id": self._resolve(self.accounts, row.get("account_to"), "account"),
+            "description": str(row.get("description") or "").strip()
+        }
+        
+        error = validate_transaction(values["amount"], values["account_from_id"], values["account_to_id"])
+        if error:
+            raise ValueError(error)
+        return values
+    
+    def import_rows(self, rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Dict:
+        """
+        Import des lignes valides ; les lignes invalides sont signalées
+        sans interrompre l'import
+        """
+        ledger = BalanceLedger(self.db)
+        deltas: Dict[int, Tuple[float, float]] = {}
+        batch: List[Dict[str, Any]] = []
+        errors: List[Dict] = []
+        imported = 0
+        error_count = 0
+        
+        for line_number, row in rows:
+            try:
+                values = self.parse_row(row)
+            except ValueError as exc:
+                error_count += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({"line": line_number, "error": str(exc)})
+                continue
+            
+            batch.append(values)
+            if self.earliest_date is None or values["date"] < self.earliest_date:
+                self.earliest_date = values["date"]
+            state = (values["amount"], values["account_from_id"], values["account_to_id"], values["is_processed"])
+            for account_id, (real, upcoming) in ledger.transaction_deltas(state).items():
+                current_real, current_upcoming = deltas.get(account_id, (0.0, 0.0))
+                deltas[account_id] = (current_real + real, current_upcoming + upcoming)
+            
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                imported += self._insert(batch)
+                batch = []
+        
+        if batch:
+            imported += self._insert(batch)
+        ledger.apply_deltas(self.user_id, deltas)
+        
+        return {
+            "imported": imported,
+            "error_count": error_count,
+            "errors": errors
+        }
+    
+    def _insert(self, batch: List[Dict[str, Any]]) -> int:
+        self.db.execute(insert(Transaction), batch)
+        return len(batch)
\ No newline at end of file
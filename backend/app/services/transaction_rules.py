@@ -0,0 +1,38 @@
+from typing import Optional
+from datetime import date
+from ..models.recurring_transaction import RecurrenceFrequency
+
+def validate_transaction(amount: Optional[float], account_from_id: Optional[int], account_to_id: Optional[int]) -> Optional[str]:
+    """
+    Règles de validation communes à la saisie et à l'import de transactions
+    Retourne le message d'erreur, ou None si la transaction est valide
+    """
+    # Validation: montant positif
+    if amount is None or amount <= 0:
+        return "Amount must be positive"
+    
+    # Validation: comptes différents (sauf pour certains transferts)
+    if account_from_id == account_to_id:
+        return "Source and destination accounts must be different"
+    
+    return None
+
+
+def validate_recurrence(frequency: RecurrenceFrequency, repeat_every: int, day: int, start_date: date, end_date: Optional[date]) -> Optional[str]:
+    """
+    Règles de validation d'une transaction récurrente
+    Retourne le message d'erreur, ou None si la règle est valide
+    """
+    if repeat_every < 1:
+        return "repeat_every must be at least 1"
+    
+    if frequency == RecurrenceFrequency.WEEKLY:
+        if day < 0 or day > 6:
+            return "Day must be between 0 (Monday) and 6 (Sunday) for a weekly rule"
+    elif day < 1 or day > 31:
+        return "Day must be between 1 and 31"
+    
+    if end_date is not None and end_date < start_date:
+        return "end_date must not be before start_date"
+    
+    return None
\ No newline at end of file
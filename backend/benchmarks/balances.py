@@ -0,0 +1,69 @@
+"""
+Soldes de tous les comptes : boucle Python historique (toutes les transactions
+chargées deux fois par compte) contre l'agrégat SQL unique de BalanceCalculator
+python -m benchmarks.balances [--sizes 1000,5000,20000] [--accounts 15]
+"""
+import argparse
+from typing import Dict
+
+from .common import create_user, measure, report, reset_database
+from app.core.database import SessionLocal
+from app.models import Account, Transaction
+from app.services.balance_calculator import BalanceCalculator
+
+def loop_balances(db, user_id: int) -> Dict[str, Dict[int, float]]:
+    """
+    Référence : calcul avant l'agrégat SQL (une lecture complète des transactions
+    par compte et par type de solde)
+    """
+    balances = {"real": {}, "upcoming": {}, "pending": {}}
+    for account in db.query(Account).filter(Account.user_id == user_id).all():
+        for key, processed_only in (("real", True), ("upcoming", False)):
+            balance = account.initial_balance
+            query = db.query(Transaction).filter(Transaction.user_id == user_id)
+            if processed_only:
+                query = query.filter(Transaction.is_processed == True)
+            for transaction in query.all():
+                if transaction.account_from_id == account.id:
+                    balance -= transaction.amount
+                elif transaction.account_to_id == account.id:
+                    balance += transaction.amount
+            balances[key][account.id] = balance
+        balances["pending"][account.id] = balances["upcoming"][account.id] - balances["real"][account.id]
+    return balances
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    parser.add_argument("--accounts", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    reset_database()
+    db = SessionLocal()
+    rows = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        user_id = create_user(db, f"balances-{size}", args.accounts, 8, size)
+        
+        expected = loop_balances(db, user_id)
+        actual = BalanceCalculator(db).calculate_all_balances(user_id, use_ledger=False)
+        assert all(
+            abs(expected[key][account_id] - actual[key][account_id]) < 0.005
+            for key in expected for account_id in expected[key]
+        ), "balance mismatch"
+        
+        loop = measure(lambda: (db.expunge_all(), loop_balances(db, user_id)), args.repeat)
+        aggregate = measure(lambda: BalanceCalculator(db).calculate_all_balances(user_id, use_ledger=False), args.repeat)
+        ledger = measure(lambda: BalanceCalculator(db).calculate_all_balances(user_id), args.repeat)
+        rows.append({
+            "transactions": size,
+            "loop ms": f"{loop['median']:.1f}",
+            "aggregate ms": f"{aggregate['median']:.1f}",
+            "ledger ms": f"{ledger['median']:.1f}",
+            "speedup": f"x{loop['median'] / aggregate['median']:.0f}"
+        })
+    db.close()
+    report(rows, ["transactions", "loop ms", "aggregate ms", "ledger ms", "speedup"])
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
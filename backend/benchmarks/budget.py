@@ -0,0 +1,88 @@
+"""
+Budget d'une période : boucle imbriquée historique (chaque catégorie parcourt toutes
+les prévisions puis toutes les transactions) contre l'agrégation groupée de
+BudgetCalculator (SUM par catégorie côté base, prévisions indexées)
+python -m benchmarks.budget [--sizes 10:1000,20:5000,80:20000] [--repeat 3]
+"""
+import argparse
+from typing import Dict
+
+from .common import create_user, measure, report, reset_database
+from app.core.database import SessionLocal
+from app.models import BudgetForecast, Category, Transaction
+from app.services.budget_calculator import BudgetCalculator
+
+MONTH, YEAR = 6, 2024
+
+def loop_budget(db, user_id: int, month: int, year: int) -> Dict[int, Dict[str, float]]:
+    """
+    Référence : calcul avant l'agrégation groupée, en
+    O(catégories × (prévisions + transactions))
+    """
+    calculator = BudgetCalculator(db)
+    start_date, end_date = calculator.get_budget_period_dates(calculator._get_user(user_id), month, year)
+    forecasts = db.query(BudgetForecast).filter(
+        BudgetForecast.user_id == user_id,
+        BudgetForecast.year == year,
+        BudgetForecast.month_number == month
+    ).all()
+    transactions = db.query(Transaction).filter(
+        Transaction.user_id == user_id,
+        Transaction.date >= start_date,
+        Transaction.date <= end_date
+    ).all()
+    
+    budget = {}
+    for category in db.query(Category).filter(Category.user_id == user_id).all():
+        forecast_amount = 0.0
+        for forecast in forecasts:
+            if forecast.category_id == category.id:
+                forecast_amount = forecast.forecasted_amount
+                break
+        real_amount = 0.0
+        for transaction in transactions:
+            if transaction.category_id == category.id:
+                real_amount += transaction.amount
+        budget[category.id] = {"forecasted": forecast_amount, "real": real_amount}
+    return budget
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10:1000,20:5000,80:20000", help="catégories:transactions, séparés par des virgules")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    reset_database()
+    db = SessionLocal()
+    rows = []
+    for size in args.sizes.split(","):
+        categories, transactions = (int(value) for value in size.split(":"))
+        # Transactions concentrées sur un an : ~1/12 du volume dans la période mesurée
+        user_id = create_user(db, f"budget-{categories}-{transactions}", 3, categories, transactions, days=365)
+        
+        expected = loop_budget(db, user_id, MONTH, YEAR)
+        actual = BudgetCalculator(db).calculate_budget_for_period(user_id, MONTH, YEAR)["categories"]
+        assert expected.keys() == actual.keys() and all(
+            abs(expected[category_id][key] - actual[category_id][key]) < 0.005
+            for category_id in expected for key in ("forecasted", "real")
+        ), "budget mismatch"
+        
+        loop = measure(lambda: (db.expunge_all(), loop_budget(db, user_id, MONTH, YEAR)), args.repeat)
+        grouped = measure(lambda: BudgetCalculator(db).calculate_budget_for_period(user_id, MONTH, YEAR), args.repeat)
+        year_range = measure(
+            lambda: BudgetCalculator(db).calculate_budget_for_range(user_id, [(month, YEAR) for month in range(1, 13)]),
+            args.repeat
+        )
+        rows.append({
+            "categories": categories,
+            "transactions": transactions,
+            "loop ms": f"{loop['median']:.1f}",
+            "grouped ms": f"{grouped['median']:.1f}",
+            "12 months ms": f"{year_range['median']:.1f}",
+            "speedup": f"x{loop['median'] / grouped['median']:.0f}"
+        })
+    db.close()
+    report(rows, ["categories", "transactions", "loop ms", "grouped ms", "12 months ms", "speedup"])
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
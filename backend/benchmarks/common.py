@@ -0,0 +1,112 @@
+"""
+Outils communs des benchmarks : base dédiée, utilisateurs synthétiques, chronométrage.
+Lancer depuis backend/ : python -m benchmarks.<module>
+La base est BENCH_DATABASE_URL (SQLite temporaire par défaut) : elle est vidée et
+recréée, ne jamais y mettre l'URL de la base applicative.
+"""
+import os
+import random
+import statistics
+import tempfile
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Callable, Dict, List
+
+os.environ["DATABASE_URL"] = os.environ.get(
+    "BENCH_DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.gettempdir(), "budget_planner_bench.db")
+)
+os.environ.setdefault("GITHUB_CLIENT_ID", "benchmark")
+os.environ.setdefault("GITHUB_CLIENT_SECRET", "benchmark")
+
+from sqlalchemy import insert
+from app.core.database import Base, engine
+from app.models import Account, BudgetForecast, Category, Transaction, User
+from app.models.category import CategoryType
+from app.models.transaction import TransactionType
+
+# Type de transaction correspondant à chaque type de catégorie
+TRANSACTION_TYPES = {
+    CategoryType.REVENUE: TransactionType.REVENUE,
+    CategoryType.BILL: TransactionType.BILL,
+    CategoryType.EXPENSE: TransactionType.EXPENSE,
+    CategoryType.SAVINGS: TransactionType.SAVINGS
+}
+
+def reset_database() -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+def create_user(db, name: str, accounts: int, categories: int, transactions: int, start: date = date(2024, 1, 1), days: int = 730, seed: int = 1) -> int:
+    """
+    Utilisateur synthétique : comptes, catégories (types en rotation), une
+    prévision par catégorie et par mois, transactions aléatoires sur `days` jours
+    Les soldes tenus à jour sont recalculés ; retourne l'id de l'utilisateur
+    """
+    from app.services.balance_ledger import BalanceLedger
+    
+    rng = random.Random(seed)
+    user = User(github_id=name, username=name, email=f"{name}@example.com")
+    db.add(user)
+    db.flush()
+    
+    account_rows = [
+        Account(user_id=user.id, name=f"Compte {index}", initial_balance=1000.0, is_main_account=index == 0)
+        for index in range(accounts)
+    ]
+    category_rows = [
+        Category(user_id=user.id, name=f"Catégorie {index}", type=list(CategoryType)[index % 4], sort_order=index)
+        for index in range(categories)
+    ]
+    db.add_all(account_rows + category_rows)
+    db.flush()
+    
+    years = range(start.year, (start + timedelta(days=days)).year + 1)
+    db.execute(insert(BudgetForecast.__table__), [
+        {"user_id": user.id, "year": year, "month_number": month, "category_id": category.id, "forecasted_amount": rng.randint(1000, 50000) / 100}
+        for category in category_rows
+        for year in years
+        for month in range(1, 13)
+    ])
+    
+    rows = []
+    for _ in range(transactions):
+        category = rng.choice(category_rows)
+        account_from, account_to = rng.sample(account_rows, 2) if accounts > 1 else (account_rows[0], account_rows[0])
+        rows.append({
+            "user_id": user.id,
+            "is_processed": rng.random() < 0.7,
+            "date": start + timedelta(days=rng.randrange(days)),
+            "amount": rng.randint(1, 200000) / 100,
+            "type": TRANSACTION_TYPES[category.type],
+            "category_id": category.id,
+            "account_from_id": account_from.id,
+            "account_to_id": account_to.id,
+            "description": "benchmark"
+        })
+    for offset in range(0, len(rows), 10000):
+        db.execute(insert(Transaction.__table__), rows[offset:offset + 10000])
+    
+    BalanceLedger(db).rebuild(user.id)
+    db.commit()
+    return user.id
+
+def measure(function: Callable[[], object], repeat: int = 5) -> Dict[str, float]:
+    """
+    Durées (ms) de `repeat` exécutions : meilleure et médiane
+    """
+    durations: List[float] = []
+    for _ in range(repeat):
+        started = perf_counter()
+        function()
+        durations.append((perf_counter() - started) * 1000)
+    return {"best": min(durations), "median": statistics.median(durations)}
+
+def report(rows: List[Dict], columns: List[str]) -> None:
+    """
+    Affichage d'un tableau de résultats aligné
+    """
+    widths = [max(len(column), *(len(f"{row[column]}") for row in rows)) for column in columns]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(f"{row[column]}".ljust(width) for column, width in zip(columns, widths)))
\ No newline at end of file
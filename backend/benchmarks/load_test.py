@@ -0,0 +1,116 @@
+"""
+Test de charge : latence des requêtes légères pendant que des calculs lourds
+occupent le serveur, avec les routes synchrones (`def`, pool de threads) et avec
+une copie `async def` de la route lourde qui appelle la session synchrone sur
+la boucle d'événements (déclaration des routes avant le passage en `def`)
+python -m benchmarks.load_test [--clients 50] [--duration 10] [--transactions 20000]
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, List
+
+from .common import create_user, report, reset_database
+import httpx
+import uvicorn
+from fastapi import Depends
+from app.core.auth import create_access_token
+from app.core.cache import NullCache, configure_cache
+from app.core.database import SessionLocal
+from app.core.deps import get_current_user
+from app.main import app
+from app.models.user import User
+from app.services.budget_calculator import BudgetCalculator
+
+# Période lourde : 24 mois recalculés à chaque requête (cache de résultats désactivé)
+HEAVY_PERIODS = [(month, year) for year in (2024, 2025) for month in range(1, 13)]
+
+@app.get("/benchmark/blocking-range")
+async def blocking_range(current_user: User = Depends(get_current_user)):
+    """Heavy budget computation run on the event loop, as the async def routes used to"""
+    db = SessionLocal()
+    try:
+        return {"periods": BudgetCalculator(db).calculate_budget_for_range(current_user.id, HEAVY_PERIODS)}
+    finally:
+        db.close()
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def percentile(values: List[float], rank: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(rank / 100 * (len(ordered) - 1))))]
+
+async def run_clients(base_url: str, token: str, heavy_path: str, clients: int, duration: float) -> Dict[str, List[float]]:
+    """
+    Un client sur cinq enchaîne la requête lourde, les autres interrogent /budget/balances/
+    Retourne les latences (ms) par type de requête et le nombre de réponses en erreur
+    (attente du pool de connexions dépassée quand la boucle d'événements est bloquée)
+    """
+    latencies: Dict[str, List[float]] = {"light": [], "heavy": [], "errors": []}
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=clients)
+    
+    async with httpx.AsyncClient(base_url=base_url, headers={"Authorization": f"Bearer {token}"}, limits=limits, timeout=120) as client:
+        async def worker(index: int) -> None:
+            kind, path = ("heavy", heavy_path) if index % 5 == 0 else ("light", "/api/v1/budget/balances/")
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(path)
+                elapsed = (time.perf_counter() - started) * 1000
+                latencies[kind if response.is_success else "errors"].append(elapsed)
+        
+        await asyncio.gather(*(worker(index) for index in range(clients)))
+    return latencies
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--transactions", type=int, default=20000)
+    args = parser.parse_args()
+    
+    reset_database()
+    db = SessionLocal()
+    create_user(db, "load", 15, 40, args.transactions)
+    db.close()
+    configure_cache(NullCache())
+    token = create_access_token({"sub": "load"}, timedelta(hours=1))
+    
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="critical"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    
+    scenarios = [
+        ("async def (before)", "/benchmark/blocking-range"),
+        ("def + threadpool", "/api/v1/budget/range?from=2024-01&to=2025-12")
+    ]
+    rows = []
+    for name, heavy_path in scenarios:
+        latencies = asyncio.run(run_clients(f"http://127.0.0.1:{port}", token, heavy_path, args.clients, args.duration))
+        light = latencies["light"]
+        rows.append({
+            "routes": name,
+            "light requests": len(light),
+            "light p50 ms": f"{statistics.median(light):.0f}",
+            "light p99 ms": f"{percentile(light, 99):.0f}",
+            "heavy requests": len(latencies["heavy"]),
+            "heavy p99 ms": f"{percentile(latencies['heavy'], 99):.0f}" if latencies["heavy"] else "-",
+            "errors": len(latencies["errors"])
+        })
+    
+    server.should_exit = True
+    thread.join()
+    report(rows, ["routes", "light requests", "light p50 ms", "light p99 ms", "heavy requests", "heavy p99 ms", "errors"])
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Agrégation des montants : centimes entiers (colonne Money) contre flottants en euros
+(stockage d'avant la migration 0009), durée et écart au total exact
+python -m benchmarks.money [--sizes 100000,1000000] [--repeat 3]
+"""
+import argparse
+
+from sqlalchemy import BigInteger, Column, Float, Integer, MetaData, Table, func, insert, select, type_coerce
+
+from .common import create_user, measure, report, reset_database
+from app.core.database import SessionLocal, engine
+from app.models import Transaction
+
+# Copie des montants en euros flottants, agrégée comme l'était la colonne amount
+float_amounts = Table(
+    "benchmark_float_amounts",
+    MetaData(),
+    Column("category_id", Integer, index=True),
+    Column("amount", Float)
+)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    rows = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        reset_database()
+        float_amounts.drop(bind=engine, checkfirst=True)
+        float_amounts.create(bind=engine)
+        db = SessionLocal()
+        user_id = create_user(db, f"money-{size}", 3, 12, size)
+        
+        cents = type_coerce(Transaction.amount, BigInteger)
+        db.execute(insert(float_amounts).from_select(
+            ["category_id", "amount"],
+            select(Transaction.category_id, cents / 100.0).where(Transaction.user_id == user_id)
+        ))
+        db.commit()
+        
+        exact = dict(db.query(Transaction.category_id, func.sum(cents)).group_by(Transaction.category_id).all())
+        integer_sums = dict(db.query(Transaction.category_id, func.sum(Transaction.amount)).group_by(Transaction.category_id).all())
+        float_sums = dict(db.execute(
+            select(float_amounts.c.category_id, func.sum(float_amounts.c.amount)).group_by(float_amounts.c.category_id)
+        ).all())
+        assert all(integer_sums[category_id] == total / 100 for category_id, total in exact.items()), "integer sum mismatch"
+        
+        integer = measure(lambda: db.query(Transaction.category_id, func.sum(Transaction.amount)).group_by(Transaction.category_id).all(), args.repeat)
+        floating = measure(
+            lambda: db.execute(select(float_amounts.c.category_id, func.sum(float_amounts.c.amount)).group_by(float_amounts.c.category_id)).all(),
+            args.repeat
+        )
+        rows.append({
+            "transactions": size,
+            "integer ms": f"{integer['median']:.1f}",
+            "float ms": f"{floating['median']:.1f}",
+            "float drift (cents)": f"{max(abs(float_sums[category_id] * 100 - total) for category_id, total in exact.items()):.6f}",
+            "integer drift": "0"
+        })
+        db.close()
+    float_amounts.drop(bind=engine, checkfirst=True)
+    report(rows, ["transactions", "integer ms", "float ms", "float drift (cents)", "integer drift"])
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Base SQLite dédiée aux tests (TEST_DATABASE_URL pour une autre base),
+configurée avant l'import de l'application
+Lancer depuis backend/ : python -m pytest tests
+"""
+import os
+import tempfile
+from datetime import timedelta
+
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.gettempdir(), "budget_planner_tests.db")
+)
+os.environ.setdefault("GITHUB_CLIENT_ID", "test")
+os.environ.setdefault("GITHUB_CLIENT_SECRET", "test")
+
+import pytest
+from fastapi.testclient import TestClient
+from app.core.auth import create_access_token
+from app.core.cache import InMemoryCache, configure_cache
+from app.core.database import Base, SessionLocal, engine
+from app.core.deps import auth_cache
+from app.main import app
+from app.models import Account, Category, User
+from app.models.category import CategoryType
+from app.services.balance_ledger import BalanceLedger
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", help="lancer aussi les tests marqués slow")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: test long (volumes réels), ignoré sans --run-slow")
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="test long : relancer avec --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    # Base recréée : les caches de résultats et d'authentification repartent à vide
+    configure_cache(InMemoryCache())
+    auth_cache.delete_prefix("")
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def user(db):
+    """
+    Utilisateur avec trois comptes (le premier principal, soldes à jour)
+    et une catégorie de chaque type, dans l'ordre de CategoryType
+    """
+    user = User(github_id="1", username="alice", email="alice@example.com")
+    db.add(user)
+    db.flush()
+    db.add_all([
+        Account(user_id=user.id, name=f"Compte {index}", initial_balance=100.0 * index, current_balance=100.0 * index, upcoming_balance=100.0 * index, is_main_account=index == 0)
+        for index in range(3)
+    ] + [
+        Category(user_id=user.id, name=category_type.value.capitalize(), type=category_type, sort_order=index)
+        for index, category_type in enumerate(CategoryType)
+    ])
+    db.commit()
+    return user
+
+@pytest.fixture
+def accounts(db, user):
+    return db.query(Account).filter(Account.user_id == user.id).order_by(Account.id).all()
+
+@pytest.fixture
+def categories(db, user):
+    return {category.type: category for category in db.query(Category).filter(Category.user_id == user.id)}
+
+@pytest.fixture
+def client(user):
+    client = TestClient(app)
+    client.headers["Authorization"] = "Bearer " + create_access_token({"sub": user.username}, timedelta(hours=1))
+    return client
+
+@pytest.fixture
+def ledger_mismatches(db, user):
+    """
+    Écarts entre le registre des soldes et un recalcul complet
+    (les écritures de l'API passent par d'autres sessions : relecture forcée)
+    """
+    def mismatches():
+        db.expire_all()
+        return BalanceLedger(db).verify(user.id)
+    return mismatches
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Historique des soldes : lecture seule (aucun instantané écrit par le GET),
+mêmes soldes avant et après la commande update
+"""
+from app.models import BalanceSnapshot
+from app.models.category import CategoryType
+from app.services.balance_history import BalanceHistory
+
+HISTORY = "/api/v1/budget/history?from=2024-12&to=2025-04"
+
+def create(client, accounts, categories, day, amount, is_processed=True):
+    response = client.post("/api/v1/transactions/", json={
+        "date": day,
+        "amount": amount,
+        "type": "dépenses",
+        "category_id": categories[CategoryType.EXPENSE].id,
+        "account_from_id": accounts[1].id,
+        "account_to_id": accounts[2].id,
+        "description": "Achat",
+        "is_processed": is_processed
+    })
+    assert response.status_code == 200, response.text
+
+def snapshot_count(db):
+    db.expire_all()
+    return db.query(BalanceSnapshot).count()
+
+def test_history_is_read_only(client, db, user, accounts, categories):
+    create(client, accounts, categories, "2025-01-10", 10)
+    create(client, accounts, categories, "2025-03-20", 25.5, is_processed=False)
+    
+    response = client.get(HISTORY)
+    assert response.status_code == 200, response.text
+    history = response.json()
+    assert snapshot_count(db) == 0
+    
+    account = history["accounts"][str(accounts[1].id)]
+    assert account["real"] == [100.0, 90.0, 90.0, 90.0, 90.0]
+    assert account["upcoming"] == [100.0, 90.0, 90.0, 64.5, 64.5]
+    
+    # Instantanés écrits hors lecture : la série ne change pas
+    assert BalanceHistory(db).extend(user.id) > 0
+    db.commit()
+    assert client.get(HISTORY).json() == history
+
+def test_history_after_backdated_write(client, db, user, accounts, categories):
+    create(client, accounts, categories, "2025-03-20", 25.5)
+    BalanceHistory(db).extend(user.id)
+    db.commit()
+    
+    # Écriture antérieure aux instantanés : supprimés, recalculés en mémoire
+    create(client, accounts, categories, "2025-01-10", 10)
+    stored = snapshot_count(db)
+    history = client.get(HISTORY).json()
+    
+    assert snapshot_count(db) == stored
+    assert history["accounts"][str(accounts[2].id)]["real"] == [200.0, 210.0, 210.0, 235.5, 235.5]
+    assert history["total"]["real"] == [300.0, 300.0, 300.0, 300.0, 300.0]
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Soldes tenus à jour par BalanceLedger : après chaque écriture unitaire, le
+registre doit correspondre au recalcul complet depuis les transactions
+"""
+from app.models.category import CategoryType
+
+def create(client, accounts, categories, **values):
+    payload = {
+        "date": "2025-03-05",
+        "amount": 12.34,
+        "type": "dépenses",
+        "category_id": categories[CategoryType.EXPENSE].id,
+        "account_from_id": accounts[0].id,
+        "account_to_id": accounts[1].id,
+        "description": "Courses",
+        "is_processed": False
+    }
+    payload.update(values)
+    response = client.post("/api/v1/transactions/", json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_ledger_matches_after_create(client, accounts, categories, ledger_mismatches):
+    create(client, accounts, categories)
+    create(client, accounts, categories, amount=100, is_processed=True)
+    
+    assert ledger_mismatches() == []
+    balances = client.get("/api/v1/budget/balances/").json()["balances"]
+    assert balances["real"][str(accounts[0].id)] == -100.0
+    assert balances["upcoming"][str(accounts[0].id)] == -112.34
+
+def test_ledger_matches_after_update(client, accounts, categories, ledger_mismatches):
+    transaction = create(client, accounts, categories, is_processed=True)
+    
+    response = client.put(f"/api/v1/transactions/{transaction['id']}", json={
+        "amount": 50.5,
+        "account_from_id": accounts[2].id,
+        "is_processed": False
+    })
+    assert response.status_code == 200, response.text
+    assert ledger_mismatches() == []
+
+def test_ledger_matches_after_toggle(client, accounts, categories, ledger_mismatches):
+    transaction = create(client, accounts, categories)
+    
+    for expected in (True, False, True):
+        response = client.patch(f"/api/v1/transactions/{transaction['id']}/process")
+        assert response.json()["is_processed"] is expected
+        assert ledger_mismatches() == []
+
+def test_ledger_matches_after_delete(client, accounts, categories, ledger_mismatches):
+    kept = create(client, accounts, categories, amount=20, is_processed=True)
+    deleted = create(client, accounts, categories, amount=30, is_processed=True)
+    
+    assert client.delete(f"/api/v1/transactions/{deleted['id']}").status_code == 200
+    assert ledger_mismatches() == []
+    assert client.get("/api/v1/transactions/?limit=10").json()[0]["id"] == kept["id"]
+def create_batch(client, accounts, categories):
+    return [
+        create(client, accounts, categories, date=f"2025-03-{day:02d}", amount=10 + day, is_processed=day % 2 == 0)
+        for day in range(1, 7)
+    ]
+
+def test_ledger_matches_after_batch_process(client, accounts, categories, ledger_mismatches):
+    transactions = create_batch(client, accounts, categories)
+    
+    # Inversion du pointage : chaque ligne change d'état dans un sens ou l'autre
+    response = client.post("/api/v1/transactions/batch/process", json={"ids": [transaction["id"] for transaction in transactions]})
+    assert response.json() == {"affected": 6}
+    assert ledger_mismatches() == []
+    
+    # Sélection par filtre que l'UPDATE vide : les soldes suivent malgré tout
+    response = client.post("/api/v1/transactions/batch/process", json={"filter": {"processed_only": False}, "is_processed": True})
+    assert response.json() == {"affected": 3}
+    assert ledger_mismatches() == []
+    assert all(transaction["is_processed"] for transaction in client.get("/api/v1/transactions/").json())
+
+def test_ledger_matches_after_batch_update(client, accounts, categories, ledger_mismatches):
+    create_batch(client, accounts, categories)
+    
+    response = client.post("/api/v1/transactions/batch/update", json={
+        "filter": {"date_from": "2025-03-02", "date_to": "2025-03-05"},
+        "changes": {"amount": 7.77, "account_from_id": accounts[2].id, "date": "2025-04-01"}
+    })
+    assert response.json() == {"affected": 4}
+    assert ledger_mismatches() == []
+    
+    transactions = client.get("/api/v1/transactions/", params={"date_from": "2025-04-01"}).json()
+    assert {(transaction["amount"], transaction["account_from_id"]) for transaction in transactions} == {(7.77, accounts[2].id)}
+
+def test_batch_update_rejects_same_accounts(client, accounts, categories, ledger_mismatches):
+    transactions = create_batch(client, accounts, categories)
+    
+    response = client.post("/api/v1/transactions/batch/update", json={
+        "ids": [transaction["id"] for transaction in transactions],
+        "changes": {"account_to_id": accounts[0].id}
+    })
+    assert response.status_code == 400
+    assert ledger_mismatches() == []
+    assert {transaction["account_to_id"] for transaction in client.get("/api/v1/transactions/").json()} == {accounts[1].id}
+
+def test_ledger_matches_after_batch_delete(client, accounts, categories, ledger_mismatches):
+    transactions = create_batch(client, accounts, categories)
+    
+    response = client.post("/api/v1/transactions/batch/delete", json={"filter": {"processed_only": True}})
+    assert response.json() == {"affected": 3}
+    assert ledger_mismatches() == []
+    
+    response = client.post("/api/v1/transactions/batch/delete", json={"ids": [transactions[0]["id"], transactions[1]["id"]]})
+    assert response.json() == {"affected": 1}
+    assert ledger_mismatches() == []
+    assert len(client.get("/api/v1/transactions/").json()) == 2
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+Requêtes conditionnelles : 304 tant que les données n'ont pas changé,
+200 avec un nouvel ETag après une écriture
+"""
+import pytest
+from app.models.category import CategoryType
+
+URLS = [
+    "/api/v1/config/",
+    "/api/v1/transactions/",
+    "/api/v1/budget/3/2025",
+    "/api/v1/budget/balances/",
+    "/api/v1/budget/charts/3/2025"
+]
+
+@pytest.mark.parametrize("url", URLS)
+def test_not_modified_until_write(client, accounts, categories, url):
+    first = client.get(url)
+    assert first.status_code == 200, first.text
+    etag = first.headers["ETag"]
+    
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    
+    response = client.post("/api/v1/transactions/", json={
+        "date": "2025-03-05",
+        "amount": 12.34,
+        "type": "dépenses",
+        "category_id": categories[CategoryType.EXPENSE].id,
+        "account_from_id": accounts[0].id,
+        "account_to_id": accounts[1].id,
+        "description": "Courses",
+        "is_processed": True
+    })
+    assert response.status_code == 200, response.text
+    
+    modified = client.get(url, headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] != etag
+    assert client.get(url, headers={"If-None-Match": modified.headers["ETag"]}).status_code == 304
+
+def test_weak_and_wildcard_validators(client, user):
+    etag = client.get("/api/v1/budget/balances/").headers["ETag"]
+    
+    assert client.get("/api/v1/budget/balances/", headers={"If-None-Match": "W/" + etag.removeprefix("W/")}).status_code == 304
+    assert client.get("/api/v1/budget/balances/", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+    assert client.get("/api/v1/budget/balances/", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/api/v1/budget/balances/", headers={"If-None-Match": '"other"'}).status_code == 200
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Propositions de prévisions : la valeur saisonnière d'un mois est celle du
+même mois de l'année précédant l'année demandée, repli sur la moyenne sinon
+"""
+from datetime import date
+
+import pytest
+from app.models import Transaction
+from app.models.category import CategoryType
+from app.models.transaction import TransactionType
+from app.services.forecast_suggestions import ForecastSuggester
+
+TODAY = date(2026, 10, 18)
+
+@pytest.fixture
+def history(db, user, accounts, categories):
+    category = categories[CategoryType.EXPENSE]
+    amounts = {date(2024, 5, 10): 40, date(2025, 5, 10): 70, date(2026, 5, 10): 90}
+    amounts.update({date(2026, month, 3): 30 for month in (7, 8, 9)})
+    db.add_all([
+        Transaction(
+            user_id=user.id,
+            category_id=category.id,
+            account_from_id=accounts[0].id,
+            account_to_id=accounts[1].id,
+            date=day,
+            amount=amount,
+            type=TransactionType.EXPENSE,
+            description="Achat",
+            is_processed=True
+        )
+        for day, amount in amounts.items()
+    ])
+    db.commit()
+    return category
+
+def cells(db, user, category, year):
+    result = ForecastSuggester(db).suggest(user.id, year, window=3, method="seasonal", today=TODAY)
+    return {cell["month_number"]: cell for cell in result["suggestions"] if cell["category_id"] == category.id}
+
+def test_seasonal_reads_previous_year_of_target(db, user, history):
+    assert cells(db, user, history, 2026)[5]["seasonal"] == 70.0
+    assert cells(db, user, history, 2025)[5]["seasonal"] == 40.0
+    assert cells(db, user, history, 2027)[5]["seasonal"] == 90.0
+
+def test_seasonal_falls_back_to_mean(db, user, history):
+    # Moyenne des 3 dernières périodes actives : juillet à septembre 2026
+    next_year = cells(db, user, history, 2027)
+    assert next_year[5]["mean"] == 30.0
+    
+    # Mois de l'année précédente sans transaction, ou pas encore écoulé
+    assert next_year[3]["seasonal"] is None
+    assert next_year[3]["suggested"] == 30.0
+    assert next_year[11]["seasonal"] is None
+    assert next_year[11]["suggested"] == 30.0
+    assert next_year[9]["suggested"] == 30.0
+    assert next_year[5]["suggested"] == 90.0
+
+def test_seasonal_history_periods(db, user, history):
+    result = ForecastSuggester(db).suggest(user.id, 2027, today=TODAY)
+    
+    assert result["seasonal_history"] == [{"month": month, "year": 2026} for month in range(1, 10)]
+    assert result["history"][0] == {"month": 10, "year": 2025}
+    assert result["history"][-1] == {"month": 9, "year": 2026}
\ No newline at end of file
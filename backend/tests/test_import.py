@@ -0,0 +1,62 @@
+"""
+Import CSV : lignes invalides signalées avec leur numéro, fichiers
+Windows-1252 acceptés, soldes tenus à jour par le registre
+"""
+HEADER = "Date;Montant;Type;Catégorie;De;Vers;Libellé;Pointé\n"
+
+def upload(client, content: bytes, filename: str = "transactions.csv"):
+    return client.post("/api/v1/transactions/import", files={"file": (filename, content, "text/csv")})
+
+def test_import_reports_line_errors(client, accounts, ledger_mismatches):
+    content = HEADER + "".join([
+        "05/03/2025;12,34;dépenses;Dépenses;Compte 0;Compte 1;Courses;vrai\n",
+        "06/03/2025;10;dépenses;Dépenses;Compte inconnu;Compte 1;Compte absent;faux\n",
+        "07/03/2025;1,005;dépenses;Dépenses;Compte 0;Compte 1;Fraction de centime;faux\n",
+        "08/03/2025;20;revenus;Revenus;Compte 2;Compte 0;Salaire;faux\n"
+    ])
+    response = upload(client, content.encode())
+    
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["imported"] == 2
+    assert report["error_count"] == 2
+    assert [error["line"] for error in report["errors"]] == [3, 4]
+    assert "Unknown account" in report["errors"][0]["error"]
+    assert "at most 2 decimal places" in report["errors"][1]["error"]
+    assert ledger_mismatches() == []
+    
+    balances = client.get("/api/v1/budget/balances/").json()["balances"]
+    assert balances["real"][str(accounts[0].id)] == -12.34
+    assert balances["upcoming"][str(accounts[0].id)] == 7.66
+
+def test_import_windows_1252_csv(client, user, ledger_mismatches):
+    content = HEADER + "05/03/2025;7,5;dépenses;Dépenses;Compte 0;Compte 1;Café crème;faux\n"
+    response = upload(client, content.encode("cp1252"))
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == 1
+    assert client.get("/api/v1/transactions/").json()[0]["description"] == "Café crème"
+    assert ledger_mismatches() == []
+
+def test_import_rejects_undecodable_csv(client, user):
+    # 0x81 n'a pas de caractère en Windows-1252 : ni UTF-8, ni l'encodage de repli
+    response = upload(client, HEADER.encode() + b"05/03/2025;1;d\x81penses;;Compte 0;Compte 1;x;faux\n")
+    
+    assert response.status_code == 400
+    assert "Unreadable CSV" in response.json()["detail"]
+
+def test_import_rejects_missing_columns(client, user):
+    response = upload(client, b"Date;Montant\n05/03/2025;1\n")
+    
+    assert response.status_code == 400
+    assert "Missing columns" in response.json()["detail"]
+
+def test_import_ledger_over_many_rows(client, user, ledger_mismatches):
+    lines = [
+        f"{1 + index % 28:02d}/03/2025;{index % 97 + 0.1:.2f};dépenses;Dépenses;Compte {index % 3};Compte {(index + 1) % 3};Ligne {index};{'vrai' if index % 2 else 'faux'}\n"
+        for index in range(2500)
+    ]
+    response = upload(client, (HEADER + "".join(lines)).encode())
+    
+    assert response.json()["imported"] == 2500
+    assert ledger_mismatches() == []
\ No newline at end of file
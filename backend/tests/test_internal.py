@@ -0,0 +1,21 @@
+"""
+Métriques internes : désactivées sans METRICS_TOKEN, jeton exigé sinon
+"""
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.main import app
+
+def test_metrics_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+    
+    assert TestClient(app).get("/internal/metrics").status_code == 404
+
+def test_metrics_require_configured_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "secret")
+    client = TestClient(app)
+    
+    assert client.get("/internal/metrics").status_code == 403
+    assert client.get("/internal/metrics", headers={"X-Metrics-Token": "wrong"}).status_code == 403
+    response = client.get("/internal/metrics", headers={"X-Metrics-Token": "secret"})
+    assert response.status_code == 200
+    assert "database_pool" in response.json()
\ No newline at end of file
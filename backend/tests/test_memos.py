@@ -0,0 +1,42 @@
+"""
+Pense-bêtes dans le budget : comptés même sans aucune catégorie
+"""
+from datetime import date
+
+import pytest
+from app.models import Category
+
+TODAY = date.today()
+
+@pytest.fixture
+def memo_only(db, user, client):
+    # Utilisateur sans catégorie : la requête budgétaire ne renvoie aucune ligne
+    db.query(Category).filter(Category.user_id == user.id).delete()
+    db.commit()
+    for amount, is_paid in ((30, False), (20.5, False), (99, True)):
+        response = client.post("/api/v1/memos/", json={
+            "month_number": TODAY.month,
+            "description": "Cadeau",
+            "amount": amount,
+            "is_paid": is_paid
+        })
+        assert response.status_code == 200, response.text
+
+def test_period_counts_memos_without_categories(client, memo_only):
+    summary = client.get(f"/api/v1/budget/{TODAY.month}/{TODAY.year}").json()["summary"]
+    
+    assert summary["memo"] == {"unpaid": 50.5, "count": 2}
+
+def test_range_counts_memos_without_categories(client, memo_only):
+    period = f"{TODAY.year}-{TODAY.month:02d}"
+    periods = client.get(f"/api/v1/budget/range?from={period}&to={period}").json()["periods"]
+    
+    assert periods[0]["budget_data"]["categories"] == {}
+    assert periods[0]["summary"]["memo"] == {"unpaid": 50.5, "count": 2}
+
+def test_projection_spends_memos_without_categories(client, accounts, memo_only):
+    projection = client.get("/api/v1/budget/projection?months=1").json()
+    
+    main_account = projection["accounts"][str(accounts[0].id)]
+    assert main_account[0] < 0
+    assert min(main_account) == pytest.approx(-50.5, abs=0.01)
\ No newline at end of file
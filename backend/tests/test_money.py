@@ -0,0 +1,90 @@
+"""
+Montants en centimes entiers : conversion à l'écriture, validation des
+saisies et exactitude des agrégations
+"""
+import random
+from datetime import date, timedelta
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import insert
+
+from app.core.money import Money, to_cents
+from app.models import Account, Category, Transaction, User
+from app.models.category import CategoryType
+from app.models.transaction import TransactionType
+from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.services.balance_calculator import BalanceCalculator
+
+# Nombre de transactions aléatoires de la propriété de somme exacte :
+# 10 000 à chaque passage, 1 000 000 avec --run-slow (environ une minute)
+PROPERTY_SIZES = [10_000, pytest.param(1_000_000, marks=pytest.mark.slow)]
+
+@pytest.mark.parametrize("amount, cents", [
+    (1.005, 101),
+    (0.285, 29),
+    (2.675, 268),
+    (-2.675, -268),
+    (0.1, 10),
+    (12, 1200),
+    (1234567.89, 123456789)
+])
+def test_bind_rounds_half_up_on_decimal_value(amount, cents):
+    assert to_cents(amount) == cents
+    assert Money().process_bind_param(amount, None) == cents
+
+def test_result_value_is_euros():
+    assert Money().process_result_value(123456789, None) == 1234567.89
+    assert Money().process_result_value(None, None) is None
+
+@pytest.mark.parametrize("amount", [12.345, 0.001, 100.1 * 3])
+def test_schemas_reject_sub_cent_amounts(amount):
+    with pytest.raises(ValidationError):
+        TransactionCreate(date=date(2024, 1, 1), amount=amount, type=TransactionType.EXPENSE, account_from_id=1, account_to_id=2, description="x")
+    with pytest.raises(ValidationError):
+        TransactionUpdate(amount=amount)
+
+def test_schemas_accept_whole_cents():
+    assert TransactionCreate(date=date(2024, 1, 1), amount=12.34, type=TransactionType.EXPENSE, account_from_id=1, account_to_id=2, description="x").amount == 12.34
+    assert TransactionUpdate(amount=10).amount == 10
+    assert TransactionUpdate(amount=None).amount is None
+
+@pytest.mark.parametrize("size", PROPERTY_SIZES)
+def test_sum_of_random_transactions_is_exact(db, size):
+    rng = random.Random(2024)
+    user = User(github_id="money", username="money", email="money@example.com")
+    db.add(user)
+    db.flush()
+    accounts = [Account(user_id=user.id, name=f"Compte {index}", initial_balance=1000.1) for index in range(2)]
+    category = Category(user_id=user.id, name="Dépenses", type=CategoryType.EXPENSE)
+    db.add_all(accounts + [category])
+    db.flush()
+    
+    cents = [rng.randint(1, 500000) for _ in range(size)]
+    processed = [rng.random() < 0.7 for _ in range(size)]
+    for offset in range(0, size, 50000):
+        db.execute(insert(Transaction.__table__), [
+            {
+                "user_id": user.id,
+                "is_processed": processed[index],
+                "date": date(2020, 1, 1) + timedelta(days=index % 2000),
+                "amount": cents[index] / 100,
+                "type": TransactionType.EXPENSE,
+                "category_id": category.id,
+                "account_from_id": accounts[0].id,
+                "account_to_id": accounts[1].id,
+                "description": "x"
+            }
+            for index in range(offset, min(offset + 50000, size))
+        ])
+    db.commit()
+    
+    total = sum(cents)
+    total_real = sum(amount for amount, is_processed in zip(cents, processed) if is_processed)
+    balances = BalanceCalculator(db).calculate_all_balances(user.id, use_ledger=False)
+    
+    assert balances["upcoming"][accounts[0].id] == (100010 - total) / 100
+    assert balances["upcoming"][accounts[1].id] == (100010 + total) / 100
+    assert balances["real"][accounts[0].id] == (100010 - total_real) / 100
+    assert balances["real"][accounts[1].id] == (100010 + total_real) / 100
+    assert balances["pending"][accounts[1].id] == (total - total_real) / 100
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Pagination par curseur : pages stables, sans doublon ni trou, même lorsque
+de nombreuses transactions partagent la même date
+"""
+from datetime import date
+
+import pytest
+from app.models import Transaction
+from app.models.category import CategoryType
+from app.models.transaction import TransactionType
+
+DATES = [date(2025, 3, 1), date(2025, 3, 2), date(2025, 3, 3)]
+
+@pytest.fixture
+def transactions(db, user, accounts, categories):
+    # 50 transactions par date : chaque page coupe au milieu d'une même date
+    rows = [
+        Transaction(
+            user_id=user.id,
+            category_id=categories[CategoryType.EXPENSE].id,
+            account_from_id=accounts[0].id,
+            account_to_id=accounts[1].id,
+            date=DATES[index % len(DATES)],
+            amount=1.0 + index,
+            type=TransactionType.EXPENSE,
+            description=f"Transaction {index}",
+            is_processed=False
+        )
+        for index in range(150)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return sorted(rows, key=lambda row: (row.date, row.id), reverse=True)
+
+def read_pages(client, url, limit):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit} if cursor is None else {"limit": limit, "cursor": cursor}
+        response = client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page) <= limit
+        ids.extend(row["id"] for row in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return ids
+
+@pytest.mark.parametrize("limit", [1, 7, 50, 149, 150, 1000])
+def test_cursor_pages_cover_every_row_once(client, transactions, limit):
+    ids = read_pages(client, "/api/v1/transactions/", limit)
+    
+    assert ids == [row.id for row in transactions]
+
+def test_cursor_pages_with_filter(client, transactions):
+    ids = read_pages(client, f"/api/v1/transactions/?date_from={DATES[1]}&date_to={DATES[1]}", 9)
+    
+    assert ids == [row.id for row in transactions if row.date == DATES[1]]
+
+def test_cursor_is_stable_across_inserts(client, accounts, categories, transactions):
+    first = client.get("/api/v1/transactions/", params={"limit": 40})
+    cursor = first.headers["X-Next-Cursor"]
+    
+    # Transaction ajoutée entre deux pages, à une date déjà parcourue : pas de décalage
+    response = client.post("/api/v1/transactions/", json={
+        "date": DATES[-1].isoformat(),
+        "amount": 5,
+        "type": "dépenses",
+        "category_id": categories[CategoryType.EXPENSE].id,
+        "account_from_id": accounts[0].id,
+        "account_to_id": accounts[1].id,
+        "description": "Ajout",
+        "is_processed": False
+    })
+    assert response.status_code == 200, response.text
+    
+    second = client.get("/api/v1/transactions/", params={"limit": 40, "cursor": cursor})
+    ids = [row["id"] for row in first.json() + second.json()]
+    assert ids == [row.id for row in transactions[:80]]
+
+def test_invalid_cursor(client, transactions):
+    assert client.get("/api/v1/transactions/", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/v1/transactions/", params={"cursor": "abc", "skip": 5}).status_code == 400
\ No newline at end of file
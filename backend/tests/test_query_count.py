@@ -0,0 +1,54 @@
+"""
+Nombre de requêtes SQL des vues budget (en-tête X-Query-Count) : constant,
+quel que soit le nombre de catégories, de prévisions et de transactions
+"""
+from datetime import date
+
+import pytest
+from app.models import BudgetForecast, Category, SavingsGoal, Transaction
+from app.models.category import CategoryType
+from app.models.transaction import TransactionType
+
+@pytest.fixture
+def budget_data(db, user, accounts):
+    categories = [
+        Category(user_id=user.id, name=f"{category_type.value} {index}", type=category_type, sort_order=10 + index)
+        for index in range(5) for category_type in CategoryType
+    ]
+    db.add_all(categories)
+    db.flush()
+    for index, category in enumerate(categories):
+        db.add(BudgetForecast(user_id=user.id, category_id=category.id, year=2025, month_number=3, forecasted_amount=10.0 * index))
+        for day in range(1, 4):
+            db.add(Transaction(
+                user_id=user.id,
+                category_id=category.id,
+                account_from_id=accounts[0].id,
+                account_to_id=accounts[1].id,
+                date=date(2025, 3, day),
+                amount=1.5 * day,
+                type=TransactionType(category.type.value),
+                description=f"Transaction {day}",
+                is_processed=day % 2 == 0
+            ))
+        if category.type == CategoryType.SAVINGS:
+            db.add(SavingsGoal(user_id=user.id, category_id=category.id, target_amount=1000.0))
+    db.commit()
+
+def query_count(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return int(response.headers["X-Query-Count"])
+
+def test_charts_query_count(client, budget_data):
+    # Utilisateur, budget de la période, soldes, épargne ; puis utilisateur seul (cache)
+    assert query_count(client, "/api/v1/budget/charts/3/2025") <= 4
+    assert query_count(client, "/api/v1/budget/charts/3/2025") <= 1
+
+def test_budget_period_query_count(client, budget_data):
+    assert query_count(client, "/api/v1/budget/3/2025") <= 2
+    assert query_count(client, "/api/v1/budget/3/2025") <= 1
+
+def test_balances_query_count(client, budget_data):
+    assert query_count(client, "/api/v1/budget/balances/") <= 2
+    assert query_count(client, "/api/v1/budget/balances/") <= 1
\ No newline at end of file
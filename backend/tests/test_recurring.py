@@ -0,0 +1,51 @@
+"""
+Mise à jour des règles récurrentes : seuls les champs envoyés changent,
+un null explicite efface les champs facultatifs
+"""
+from app.models.category import CategoryType
+
+def create_rule(client, accounts, categories, **values):
+    payload = {
+        "description": "Loyer",
+        "amount": 750,
+        "type": "factures",
+        "category_id": categories[CategoryType.BILL].id,
+        "account_from_id": accounts[0].id,
+        "account_to_id": accounts[1].id,
+        "frequency": "mensuelle",
+        "day": 5,
+        "start_date": "2025-01-01",
+        "end_date": "2025-06-30"
+    }
+    payload.update(values)
+    response = client.post("/api/v1/recurring/", json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_update_clears_end_date(client, accounts, categories):
+    rule = create_rule(client, accounts, categories)
+    
+    response = client.put(f"/api/v1/recurring/{rule['id']}", json={"end_date": None})
+    assert response.status_code == 200, response.text
+    assert response.json()["end_date"] is None
+    assert response.json()["category_id"] == categories[CategoryType.BILL].id
+    assert client.get("/api/v1/recurring/").json()[0]["end_date"] is None
+
+def test_update_keeps_fields_not_sent(client, accounts, categories):
+    rule = create_rule(client, accounts, categories)
+    
+    response = client.put(f"/api/v1/recurring/{rule['id']}", json={"amount": 800, "category_id": None})
+    assert response.status_code == 200, response.text
+    updated = response.json()
+    assert updated["amount"] == 800
+    assert updated["category_id"] is None
+    assert updated["end_date"] == "2025-06-30"
+    assert updated["description"] == "Loyer"
+
+def test_update_rejects_null_required_fields(client, accounts, categories):
+    rule = create_rule(client, accounts, categories)
+    
+    response = client.put(f"/api/v1/recurring/{rule['id']}", json={"amount": None, "description": None})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Fields cannot be null: amount, description"
+    assert client.get("/api/v1/recurring/").json()[0]["amount"] == 750
\ No newline at end of file
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { User, Config, Transaction, BudgetData, BudgetSummary, Balances, Treasury } from '../types';
+import { User, Config, Transaction, RecurringTransaction, MemoItem, SavingsGoal, SavingsGoalProgress, CreditDetail, DebtOverview, BudgetForecast, ForecastSuggestion, ForecastGrid, BudgetData, BudgetSummary, Balances, Treasury } from '../types';
 
 const API_BASE_URL = 'http://localhost:8000/api/v1';
 
@@ -53,6 +53,19 @@ export const configApi = {
     api.post('/config/savings-allocations', data),
 };
 
+// Sélection d'un traitement par lot : liste d'ids ou filtres de getTransactions
+export type TransactionSelection = {
+  ids?: number[];
+  filter?: {
+    date_from?: string;
+    date_to?: string;
+    account_id?: number;
+    category_id?: number;
+    transaction_type?: string;
+    processed_only?: boolean;
+  };
+};
+
 export const transactionsApi = {
   getTransactions: (params?: {
     skip?: number;
@@ -63,6 +76,7 @@ export const transactionsApi = {
     category_id?: number;
     transaction_type?: string;
     processed_only?: boolean;
+    cursor?: string;
   }) => api.get<Transaction[]>('/transactions/', { params }),
   
   createTransaction: (data: {
@@ -90,12 +104,156 @@ export const transactionsApi = {
   deleteTransaction: (id: number) => api.delete(`/transactions/${id}`),
   
   toggleProcessing: (id: number) => api.patch(`/transactions/${id}/process`),
+  
+  batchProcess: (selection: TransactionSelection, is_processed?: boolean) =>
+    api.post<{ affected: number }>('/transactions/batch/process', { ...selection, is_processed }),
+  
+  batchUpdate: (selection: TransactionSelection, changes: {
+    is_processed?: boolean;
+    date?: string;
+    amount?: number;
+    type?: string;
+    category_id?: number;
+    account_from_id?: number;
+    account_to_id?: number;
+    description?: string;
+  }) => api.post<{ affected: number }>('/transactions/batch/update', { ...selection, changes }),
+  
+  batchDelete: (selection: TransactionSelection) =>
+    api.post<{ affected: number }>('/transactions/batch/delete', selection),
+  
+  exportTransactions: (format: 'csv' | 'ndjson', filter?: TransactionSelection['filter']) =>
+    api.get<Blob>('/transactions/export', { params: { ...filter, format }, responseType: 'blob' }),
+  
+  importTransactions: (file: File) => {
+    const formData = new FormData();
+    formData.append('file', file);
+    return api.post<{ imported: number; error_count: number; errors: { line: number; error: string }[] }>(
+      '/transactions/import',
+      formData
+    );
+  },
+};
+
+type RecurringTransactionInput = Omit<RecurringTransaction, 'id' | 'generated_until'>;
+
+export const recurringApi = {
+  getRecurringTransactions: () => api.get<RecurringTransaction[]>('/recurring/'),
+  
+  createRecurringTransaction: (data: RecurringTransactionInput) =>
+    api.post<RecurringTransaction>('/recurring/', data),
+  
+  updateRecurringTransaction: (id: number, data: Partial<Omit<RecurringTransactionInput, 'start_date'>>) =>
+    api.put<RecurringTransaction>(`/recurring/${id}`, data),
+  
+  deleteRecurringTransaction: (id: number, deleteUpcoming: boolean = false) =>
+    api.delete(`/recurring/${id}`, { params: { delete_upcoming: deleteUpcoming } }),
+};
+
+export const savingsApi = {
+  getSavingsProgress: () =>
+    api.get<{
+      goals: SavingsGoalProgress[];
+      summary: { target_amount: number; allocated: number; saved: number; remaining: number; progress_percent: number };
+    }>('/savings/'),
+  
+  createSavingsGoal: (data: { category_id: number; target_amount: number }) =>
+    api.post<SavingsGoal>('/savings/goals', data),
+  
+  updateSavingsGoal: (id: number, data: { target_amount?: number }) =>
+    api.put<SavingsGoal>(`/savings/goals/${id}`, data),
+  
+  deleteSavingsGoal: (id: number) => api.delete(`/savings/goals/${id}`),
+};
+
+export const creditsApi = {
+  getDebtOverview: (includeSchedules: boolean = false) =>
+    api.get<DebtOverview>('/credits/', { params: { include_schedules: includeSchedules } }),
+  
+  createCredit: (data: {
+    category_id: number;
+    borrowed_amount: number;
+    interest_rate: number;
+    duration_months: number;
+    monthly_payment?: number;
+    interest_amount?: number;
+    already_repaid?: number;
+  }) => api.post<CreditDetail>('/credits/', data),
+  
+  updateCredit: (id: number, data: Partial<Omit<CreditDetail, 'id' | 'category_id'>>) =>
+    api.put<CreditDetail>(`/credits/${id}`, data),
+  
+  deleteCredit: (id: number) => api.delete(`/credits/${id}`),
+};
+
+export const memosApi = {
+  getMemoItems: (month?: number) => api.get<MemoItem[]>('/memos/', { params: { month } }),
+  
+  createMemoItem: (data: Omit<MemoItem, 'id' | 'is_paid'> & { is_paid?: boolean }) =>
+    api.post<MemoItem>('/memos/', data),
+  
+  updateMemoItem: (id: number, data: Partial<Omit<MemoItem, 'id'>>) =>
+    api.put<MemoItem>(`/memos/${id}`, data),
+  
+  deleteMemoItem: (id: number) => api.delete(`/memos/${id}`),
+  
+  // is_paid omis : inversion de l'état de chaque pense-bête
+  setMemoItemsPaid: (ids: number[], isPaid?: boolean) =>
+    api.post<{ affected: number }>('/memos/batch/paid', { ids, is_paid: isPaid }),
+};
+
+export const forecastsApi = {
+  getForecasts: (year?: number) => api.get<BudgetForecast[]>('/forecasts/', { params: { year } }),
+  
+  getSuggestions: (year: number, window: number = 3, method: 'mean' | 'median' | 'seasonal' = 'mean') =>
+    api.get<{
+      year: number;
+      method: string;
+      window: number;
+      history: { month: number; year: number }[];
+      seasonal_history: { month: number; year: number }[];
+      suggestions: ForecastSuggestion[];
+    }>('/forecasts/suggestions', { params: { year, window, method } }),
+  
+  bulkUpsert: (forecasts: Omit<BudgetForecast, 'id'>[]) =>
+    api.put<{ written: number }>('/forecasts/bulk', { forecasts }),
+  
+  getGrid: (year: number) => api.get<ForecastGrid>(`/forecasts/grid/${year}`),
+  
+  updateGrid: (year: number, categories: { category_id: number; amounts: (number | null)[] }[]) =>
+    api.put<ForecastGrid>(`/forecasts/grid/${year}`, { categories }),
+  
+  deleteGrid: (year: number, categoryId?: number) =>
+    api.delete<{ deleted: number }>(`/forecasts/grid/${year}`, { params: { category_id: categoryId } }),
 };
 
 export const budgetApi = {
   getBudgetPeriod: (month: number, year: number) => 
     api.get<{ budget_data: BudgetData; summary: BudgetSummary }>(`/budget/${month}/${year}`),
   
+  getBudgetRange: (from: string, to: string) =>
+    api.get<{ periods: { budget_data: BudgetData; summary: BudgetSummary }[] }>('/budget/range', { params: { from, to } }),
+  
+  getProjection: (months: number = 6) =>
+    api.get<{
+      start_date: string;
+      end_date: string;
+      dates: string[];
+      main_account_id: number | null;
+      accounts: Record<number, number[]>;
+      total: number[];
+    }>('/budget/projection', { params: { months } }),
+  
+  getBalanceHistory: (from: string, to: string) =>
+    api.get<{
+      dates: string[];
+      accounts: Record<number, { real: number[]; upcoming: number[] }>;
+      total: { real: number[]; upcoming: number[] };
+    }>('/budget/history', { params: { from, to } }),
+  
+  exportBudget: (from: string, to: string, format: 'csv' | 'ndjson') =>
+    api.get<Blob>('/budget/export', { params: { from, to, format }, responseType: 'blob' }),
+  
   getBalances: () => 
     api.get<{ balances: Balances; treasury: Treasury }>('/budget/balances/'),
   
@@ -23,6 +23,7 @@ export interface Account {
   name: string;
   initial_balance: number;
   current_balance: number;
+  upcoming_balance: number;
   is_savings_account: boolean;
   is_main_account: boolean;
 }
@@ -39,13 +40,57 @@ export interface Transaction {
   description: string;
 }
 
+export type RecurrenceFrequency = 'mensuelle' | 'hebdomadaire' | 'période';
+
+export interface RecurringTransaction {
+  id: number;
+  description: string;
+  amount: number;
+  type: TransactionType;
+  category_id?: number;
+  account_from_id: number;
+  account_to_id: number;
+  frequency: RecurrenceFrequency;
+  repeat_every: number;
+  day: number;
+  start_date: string;
+  end_date?: string;
+  is_active: boolean;
+  generated_until?: string;
+}
+
 export interface BudgetForecast {
   id: number;
+  year: number;
   month_number: number;
   category_id: number;
   forecasted_amount: number;
 }
 
+export interface ForecastSuggestion {
+  year: number;
+  month_number: number;
+  category_id: number;
+  category_name: string;
+  category_type: CategoryType;
+  mean: number;
+  median: number;
+  seasonal?: number;
+  suggested: number;
+  current?: number;
+}
+
+export interface ForecastGrid {
+  year: number;
+  months: number[];
+  categories: {
+    category_id: number;
+    category_name: string;
+    category_type: CategoryType;
+    amounts: number[];
+  }[];
+}
+
 export interface MemoItem {
   id: number;
   month_number: number;
@@ -67,6 +112,20 @@ export interface SavingsGoal {
   target_amount: number;
 }
 
+export interface SavingsGoalProgress {
+  goal_id: number;
+  category_id: number;
+  category_name: string;
+  target_amount: number;
+  allocated: number;
+  saved: number;
+  pending: number;
+  remaining: number;
+  progress_percent: number;
+  monthly_rate: number;
+  estimated_completion?: string;
+}
+
 export interface CreditDetail {
   id: number;
   category_id: number;
@@ -78,6 +137,39 @@ export interface CreditDetail {
   already_repaid: number;
 }
 
+export interface CreditPayment {
+  number: number;
+  date: string;
+  payment: number;
+  interest: number;
+  principal: number;
+  balance: number;
+}
+
+export interface CreditStatus extends CreditDetail {
+  category_name: string;
+  schedule_interest: number;
+  transactions_repaid: number;
+  repaid_difference: number;
+  payments_made: number;
+  remaining_payments: number;
+  outstanding_principal: number;
+  remaining_to_pay: number;
+  remaining_interest: number;
+  next_payment_date?: string;
+  payoff_date?: string;
+  schedule?: CreditPayment[];
+}
+
+export interface DebtOverview {
+  credits: CreditStatus[];
+  total_borrowed: number;
+  total_outstanding: number;
+  total_remaining_to_pay: number;
+  monthly_burden: number;
+  payoff_date?: string;
+}
+
 export interface Config {
   budget_start_date?: string;
   starts_before_month: boolean;
@@ -101,6 +193,7 @@ export interface BudgetData {
     variance: number;
     variance_percent: number;
   }>;
+  memo: { unpaid: number; count: number };
 }
 
 export interface BudgetSummary {
@@ -108,6 +201,7 @@ export interface BudgetSummary {
   factures: { forecasted: number; real: number; variance: number };
   dépenses: { forecasted: number; real: number; variance: number };
   épargnes: { forecasted: number; real: number; variance: number };
+  memo: { unpaid: number; count: number };
 }
 
 export interface Balances {